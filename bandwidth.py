@@ -0,0 +1,222 @@
+"""Global bandwidth budget shared across concurrent downloads"""
+
+import re
+import threading
+import time
+from datetime import datetime
+
+RATE_MULTIPLIERS = {
+    "": 1,
+    "B": 1,
+    "K": 1024,
+    "M": 1024 * 1024,
+    "G": 1024 * 1024 * 1024
+}
+
+# Tasks never drop below this share so low-priority jobs keep their connections alive
+MIN_SHARE = 16 * 1024
+
+# Headroom granted on top of the observed speed when estimating demand
+DEMAND_HEADROOM = 1.25
+
+# Longest single pause used to hold a task back to its share
+MAX_THROTTLE_DELAY = 5.0
+
+
+def parse_rate(value) -> float:
+    """Parse a rate such as '5M', '750K', '1.5MiB/s' or 1048576 into bytes per second.
+
+    Returns 0 for empty, zero or invalid values, meaning unlimited.
+    """
+    if value is None:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return max(0.0, float(value))
+    match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*([KMG]?)(?:i?B)?(?:/s)?\s*$", str(value), re.IGNORECASE)
+    if not match:
+        return 0.0
+    return float(match.group(1)) * RATE_MULTIPLIERS[match.group(2).upper()]
+
+
+def format_rate(value: float) -> str:
+    """Format bytes per second as a yt-dlp --limit-rate argument"""
+    return str(max(1, int(value)))
+
+
+def _parse_clock(text: str) -> int:
+    """Parse 'HH:MM' into minutes after midnight"""
+    hours, minutes = str(text).strip().split(":", 1)
+    return (int(hours) % 24) * 60 + int(minutes) % 60
+
+
+class BandwidthBudget:
+    """Divides a global rate limit across active downloads.
+
+    Tasks register with a weight and a priority. Higher priority tiers are
+    served first, tasks inside a tier share what is left in proportion to
+    their weight, and any share a task is not using (or that a finished task
+    released) is redistributed to the others.
+    """
+
+    def __init__(self, limit=0, schedule=None, min_share: float = MIN_SHARE):
+        self._lock = threading.Lock()
+        self._limit = parse_rate(limit)
+        self._schedule = []
+        self._tasks = {}
+        self._shares = {}
+        self._last_limit = None
+        self.min_share = min_share
+        self.set_schedule(schedule or [])
+
+    def configure(self, limit=None, schedule=None):
+        """Change the budget live; running tasks pick up new shares on their next report"""
+        if limit is not None:
+            with self._lock:
+                self._limit = parse_rate(limit)
+        if schedule is not None:
+            self.set_schedule(schedule)
+        self._reallocate()
+
+    def set_schedule(self, schedule):
+        """Set time-of-day overrides.
+
+        Each entry is {"start": "22:00", "end": "06:00", "limit": "50M"}; windows
+        may wrap past midnight and the first matching entry wins.
+        """
+        parsed = []
+        for entry in schedule or []:
+            try:
+                parsed.append((
+                    _parse_clock(entry["start"]),
+                    _parse_clock(entry["end"]),
+                    parse_rate(entry.get("limit", 0))
+                ))
+            except Exception:
+                continue
+        with self._lock:
+            self._schedule = parsed
+
+    def current_limit(self, now: datetime = None) -> float:
+        """Get the limit in effect at the given time (0 = unlimited)"""
+        now = now or datetime.now()
+        minute = now.hour * 60 + now.minute
+        with self._lock:
+            for start, end, limit in self._schedule:
+                if start <= end:
+                    active = start <= minute < end
+                else:
+                    active = minute >= start or minute < end
+                if active:
+                    return limit
+            return self._limit
+
+    def register(self, key, weight: float = 1.0, priority: int = 0):
+        """Add an active task to the budget"""
+        with self._lock:
+            self._tasks[key] = {
+                "weight": max(0.01, float(weight or 1.0)),
+                "priority": int(priority or 0),
+                "speed": 0.0,
+                "last_report": time.monotonic()
+            }
+        self._reallocate()
+
+    def unregister(self, key):
+        """Remove a finished task and hand its share back to the others"""
+        with self._lock:
+            self._tasks.pop(key, None)
+            self._shares.pop(key, None)
+        self._reallocate()
+
+    def report_speed(self, key, speed: float) -> float:
+        """Record the observed speed of a task and return the seconds since its last report"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._tasks.get(key)
+            if not entry:
+                return 0.0
+            interval = now - entry["last_report"]
+            entry["last_report"] = now
+            entry["speed"] = max(0.0, float(speed))
+        self._reallocate()
+        return interval
+
+    def share_for(self, key) -> float:
+        """Get the current share of a task in bytes per second (0 = unlimited)"""
+        limit = self.current_limit()
+        with self._lock:
+            stale = self._last_limit != limit
+        if stale:
+            self._reallocate()
+        with self._lock:
+            return self._shares.get(key, 0.0)
+
+    def allocations(self) -> dict:
+        """Get a snapshot of all current shares"""
+        with self._lock:
+            return dict(self._shares)
+
+    def throttle_delay(self, key, speed: float) -> float:
+        """Report a speed sample and return how long the task should pause to stay within its share"""
+        interval = self.report_speed(key, speed)
+        share = self.share_for(key)
+        if share <= 0 or speed <= share * 1.05 or interval <= 0:
+            return 0.0
+        # Running at `speed` for `interval` then idling brings the average down to `share`
+        return min(MAX_THROTTLE_DELAY, interval * (speed / share - 1.0))
+
+    def _reallocate(self):
+        limit = self.current_limit()
+        with self._lock:
+            self._last_limit = limit
+            self._shares = self._allocate(limit)
+
+    def _allocate(self, limit: float) -> dict:
+        """Weighted max-min fair share, tier by tier in priority order"""
+        if limit <= 0 or not self._tasks:
+            return {key: 0.0 for key in self._tasks}
+
+        floor = min(self.min_share, limit / len(self._tasks))
+        shares = {key: floor for key in self._tasks}
+        remaining = limit - floor * len(self._tasks)
+
+        for priority in sorted({t["priority"] for t in self._tasks.values()}, reverse=True):
+            tier = {
+                key: entry for key, entry in self._tasks.items()
+                if entry["priority"] == priority
+            }
+            # Tasks without a speed sample yet have unbounded demand
+            demand = {
+                key: (entry["speed"] * DEMAND_HEADROOM - floor) if entry["speed"] > 0 else float("inf")
+                for key, entry in tier.items()
+            }
+            unsatisfied = dict(tier)
+            while unsatisfied and remaining > 1e-6:
+                total_weight = sum(entry["weight"] for entry in unsatisfied.values())
+                per_weight = remaining / total_weight
+                capped = [
+                    key for key, entry in unsatisfied.items()
+                    if demand[key] <= entry["weight"] * per_weight
+                ]
+                if not capped:
+                    for key, entry in unsatisfied.items():
+                        shares[key] += entry["weight"] * per_weight
+                    remaining = 0.0
+                    break
+                for key in capped:
+                    grant = max(0.0, demand[key])
+                    shares[key] += grant
+                    remaining -= grant
+                    unsatisfied.pop(key)
+
+        # Share left over after every demand is met is spread in proportion to
+        # weighted usage, so busy tasks get the headroom idle ones gave up
+        if remaining > 1e-6:
+            usage = {
+                key: entry["weight"] * (entry["speed"] or self.min_share)
+                for key, entry in self._tasks.items()
+            }
+            total_usage = sum(usage.values())
+            for key in self._tasks:
+                shares[key] += remaining * usage[key] / total_usage
+        return shares
@@ -0,0 +1,813 @@
+#!/usr/bin/env python3
+"""Ad-hoc performance benchmarks: python benchmarks.py <name> [options]"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent
+
+
+def _time_import(module: str) -> float:
+    """Time a fresh interpreter importing a module; raises if the import fails"""
+    started = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", f"import {module}"],
+        cwd=str(ROOT), check=True, capture_output=True
+    )
+    return time.perf_counter() - started
+
+
+def bench_cold_start(runs: int = 5) -> dict:
+    """Compare interpreter cold start of the CLI against the GUI entry points"""
+    results = {}
+    for label, module in [
+        ("baseline (python -c pass)", "sys"),
+        ("CLI (downloader_cli)", "downloader_cli"),
+        ("Qt GUI (downloader_qt)", "downloader_qt"),
+        ("Tk GUI (downloader)", "downloader"),
+    ]:
+        try:
+            samples = [_time_import(module) for _ in range(runs)]
+        except subprocess.CalledProcessError as e:
+            reason = (e.stderr or b"").decode(errors="replace").strip().splitlines()
+            results[label] = reason[-1] if reason else "import failed"
+            continue
+        results[label] = samples
+    return results
+
+
+def bench_api_polls(jobs: int = 500, clients: int = 8, seconds: float = 3.0) -> dict:
+    """Measure GET /jobs/<id> throughput against a JobServer holding `jobs` tasks"""
+    import http.client
+    import threading
+    sys.path.insert(0, str(ROOT))
+    from download_manager import DownloadManager, DownloadTask
+    from job_server import JobServer
+
+    manager = DownloadManager()
+    server = JobServer(manager, lambda url, options: None, "127.0.0.1", 0)
+    for i in range(jobs):
+        task = DownloadTask(url=f"https://example.com/{i}", path=f"/tmp/{i}.mp4", format_choice="mp4")
+        server.track(task)
+    server.start()
+    server.publisher.rebuild()
+    ids = list(server.tasks)
+    counts = [0] * clients
+    stop = threading.Event()
+
+    def client(slot: int):
+        conn = http.client.HTTPConnection(*server.address, timeout=5)
+        i = slot
+        while not stop.is_set():
+            conn.request("GET", f"/jobs/{ids[i % len(ids)]}")
+            conn.getresponse().read()
+            counts[slot] += 1
+            i += clients
+        conn.close()
+
+    threads = [threading.Thread(target=client, args=(n,)) for n in range(clients)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    server.stop()
+    return {"requests": sum(counts), "seconds": seconds, "per_second": sum(counts) / seconds}
+
+
+# Stand-in for yt-dlp that fetches its URL over HTTP and reports progress like yt-dlp
+FAKE_HTTP_YTDLP = r'''#!{python}
+import os, sys, time, urllib.request
+args = sys.argv[1:]
+url = args[-1]
+out = args[args.index("-o") + 1].replace("%(title)s", os.path.basename(url)).replace("%(uploader)s", "bench")
+with urllib.request.urlopen(url) as response:
+    total = int(response.headers.get("Content-Length") or 0)
+    done = 0
+    started = time.monotonic()
+    with open(out, "wb") as f:
+        while True:
+            chunk = response.read(16384)
+            if not chunk:
+                break
+            f.write(chunk)
+            done += len(chunk)
+            rate = done / max(0.001, time.monotonic() - started) / 1024
+            print(f"[download] {done * 100.0 / max(1, total):5.1f}% of {total / 1024:.2f}KiB at {rate:.2f}KiB/s ETA 00:00", flush=True)
+'''
+
+
+class ThrottledServer:
+    """Local HTTP source that streams GET /<name>?size=N at `rate` bytes/s per connection"""
+
+    def __init__(self, rate: float = 128 * 1024):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        from urllib.parse import urlparse, parse_qs
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)
+                size = int(query.get("size", ["65536"])[0])
+                self.send_response(200)
+                self.send_header("Content-Length", str(size))
+                self.end_headers()
+                chunk = 16384
+                sent = 0
+                while sent < size:
+                    n = min(chunk, size - sent)
+                    self.wfile.write(b"x" * n)
+                    sent += n
+                    time.sleep(n / rate)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def url(self, name: str, size: int) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/{name}?size={size}"
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def run_workers(workdir: Path, source: ThrottledServer, workers: int, jobs: int, size: int) -> float:
+    """Queue `jobs` downloads in a fresh shared queue and time `workers` CLI worker processes draining it"""
+    sys.path.insert(0, str(ROOT))
+    from job_queue import SharedJobQueue
+
+    workdir.mkdir(parents=True, exist_ok=True)
+    script = workdir / "yt-dlp"
+    script.write_text(FAKE_HTTP_YTDLP.replace("{python}", sys.executable))
+    script.chmod(0o755)
+    db = workdir / f"queue-{workers}.db"
+    SharedJobQueue(str(db)).enqueue([source.url(f"job{i}", size) for i in range(jobs)])
+
+    command = [
+        sys.executable, "-m", "downloader_cli", "--worker", "--queue-db", str(db),
+        "--yt-dlp", str(script), "--settings", str(workdir / "none.json"),
+        "-o", str(workdir / f"out-{workers}"), "-j", "1", "--retries", "0", "--quiet"
+    ]
+    started = time.perf_counter()
+    processes = [
+        subprocess.Popen(command + ["--worker-id", f"w{n}"], cwd=str(ROOT),
+                         stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for n in range(workers)
+    ]
+    for process in processes:
+        process.wait(timeout=300)
+    elapsed = time.perf_counter() - started
+    counts = SharedJobQueue(str(db)).counts()
+    if counts.get("completed", 0) != jobs:
+        raise RuntimeError(f"workers did not finish every job: {counts}")
+    return elapsed
+
+
+def bench_worker_scaling(jobs: int = 16, size: int = 128 * 1024, rate: float = 128 * 1024,
+                         worker_counts=(1, 2, 4)) -> dict:
+    """Drain the same queue with different numbers of worker processes"""
+    import tempfile
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp, ThrottledServer(rate) as source:
+        for workers in worker_counts:
+            results[workers] = run_workers(Path(tmp) / str(workers), source, workers, jobs, size)
+    return results
+
+
+def _fake_ytdlp_json(index: int, formats: int = 40, fragments: int = 60, languages: int = 100) -> str:
+    """A -J document shaped like a YouTube video: formats with fragments and headers, captions"""
+    headers = {"User-Agent": "Mozilla/5.0 (X11; Linux x86_64)", "Accept": "*/*", "Accept-Language": "en-us,en;q=0.5"}
+    info = {
+        "id": f"video{index:06d}",
+        "title": f"Video {index}",
+        "uploader": "Uploader",
+        "duration": 600,
+        "upload_date": "20240101",
+        "extractor": "youtube",
+        "extractor_key": "Youtube",
+        "format_id": "137+140",
+        "description": "Lorem ipsum dolor sit amet. " * 100,
+        "tags": [f"tag{i}" for i in range(30)],
+        "thumbnails": [{"url": f"https://i.ytimg.com/vi/{index}/{i}.jpg", "id": str(i), "preference": -i}
+                       for i in range(40)],
+        "automatic_captions": {
+            f"l{lang}": [{"ext": ext, "url": f"https://www.youtube.com/api/timedtext?v={index}&lang={lang}&fmt={ext}"}
+                         for ext in ("json3", "srv1", "srv2", "srv3", "ttml", "vtt")]
+            for lang in range(languages)
+        },
+        "formats": [
+            {
+                "format_id": str(100 + f), "ext": "mp4", "vcodec": "avc1.64001F", "acodec": "none",
+                "height": 144 * (1 + f % 8), "width": 256 * (1 + f % 8), "filesize": 1_000_000 * (f + 1),
+                "tbr": 100.0 + f, "protocol": "https", "http_headers": headers,
+                "url": f"https://rr1.googlevideo.com/videoplayback?id={index}&itag={f}&sig=" + "s" * 200,
+                "fragments": [{"url": f"sq/{n}", "duration": 5.0} for n in range(fragments)]
+            }
+            for f in range(formats)
+        ]
+    }
+    return json.dumps(info)
+
+
+def _rss_mb() -> float:
+    """Current resident set size in MiB"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def preview_memory_child(mode: str, count: int) -> dict:
+    """Hold `count` parsed previews the way info_cache does and report the memory they keep"""
+    import gc
+    sys.path.insert(0, str(ROOT))
+    from media_info import parse_media_info
+    parse = json.loads if mode == "full" else parse_media_info
+    gc.collect()
+    before = _rss_mb()
+    started = time.perf_counter()
+    cache = {}
+    for i in range(count):
+        cache[f"https://youtu.be/{i}"] = parse(_fake_ytdlp_json(i))
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    return {"mode": mode, "count": count, "rss_mb": _rss_mb() - before, "seconds": elapsed}
+
+
+def bench_preview_memory(count: int = 500) -> dict:
+    """Resident memory of `count` cached previews: full -J dicts vs the compact model"""
+    results = {}
+    for mode in ("full", "compact"):
+        out = subprocess.run(
+            [sys.executable, __file__, "preview-memory", "--count", str(count), "--mode", mode],
+            cwd=str(ROOT), check=True, capture_output=True, text=True
+        )
+        results[mode] = json.loads(out.stdout.strip().splitlines()[-1])
+    return results
+
+
+class StaticMediaServer:
+    """Local stand-in site: every GET/HEAD /<name>.mp4 returns a small video file"""
+
+    def __init__(self, size: int = 16 * 1024):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        body = b"\x00\x00\x00\x18ftypmp42" + b"\x00" * size
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def _headers(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "video/mp4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+
+            def do_HEAD(self):
+                self._headers()
+
+            def do_GET(self):
+                self._headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def bench_metadata_batch(count: int = 100, width: int = 4, ytdlp: str = None) -> dict:
+    """Time metadata for `count` URLs: one yt-dlp process per URL vs batched -j runs"""
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+    sys.path.insert(0, str(ROOT))
+    import downloader_core
+
+    ytdlp = ytdlp or shutil.which("yt-dlp")
+    if not ytdlp:
+        raise RuntimeError("yt-dlp not found; pass --yt-dlp PATH")
+    downloader_core.YTDLP_PATH = ytdlp
+    results = {}
+    with StaticMediaServer() as site:
+        urls = [f"{site.url}/video{i}.mp4" for i in range(count)]
+        chunks = [urls[i::width] for i in range(width)]
+
+        def per_url(batch):
+            return sum(1 for url in batch if downloader_core.fetch_media_info(url))
+
+        def batched(batch):
+            return downloader_core.fetch_media_info_batch(batch, lambda url, info: None)
+
+        for label, fn, parts in [
+            ("per-URL processes, serial", per_url, [urls]),
+            (f"per-URL processes, {width} threads", per_url, chunks),
+            ("one -j batch", batched, [urls]),
+            (f"{width} -j batches in parallel", batched, chunks),
+        ]:
+            started = time.perf_counter()
+            with ThreadPoolExecutor(len(parts)) as pool:
+                ok = sum(pool.map(fn, parts))
+            results[label] = {"seconds": time.perf_counter() - started, "ok": ok}
+    return results
+
+
+def bench_clipboard_idle(polls: int = 200, interval: float = 3.0) -> dict:
+    """Cost of an idle hour of clipboard polling, extrapolated from `polls` back-to-back polls.
+
+    Each poll spawns the reader pyperclip uses on Linux (xclip, else xsel; /bin/true
+    stands in when neither is installed). Signal-driven monitoring does no work while
+    the clipboard is unchanged, so its idle cost is zero spawns.
+    """
+    import os
+    import shutil
+    if shutil.which("xclip"):
+        command = ["xclip", "-selection", "c", "-o"]
+    elif shutil.which("xsel"):
+        command = ["xsel", "-b", "-o"]
+    else:
+        command = [shutil.which("true") or "true"]
+    before = os.times()
+    started = time.perf_counter()
+    for _ in range(polls):
+        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - started
+    after = os.times()
+    cpu = sum(after[:4]) - sum(before[:4])
+    per_hour = 3600 / interval
+    return {
+        "reader": command[0],
+        "spawns_per_hour": per_hour,
+        "cpu_seconds_per_hour": cpu / polls * per_hour,
+        "busy_seconds_per_hour": elapsed / polls * per_hour,
+    }
+
+
+def bench_progress_refresh(tasks: int = 20000, active: int = 10, refreshes: int = 50) -> dict:
+    """Per-refresh cost of finding changed rows in a long session: full scan vs dirty set"""
+    sys.path.insert(0, str(ROOT))
+    from download_manager import DownloadManager, DownloadTask, DownloadStatus
+
+    manager = DownloadManager()
+    task_map = {}
+    for i in range(tasks):
+        task = DownloadTask(url=f"https://example.com/v{i}", path=f"/tmp/v{i}.mp4", format_choice="mp4")
+        task.status = DownloadStatus.COMPLETED if i >= active else DownloadStatus.DOWNLOADING
+        task_map[task.task_id] = task
+    running = list(task_map.values())[:active]
+    state_cache = {}
+
+    def full_scan():
+        changed = []
+        for task_id, task in task_map.items():
+            state = (task.status.value, task.file_size, task.speed, task.eta, round(task.progress, 1))
+            if state_cache.get(task_id) != state:
+                state_cache[task_id] = state
+                changed.append(task_id)
+        return changed
+
+    def dirty_set():
+        return [task_id for task_id in manager.take_dirty() if task_id in task_map]
+
+    full_scan()
+    results = {}
+    for label, refresh in [("full scan", full_scan), ("dirty set", dirty_set)]:
+        samples = []
+        for n in range(refreshes):
+            for task in running:
+                manager.update_progress(task, n % 100 + 0.5, f"{n} KiB/s", "00:10")
+            started = time.perf_counter()
+            changed = refresh()
+            samples.append(time.perf_counter() - started)
+            assert len(changed) == active
+        results[label] = samples
+    return results
+
+
+def bench_log_routing(tasks: int = 10, seconds: int = 120, lines_per_second: int = 10) -> dict:
+    """Log traffic reaching the UI for concurrent downloads: every line vs LogRouter.
+
+    Replays simulated yt-dlp output on a fake clock through the Qt worker's
+    0.2 s batching, counts the signals and lines delivered, and times the
+    UI-side work of storing them in a LogStore.
+    """
+    import tempfile
+    sys.path.insert(0, str(ROOT))
+    from log_router import LogFileWriter, LogRouter
+    from log_store import LogStore
+
+    def output(i):
+        if i % 50 == 0:
+            return f"[youtube] v{i}: Downloading m3u8 information\n"
+        if i % 500 == 7:
+            return "WARNING: [youtube] Some formats may be missing\n"
+        return f"[download]  {i % 1000 / 10:5.1f}% of ~ 120.00MiB at  2.00MiB/s ETA 00:50 (frag {i}/1000)\n"
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = LogFileWriter(tmp)
+        for label, routed in [("every line", False), ("log router", True)]:
+            clock = [0.0]
+            delivered = []
+            buffers = [[] for _ in range(tasks)]
+            last_emit = [0.0] * tasks
+
+            def sink(n, line):
+                # DownloadRunner.on_log: buffer and emit at most every 0.2 s
+                buffers[n].append(line)
+                if clock[0] - last_emit[n] >= 0.2:
+                    last_emit[n] = clock[0]
+                    delivered.append(("".join(buffers[n]), str(n)))
+                    buffers[n].clear()
+
+            def error_sink(n, line):
+                buffers[n].append(line)
+                delivered.append(("".join(buffers[n]), str(n)))
+                buffers[n].clear()
+
+            sinks = [
+                LogRouter(str(n), lambda line, n=n: sink(n, line), lambda line, n=n: error_sink(n, line),
+                          writer=writer, clock=lambda: clock[0])
+                if routed else (lambda line, n=n: sink(n, line))
+                for n in range(tasks)
+            ]
+            for step in range(seconds * lines_per_second):
+                clock[0] = step / lines_per_second
+                for n in range(tasks):
+                    sinks[n](output(step))
+            delivered.extend(("".join(buffer), str(n)) for n, buffer in enumerate(buffers) if buffer)
+            store = LogStore()
+            started = time.perf_counter()
+            lines = sum(len(store.append(text, task_id)) for text, task_id in delivered)
+            results[label] = {"signals": len(delivered), "lines": lines, "ui_ms": (time.perf_counter() - started) * 1000}
+        writer.flush()
+    return results
+
+
+def bench_history_search(entries: int = 100_000) -> dict:
+    """First page and match count of history searches: scanning a list vs HistoryStore"""
+    import tempfile
+    sys.path.insert(0, str(ROOT))
+    from history_store import HistoryStore, PAGE_SIZE
+
+    rows = [
+        {"file": f"clip {i}.mp4", "location": "/videos", "url": f"https://example.com/watch?v={i}",
+         "format": "MP4 (Video)", "status": "Failed" if i % 10 == 0 else "Completed",
+         "title": f"Episode {i} of {'cooking' if i % 2 else 'gardening'}", "uploader": f"channel{i % 100}"}
+        for i in range(entries)
+    ]
+    searches = [("garden channel40", ""), ("episode", "Completed"), ("cook", "Failed"), ("", "Failed")]
+
+    def scan(query, status):
+        # What a list-backed view does on each keystroke
+        words = query.lower().split()
+        matched = [
+            row for row in reversed(rows)
+            if (not status or row["status"] == status)
+            and all(any(word in row[key].lower() for key in ("title", "url", "uploader", "file")) for word in words)
+        ]
+        return matched[:PAGE_SIZE], len(matched)
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        store = HistoryStore(str(Path(tmp) / "history.db"))
+        store.add_many(rows)
+        for label, search in [("list scan", scan), ("history store", lambda q, s: (store.page(q, s), store.count(q, s)))]:
+            samples = []
+            for query, status in searches:
+                started = time.perf_counter()
+                search(query, status)
+                samples.append(time.perf_counter() - started)
+            results[label] = samples
+        store.close()
+    return results
+
+
+def bench_preview_gallery(counts=(100, 300, 1000)) -> dict:
+    """Populate, relayout-on-resize and repaint times of the preview gallery by card count"""
+    import os
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, str(ROOT))
+    from PySide6.QtWidgets import QApplication
+    from ui_components_qt import PreviewGallery
+
+    app = QApplication.instance() or QApplication([])
+    results = {}
+    for count in counts:
+        gallery = PreviewGallery(lambda thumb_url: None)
+        requested = set()
+        gallery.delegate.thumbnail_needed.connect(requested.add)
+        gallery.resize(1200, 400)
+        gallery.show()
+        started = time.perf_counter()
+        for i in range(count):
+            url = f"https://example.com/watch?v={i}"
+            gallery.preview_model.add(url)
+            gallery.preview_model.set_data(url, f"Video {i}", "Uploader\n3m 20s | 12.0 MB", f"https://img/{i}.jpg")
+        app.processEvents()
+        populate = time.perf_counter() - started
+        started = time.perf_counter()
+        for width in range(700, 1300, 50):
+            gallery.resize(width, 400)
+            app.processEvents()
+        resize = (time.perf_counter() - started) / 12
+        started = time.perf_counter()
+        gallery.grab()
+        paint = time.perf_counter() - started
+        results[count] = {"populate": populate, "resize": resize, "paint": paint, "thumbnails": len(requested)}
+        gallery.close()
+        gallery.deleteLater()
+        app.processEvents()
+    return results
+
+
+def bench_thumbnail_decode(count: int = 200, size: int = 80) -> dict:
+    """Per-thumbnail cost of turning a 1280x720 JPEG into a QImage"""
+    import io
+    import os
+    import tempfile
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, str(ROOT))
+    from PySide6.QtCore import QPointF
+    from PySide6.QtGui import QImage, QLinearGradient, QPainter, QColor
+    from PySide6.QtWidgets import QApplication
+    from downloader_qt import _decode_thumbnail_qimage, _pil_to_qimage
+    from thumbnail_cache import decode_thumbnail
+
+    app = QApplication.instance() or QApplication([])
+
+    def png_round_trip(path):
+        # The previous handoff: Pillow decode, PNG encode, Qt decode
+        buffer = io.BytesIO()
+        decode_thumbnail(path, size).save(buffer, format="PNG")
+        return QImage.fromData(buffer.getvalue())
+
+    methods = [
+        ("pillow + png round trip", png_round_trip),
+        ("pillow + rgba buffer", lambda path: _pil_to_qimage(decode_thumbnail(path, size))),
+        ("qt reader, scaled decode", lambda path: _decode_thumbnail_qimage(path, size)),
+    ]
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "thumb.jpg")
+        source = QImage(1280, 720, QImage.Format.Format_RGB32)
+        painter = QPainter(source)
+        gradient = QLinearGradient(QPointF(0, 0), QPointF(1280, 720))
+        gradient.setColorAt(0, QColor("#1877f2"))
+        gradient.setColorAt(1, QColor("#f39c12"))
+        painter.fillRect(source.rect(), gradient)
+        painter.end()
+        source.save(path, "JPEG", 90)
+        for label, decode in methods:
+            try:
+                decode(path)
+            except ImportError as e:
+                results[label] = str(e)
+                continue
+            samples = []
+            for _ in range(count):
+                started = time.perf_counter()
+                image = decode(path)
+                samples.append(time.perf_counter() - started)
+            assert max(image.width(), image.height()) == size
+            results[label] = samples
+    app.processEvents()
+    return results
+
+
+def bench_completion_stall(jobs: int = 50, tail: float = 0.02, interval_ms: int = 4) -> dict:
+    """Event loop stall while `jobs` downloads finish at once.
+
+    Each job spends `tail` seconds after reporting completion (closing pipes,
+    flushing its log) before its thread returns. A heartbeat timer measures
+    how long the GUI thread goes without running it.
+    """
+    import os
+    import threading
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    sys.path.insert(0, str(ROOT))
+    from PySide6.QtCore import QEventLoop, QObject, QThread, QThreadPool, QTimer, Signal, Slot
+    from PySide6.QtWidgets import QApplication
+    from downloader_qt import PooledRunner, RUNNER_THREADS
+
+    app = QApplication.instance() or QApplication([])
+
+    class OldWorker(QThread):
+        completed = Signal(int)
+
+        def __init__(self, index, start):
+            super().__init__()
+            self.index, self.start_event = index, start
+
+        def run(self):
+            self.start_event.wait()
+            self.completed.emit(self.index)
+            time.sleep(tail)
+
+    class Job(PooledRunner):
+        def __init__(self, start):
+            super().__init__()
+            self.start_event = start
+
+        def work(self):
+            self.start_event.wait()
+            time.sleep(tail)
+
+    class Reaper(QObject):
+        def __init__(self, loop):
+            super().__init__()
+            self.loop, self.items, self.reaped = loop, {}, 0
+
+        @Slot(int)
+        def wait_for_thread(self, key):
+            # The previous on_download_completed: quit() and wait() per finished worker
+            worker = self.items.pop(key)
+            worker.quit()
+            worker.wait(1000)
+            self._count()
+
+        @Slot(int)
+        def drop(self, key):
+            self.items.pop(key, None)
+            self._count()
+
+        def _count(self):
+            self.reaped += 1
+            if self.reaped == jobs:
+                self.loop.quit()
+
+    def measure(start_all):
+        loop = QEventLoop()
+        reaper = Reaper(loop)
+        start = threading.Event()
+        beats = []
+        heartbeat = QTimer()
+        heartbeat.setInterval(interval_ms)
+        heartbeat.timeout.connect(lambda: beats.append(time.perf_counter()))
+        start_all(reaper, start)
+        heartbeat.start()
+        QTimer.singleShot(50, start.set)
+        QTimer.singleShot(30_000, loop.quit)
+        began = time.perf_counter()
+        loop.exec()
+        elapsed = time.perf_counter() - began
+        heartbeat.stop()
+        gaps = [b - a for a, b in zip(beats, beats[1:])] or [elapsed]
+        return {
+            "reaped": reaper.reaped,
+            "max_gap": max(gaps),
+            "stalled": sum(max(0.0, gap - interval_ms / 1000) for gap in gaps),
+            "seconds": elapsed,
+        }
+
+    def threads(reaper, start):
+        for index in range(jobs):
+            worker = reaper.items[index] = OldWorker(index, start)
+            worker.completed.connect(reaper.wait_for_thread)
+            worker.start()
+
+    pool = QThreadPool()
+    pool.setMaxThreadCount(RUNNER_THREADS)
+
+    def runners(reaper, start):
+        for _ in range(jobs):
+            job = Job(start)
+            reaper.items[job.key] = job
+            job.signals.finished.connect(reaper.drop)
+            pool.start(job)
+
+    results = {"qthread + wait()": measure(threads), "pooled runners": measure(runners)}
+    pool.waitForDone(5000)
+    app.processEvents()
+    return results
+
+
+def _print_samples(results: dict):
+    for label, samples in results.items():
+        if isinstance(samples, str):
+            print(f"{label:<28} unavailable: {samples}")
+        else:
+            print(
+                f"{label:<28} median {statistics.median(samples) * 1000:7.1f} ms"
+                f"  min {min(samples) * 1000:7.1f} ms  ({len(samples)} runs)"
+            )
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    sub = parser.add_subparsers(dest="bench", required=True)
+    cold = sub.add_parser("cold-start", help="CLI vs GUI import time in a fresh interpreter")
+    cold.add_argument("--runs", type=int, default=5)
+    polls = sub.add_parser("api-polls", help="job API status poll throughput")
+    polls.add_argument("--jobs", type=int, default=500)
+    polls.add_argument("--clients", type=int, default=8)
+    polls.add_argument("--seconds", type=float, default=3.0)
+    scaling = sub.add_parser("worker-scaling", help="shared-queue worker processes against a throttled source")
+    scaling.add_argument("--jobs", type=int, default=16)
+    scaling.add_argument("--workers", default="1,2,4")
+    batch = sub.add_parser("metadata-batch", help="yt-dlp per-URL processes vs batched -j against a local site")
+    batch.add_argument("--count", type=int, default=100)
+    batch.add_argument("--width", type=int, default=4)
+    batch.add_argument("--yt-dlp", dest="ytdlp")
+    routing = sub.add_parser("log-routing", help="log signals and lines reaching the UI: every line vs LogRouter")
+    routing.add_argument("--tasks", type=int, default=10)
+    routing.add_argument("--seconds", type=int, default=120)
+    stall = sub.add_parser("completion-stall", help="GUI stall while many downloads finish: waited QThreads vs runner pool")
+    stall.add_argument("--jobs", type=int, default=50)
+    decode = sub.add_parser("thumbnail-decode", help="per-thumbnail JPEG to QImage cost: PNG round trip vs direct")
+    decode.add_argument("--count", type=int, default=200)
+    gallery = sub.add_parser("preview-gallery", help="preview gallery populate/resize/paint cost by card count")
+    gallery.add_argument("--counts", default="100,300,1000")
+    history = sub.add_parser("history-search", help="history search over many entries: list scan vs HistoryStore")
+    history.add_argument("--entries", type=int, default=100_000)
+    refresh = sub.add_parser("progress-refresh", help="finding changed download rows: full scan vs dirty set")
+    refresh.add_argument("--tasks", type=int, default=20000)
+    refresh.add_argument("--active", type=int, default=10)
+    clip = sub.add_parser("clipboard-idle", help="process spawns and CPU of an idle hour of clipboard polling")
+    clip.add_argument("--polls", type=int, default=200)
+    memory = sub.add_parser("preview-memory", help="resident memory of cached previews, full vs compact")
+    memory.add_argument("--count", type=int, default=500)
+    memory.add_argument("--mode", choices=("full", "compact"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.bench == "cold-start":
+        _print_samples(bench_cold_start(args.runs))
+    elif args.bench == "api-polls":
+        result = bench_api_polls(args.jobs, args.clients, args.seconds)
+        print(f"{result['requests']} polls in {result['seconds']:.1f}s = {result['per_second']:.0f}/s")
+    elif args.bench == "worker-scaling":
+        counts = [int(n) for n in args.workers.split(",")]
+        results = bench_worker_scaling(args.jobs, worker_counts=counts)
+        base = results[counts[0]] * counts[0]
+        for workers, elapsed in results.items():
+            print(f"{workers} worker(s): {elapsed:6.2f}s  speedup {results[counts[0]] / elapsed:4.2f}x"
+                  f"  efficiency {base / (elapsed * workers) * 100:5.1f}%")
+    elif args.bench == "metadata-batch":
+        for label, result in bench_metadata_batch(args.count, args.width, args.ytdlp).items():
+            print(f"{label:<34} {result['seconds']:7.2f}s  {result['seconds'] / args.count * 1000:6.1f} ms/URL"
+                  f"  ({result['ok']}/{args.count} ok)")
+    elif args.bench == "log-routing":
+        for label, result in bench_log_routing(args.tasks, args.seconds).items():
+            print(f"{label:<12} {result['signals']:6d} signals  {result['lines']:7d} lines  {result['ui_ms']:8.1f} ms UI work")
+    elif args.bench == "completion-stall":
+        for label, result in bench_completion_stall(args.jobs).items():
+            print(f"{label:<18} {result['reaped']} reaped in {result['seconds']:.2f}s"
+                  f"  longest stall {result['max_gap'] * 1000:7.1f} ms  total stalled {result['stalled'] * 1000:7.1f} ms")
+    elif args.bench == "thumbnail-decode":
+        _print_samples(bench_thumbnail_decode(args.count))
+    elif args.bench == "preview-gallery":
+        for count, result in bench_preview_gallery([int(n) for n in args.counts.split(",")]).items():
+            print(f"{count:5d} cards: populate {result['populate'] * 1000:7.1f} ms  resize {result['resize'] * 1000:6.2f} ms"
+                  f"  paint {result['paint'] * 1000:6.2f} ms  thumbnails requested {result['thumbnails']}")
+    elif args.bench == "history-search":
+        _print_samples(bench_history_search(args.entries))
+    elif args.bench == "progress-refresh":
+        _print_samples(bench_progress_refresh(args.tasks, args.active))
+    elif args.bench == "clipboard-idle":
+        result = bench_clipboard_idle(args.polls)
+        print(f"polling every 3s ({result['reader']}): {result['spawns_per_hour']:.0f} spawns/hour,"
+              f" {result['cpu_seconds_per_hour']:.2f} CPU s/hour, {result['busy_seconds_per_hour']:.2f} s/hour spent polling")
+        print("QClipboard signals:          0 spawns/hour, no work until the clipboard changes")
+    elif args.bench == "preview-memory":
+        if args.mode:
+            print(json.dumps(preview_memory_child(args.mode, args.count)))
+            return 0
+        results = bench_preview_memory(args.count)
+        for mode, result in results.items():
+            print(f"{mode:<8} {result['count']} previews: {result['rss_mb']:8.1f} MiB resident"
+                  f"  ({result['rss_mb'] * 1024 / result['count']:7.1f} KiB each)  parsed in {result['seconds']:.2f}s")
+        print(f"reduction: {results['full']['rss_mb'] / max(results['compact']['rss_mb'], 0.1):.0f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,8 @@
 """Configuration and theme settings"""
 
+import os
+import sys
+
 # Paths
 YTDLP_PATH = r"C:\yt-dlp\yt-dlp.exe"
 FFMPEG_PATH = r"C:\ffmpeg\bin\ffmpeg.exe"
@@ -7,6 +10,8 @@ FFMPEG_PATH = r"C:\ffmpeg\bin\ffmpeg.exe"
 # Settings
 MAX_DOWNLOADS = 10
 CHECK_CLIPBOARD_INTERVAL = 3
+# Qt: wait for the X11 primary selection to stop changing before reading it
+SELECTION_SETTLE_MS = 300
 
 # Theme colors
 BG = "#18191a"
@@ -26,6 +31,20 @@ LIGHT_RED = "#e74c3c"
 LIGHT_YELLOW = "#f1c40f"
 
 SETTINGS_FILE = "settings.json"
+METADATA_CACHE_FILE = "metadata_cache.db"
+HISTORY_FILE = "history.db"
+
+
+def user_cache_dir() -> str:
+    """Per-user cache directory (thumbnails, task logs), independent of any download folder"""
+    if sys.platform.startswith("win"):
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "MediaDownloader")
+
 
 # Formats
 FORMATS = {
@@ -61,6 +80,8 @@ DEFAULT_SETTINGS = {
     "max_concurrent": 3,
     "clipboard_enabled": False,
     "clipboard_auto_add": False,
+    "clipboard_prefetch": False,
+    "prefetch_per_minute": 6,
     "overwrite_policy": "ask",
     "notifications": True,
     "minimize_to_tray": False,
@@ -76,6 +97,16 @@ DEFAULT_SETTINGS = {
     "subtitle_langs": "en.*",
     "retry_count": 2,
     "retry_delay": 3,
+    "task_logs": True,
+    "bandwidth_limit": "0",
+    "bandwidth_schedule": [],
+    "api_host": "127.0.0.1",
+    "api_port": 8765,
+    "watch_folders": [],
+    "preview_workers": 4,
+    "preview_platform_limits": {"Instagram": 1, "Facebook": 1, "TikTok": 2},
+    "metadata_cache_size": 5000,
+    "thumbnail_cache_mb": 200,
     "filename_template": "{title} - {uploader}",
     "presets": {
         "Default": {
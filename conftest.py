@@ -0,0 +1,24 @@
+"""Shared pytest fixtures"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+@pytest.fixture(autouse=True)
+def isolated_user_cache(tmp_path_factory, monkeypatch):
+    """Keep task logs and cached thumbnails out of the real per-user cache.
+
+    Child processes find the temporary cache through XDG_CACHE_HOME; in this
+    process the shared log writer is replaced for the duration of a test.
+    """
+    cache = tmp_path_factory.mktemp("user-cache")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    monkeypatch.setenv("LOCALAPPDATA", str(cache))
+    import log_router
+    monkeypatch.setattr(log_router, "_shared_writer", log_router.LogFileWriter(str(cache / "MediaDownloader" / "logs")))
+    yield cache
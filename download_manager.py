@@ -1,11 +1,22 @@
 """Download state management"""
 
 import threading
+import uuid
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import List, Dict, Callable
 from enum import Enum
 
+from bandwidth import BandwidthBudget
+
+# Most recent history entries kept in memory
+HISTORY_KEEP = 50
+
+# Finished entries held for a frontend's completion summary; the queue never
+# holds more tasks than this, so a summary drops nothing in practice
+FINISHED_KEEP = 1000
+
 class DownloadStatus(Enum):
     QUEUED = "Queued"
     DOWNLOADING = "Downloading"
@@ -23,6 +34,8 @@ class DownloadTask:
     platform: str = ""
     thumbnail_path: str = ""
     thumbnail_url: str = ""
+    title: str = ""
+    uploader: str = ""
     status: DownloadStatus = DownloadStatus.QUEUED
     progress: float = 0.0
     file_size: str = "Unknown"
@@ -33,6 +46,13 @@ class DownloadTask:
     speed_history: list = field(default_factory=list)
     eta_history: list = field(default_factory=list)
     last_error: str = ""
+    error_class: str = ""
+    # Bandwidth share and tier; only the CLI and the job API set these, the GUIs keep the defaults
+    weight: float = 1.0
+    priority: int = 0
+    task_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # Per-task download settings (e.g. from a preset) applied over the global ones
+    overrides: dict = field(default_factory=dict)
     
     def to_dict(self):
         """Convert to dictionary for history storage"""
@@ -43,17 +63,29 @@ class DownloadTask:
             "url": self.url,
             "format": self.format_choice,
             "status": self.status.value,
+            "title": self.title,
+            "uploader": self.uploader,
             "timestamp": self.start_time.isoformat()
         }
 
 class DownloadManager:
     """Manages download queue and state"""
     
-    def __init__(self, max_downloads: int = 10):
+    def __init__(self, max_downloads: int = 10, bandwidth_limit=0, bandwidth_schedule=None, history_store=None):
         self.queue: List[DownloadTask] = []
         self.active_downloads: List[DownloadTask] = []
+        # Full history lives in history_store when given; self.history keeps the latest entries
+        self.history_store = history_store
         self.history: List[Dict] = []
+        if history_store is not None:
+            try:
+                self.history = history_store.latest(HISTORY_KEEP)
+            except Exception as e:
+                print(f"Could not load history: {e}")
         self.max_downloads = max_downloads
+        self.bandwidth = BandwidthBudget(bandwidth_limit, bandwidth_schedule)
+        self.error_counts: Counter = Counter()
+        self.retry_counts: Counter = Counter()
         self.callbacks: Dict[str, List[Callable]] = {
             "queue_updated": [],
             "download_started": [],
@@ -62,6 +94,11 @@ class DownloadManager:
             "history_updated": []
         }
         self._lock = threading.Lock()
+        # Ids of tasks whose displayed state changed since the UI last refreshed
+        self._dirty = set()
+        self._dirty_lock = threading.Lock()
+        # History entries of tasks finished since a frontend last took them
+        self._finished = deque(maxlen=FINISHED_KEEP)
     
     def add_task(self, task: DownloadTask) -> bool:
         """Add a task to the queue"""
@@ -70,6 +107,7 @@ class DownloadManager:
             if len(self.queue) + len(self.active_downloads) >= 1000:
                 return False
             self.queue.append(task)
+            self.mark_dirty(task)
             self._notify("queue_updated")
             return True
     
@@ -79,6 +117,7 @@ class DownloadManager:
             if self.queue:
                 task = self.queue.pop(0)
                 self.active_downloads.append(task)
+                self.mark_dirty(task)
                 self._notify("download_started")
                 return task
             return None
@@ -91,6 +130,7 @@ class DownloadManager:
                 task.speed = speed
             if eta:
                 task.eta = eta
+            self.mark_dirty(task)
             self._notify("download_progress")
     
     def complete_task(self, task: DownloadTask, success: bool = True):
@@ -99,14 +139,11 @@ class DownloadManager:
             task.status = DownloadStatus.COMPLETED if success else DownloadStatus.FAILED
             if task in self.active_downloads:
                 self.active_downloads.remove(task)
-            
-            # Add to history
-            self.history.insert(0, task.to_dict())
-            if len(self.history) > 50:  # Keep last 50
-                self.history.pop()
-            
-            self._notify("download_completed")
-            self._notify("history_updated")
+            entry = task.to_dict()
+            self.mark_dirty(task)
+        self._record_history(entry)
+        self._notify("download_completed")
+        self._notify("history_updated")
 
     def cancel_task(self, task: DownloadTask):
         """Cancel a running or queued task"""
@@ -116,18 +153,35 @@ class DownloadManager:
                 self.queue.remove(task)
             if task in self.active_downloads:
                 self.active_downloads.remove(task)
-            self.history.insert(0, task.to_dict())
-            if len(self.history) > 50:
+            entry = task.to_dict()
+            self.mark_dirty(task)
+        self._record_history(entry)
+        self._notify("download_completed")
+        self._notify("history_updated")
+
+    def _record_history(self, entry: dict):
+        """Save a finished task's entry; called without _lock held, so the INSERT never stalls progress updates"""
+        if self.history_store is not None:
+            try:
+                entry = self.history_store.add(entry)
+            except Exception as e:
+                print(f"Could not save history: {e}")
+        with self._lock:
+            self.history.insert(0, entry)
+            if len(self.history) > HISTORY_KEEP:
                 self.history.pop()
-            self._notify("download_completed")
-            self._notify("history_updated")
+        with self._dirty_lock:
+            self._finished.append(entry)
 
     def pause_task(self, task: DownloadTask):
         """Pause a task"""
         with self._lock:
             task.status = DownloadStatus.PAUSED
+            if task in self.queue:
+                self.queue.remove(task)
             if task in self.active_downloads:
                 self.active_downloads.remove(task)
+            self.mark_dirty(task)
             self._notify("download_progress")
 
     def resume_task(self, task: DownloadTask):
@@ -136,8 +190,24 @@ class DownloadManager:
             task.status = DownloadStatus.QUEUED
             if task not in self.queue:
                 self.queue.insert(0, task)
+            self.mark_dirty(task)
             self._notify("queue_updated")
 
+    def record_error(self, task: DownloadTask, error_class: str, retrying: bool):
+        """Count a failed attempt by error class"""
+        with self._lock:
+            task.error_class = error_class
+            if retrying:
+                self.retry_counts[error_class] += 1
+            else:
+                self.error_counts[error_class] += 1
+
+    def get_error_summary(self) -> str:
+        """Get per-class counts of failures and retries"""
+        from error_classifier import format_error_summary
+        with self._lock:
+            return format_error_summary(dict(self.error_counts), dict(self.retry_counts))
+
     def find_task_by_url(self, url: str):
         """Find task by URL"""
         with self._lock:
@@ -146,6 +216,24 @@ class DownloadManager:
                     return task
         return None
     
+    def mark_dirty(self, task: DownloadTask):
+        """Record that a task's displayed state changed; safe from any thread"""
+        with self._dirty_lock:
+            self._dirty.add(task.task_id)
+
+    def take_dirty(self) -> set:
+        """Ids of tasks changed since the last call, clearing the set"""
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        return dirty
+
+    def take_finished(self) -> list:
+        """History entries finished since the last call, oldest first"""
+        with self._dirty_lock:
+            finished = list(self._finished)
+            self._finished.clear()
+        return finished
+
     def subscribe(self, event: str, callback: Callable):
         """Subscribe to state changes"""
         if event in self.callbacks:
@@ -2,7 +2,6 @@
 
 import os
 import json
-import uuid
 import csv
 import subprocess
 import tkinter as tk
@@ -12,26 +11,25 @@ import pyperclip
 import webbrowser
 import threading
 import time
-import io
-import urllib.request
 import re
 
 from config import (
     BG, FG, BOX, BTN, GREEN, RED, YELLOW,
     LIGHT_BG, LIGHT_FG, LIGHT_BOX, LIGHT_BTN, LIGHT_GREEN, LIGHT_RED, LIGHT_YELLOW,
-    CHECK_CLIPBOARD_INTERVAL, DEFAULT_SETTINGS, SETTINGS_FILE,
+    CHECK_CLIPBOARD_INTERVAL, DEFAULT_SETTINGS, SETTINGS_FILE, METADATA_CACHE_FILE, HISTORY_FILE,
     FORMATS, QUALITY_OPTIONS,
     YTDLP_PATH, FFMPEG_PATH
 )
 from download_manager import DownloadManager, DownloadTask, DownloadStatus
-from downloader_core import detect_platform, start_download_thread, get_output_extension, fetch_media_info
-from ui_components import URLInputFrame, DownloadTableFrame, HistoryFrame, LogsFrame, get_save_file_dialog
-
-try:
-    from plyer import notification
-    NOTIFY_AVAILABLE = True
-except Exception:
-    NOTIFY_AVAILABLE = False
+from downloader_core import detect_platform, start_download_thread, get_output_extension, fetch_media_info, stop_task_process
+from history_store import HistoryStore
+from notifications import COALESCE_MS, CompletionSummary, get_notifier
+from metadata_cache import MetadataCache, MAX_ENTRIES
+from prefetch import Prefetcher, PREFETCH_PER_MINUTE
+from thumbnail_cache import get_thumbnail_cache, decode_thumbnail, DEFAULT_MAX_MB as THUMBNAIL_CACHE_MB
+from ui_components import (
+    URLInputFrame, DownloadTableFrame, HistoryFrame, LogsFrame, CompletionSummaryWindow, get_save_file_dialog
+)
 
 try:
     import pystray
@@ -57,15 +55,33 @@ class DownloaderApp:
         self.settings = self.load_settings()
         self.apply_theme_from_settings()
 
-        self.manager = DownloadManager(max_downloads=self.settings.get("max_concurrent", 3))
+        self.history_store = HistoryStore(HISTORY_FILE)
+        self.manager = DownloadManager(
+            max_downloads=self.settings.get("max_concurrent", 3),
+            bandwidth_limit=self.settings.get("bandwidth_limit", "0"),
+            bandwidth_schedule=self.settings.get("bandwidth_schedule", []),
+            history_store=self.history_store
+        )
         self.manager.subscribe("download_progress", self.on_download_progress)
         self.manager.subscribe("download_completed", self.on_download_completed)
+        # Completions are reported in one summary per COALESCE_MS window
+        self._completion_pending = False
+        self._completion_window = None
 
         self.clipboard_enabled = self.settings.get("clipboard_enabled", False)
         self.clipboard_auto_add = self.settings.get("clipboard_auto_add", False)
         self.last_clip = ""
         self.task_map = {}
         self.info_cache = {}
+        self.metadata_cache = MetadataCache(
+            METADATA_CACHE_FILE, fetcher=fetch_media_info,
+            max_entries=self.settings.get("metadata_cache_size", MAX_ENTRIES)
+        )
+        self.thumbnails = get_thumbnail_cache(self.settings.get("thumbnail_cache_mb", THUMBNAIL_CACHE_MB))
+        self.prefetcher = Prefetcher(
+            self.metadata_cache, self.thumbnails, is_busy=lambda: self.manager.get_queue_count() > 0,
+            per_minute=self.settings.get("prefetch_per_minute", PREFETCH_PER_MINUTE)
+        )
         self.tray_icon = None
 
         self.setup_ui()
@@ -203,7 +219,12 @@ class DownloaderApp:
             self.settings["lock_ctrl_zoom"] = lock_zoom_var.get()
             self.settings["retry_count"] = retry_var.get()
             self.settings["retry_delay"] = delay_var.get()
+            self.settings["bandwidth_limit"] = bandwidth_var.get().strip() or "0"
             self.manager.max_downloads = self.settings.get("max_concurrent", 3)
+            self.manager.bandwidth.configure(
+                limit=self.settings["bandwidth_limit"],
+                schedule=self.settings.get("bandwidth_schedule", [])
+            )
             self.clipboard_enabled = self.settings.get("clipboard_enabled", False)
             self.clipboard_auto_add = self.settings.get("clipboard_auto_add", False)
             self.save_settings()
@@ -223,6 +244,7 @@ class DownloaderApp:
         lock_zoom_var = tk.BooleanVar(value=self.settings.get("lock_ctrl_zoom", False))
         retry_var = tk.IntVar(value=self.settings.get("retry_count", 2))
         delay_var = tk.IntVar(value=self.settings.get("retry_delay", 3))
+        bandwidth_var = tk.StringVar(value=str(self.settings.get("bandwidth_limit", "0")))
 
         tk.Checkbutton(content, text="Enable Clipboard Detection", variable=clip_var, bg=self.colors["BG"], fg=self.colors["FG"], selectcolor=self.colors["BOX"]).pack(anchor="w", padx=20, pady=4)
         tk.Checkbutton(content, text="Auto-add Clipboard URLs", variable=auto_add_var, bg=self.colors["BG"], fg=self.colors["FG"], selectcolor=self.colors["BOX"]).pack(anchor="w", padx=20, pady=4)
@@ -255,6 +277,8 @@ class DownloaderApp:
         tk.Entry(content, textvariable=retry_var, bg=self.colors["BOX"], fg=self.colors["FG"], insertbackground=self.colors["FG"]).pack(fill="x", padx=20, pady=4)
         tk.Label(content, text="Retry Delay (s)", bg=self.colors["BG"], fg=self.colors["FG"]).pack(anchor="w", padx=20)
         tk.Entry(content, textvariable=delay_var, bg=self.colors["BOX"], fg=self.colors["FG"], insertbackground=self.colors["FG"]).pack(fill="x", padx=20, pady=4)
+        tk.Label(content, text="Bandwidth Limit (e.g. 5M, 0 = unlimited)", bg=self.colors["BG"], fg=self.colors["FG"]).pack(anchor="w", padx=20)
+        tk.Entry(content, textvariable=bandwidth_var, bg=self.colors["BOX"], fg=self.colors["FG"], insertbackground=self.colors["FG"]).pack(fill="x", padx=20, pady=4)
 
         tk.Button(content, text="Apply", bg=self.colors["BTN"], fg="white", command=apply_settings).pack(pady=10)
         tk.Button(content, text="Check yt-dlp / ffmpeg", bg=self.colors["BOX"], fg=self.colors["FG"], command=self.check_versions).pack(pady=4)
@@ -532,7 +556,10 @@ class DownloaderApp:
             messagebox.showwarning("Missing", "Enter a media URL")
             return
 
-        info = fetch_media_info(url)
+        info = self.metadata_cache.get(url)
+        if not info:
+            self.prefetcher.yield_to_work()
+            info = self.metadata_cache.put(url, fetch_media_info(url))
         if info:
             title = info.get("title", "Unknown")
             uploader = info.get("uploader", "Unknown")
@@ -580,11 +607,8 @@ class DownloaderApp:
             thumb = info.get("thumbnail") or (info.get("thumbnails")[-1]["url"] if info.get("thumbnails") else None)
             if thumb and PIL_AVAILABLE:
                 try:
-                    with urllib.request.urlopen(thumb) as response:
-                        data = response.read()
-                    image = Image.open(io.BytesIO(data))
                     # Use a small thumbnail so the preview isn't huge
-                    image.thumbnail((96, 96))
+                    image = decode_thumbnail(self.thumbnails.fetch(thumb), 96)
                     self._preview_image = ImageTk.PhotoImage(image)
                     self.preview_image_label.config(image=self._preview_image)
                 except Exception:
@@ -670,8 +694,11 @@ class DownloaderApp:
             format_choice=format_choice,
             platform=platform
         )
+        info = self.info_cache.get(url) or self.metadata_cache.get(url) or {}
+        task.title = info.get("title") or ""
+        task.uploader = info.get("uploader") or ""
         
-        task_id = str(uuid.uuid4())
+        task_id = task.task_id
         self.task_map[task_id] = task
         self.manager.add_task(task)
         
@@ -737,7 +764,7 @@ class DownloaderApp:
         )
         
         # Add to active downloads
-        task_id = str(uuid.uuid4())
+        task_id = task.task_id
         self.task_map[task_id] = task
         self.manager.active_downloads.append(task)
         
@@ -877,12 +904,7 @@ class DownloaderApp:
     def _terminate_process(self, task: DownloadTask):
         if not task or not task.process:
             return
-        def _kill():
-            try:
-                task.process.terminate()
-            except Exception:
-                pass
-        threading.Thread(target=_kill, daemon=True).start()
+        stop_task_process(task)
 
     def on_download_progress(self):
         """Update UI when download progresses"""
@@ -921,14 +943,10 @@ class DownloaderApp:
                 item["url"]
             )
 
-        if self.settings.get("notifications", True):
-            status = self.manager.history[0].get("status", "") if self.manager.history else ""
-            if status == DownloadStatus.FAILED.value:
-                self.notify("Download Failed", "A download failed")
-            elif status == DownloadStatus.CANCELLED.value:
-                self.notify("Download Cancelled", "A download was cancelled")
-            else:
-                self.notify("Download Complete", "Your file has finished downloading")
+        # The first completion in a window schedules one summary for all of them
+        if not self._completion_pending:
+            self._completion_pending = True
+            self.root.after(COALESCE_MS, self._show_completion_summary)
 
         for task_id, task in self.task_map.items():
             if task.status in (DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED):
@@ -945,16 +963,36 @@ class DownloaderApp:
                 )
                 self.download_table.remove_download(task_id)
 
-        if self.manager.history and self.manager.history[0].get("status") == DownloadStatus.COMPLETED.value:
-            latest = self.manager.history[0]
-            path = os.path.join(latest["location"], latest["file"])
-            if messagebox.askyesno("Download Complete", "Open the downloaded file?"):
-                self._open_file_path(path)
-
         # Try to process next
         self.check_queue_space()
         self.process_queue()
 
+        if not self.manager.get_active_count() and not self.manager.get_queue_count():
+            summary = self.manager.get_error_summary()
+            if summary != getattr(self, "_last_error_summary", "No errors"):
+                self._last_error_summary = summary
+                self.logs_frame.add_log(f"Batch finished. {summary}\n")
+
+    def _show_completion_summary(self):
+        self._completion_pending = False
+        summary = CompletionSummary(self.manager.take_finished())
+        if not summary:
+            return
+        if self.settings.get("notifications", True):
+            self.notify(summary.title(), summary.message())
+        # Cancellations were asked for; only a batch with results gets the window
+        if summary.counts[DownloadStatus.CANCELLED.value] == len(summary):
+            return
+        if self._completion_window is None:
+            self._completion_window = CompletionSummaryWindow(
+                self.root, on_open=self._open_file_path, on_open_folder=self._open_folder_path,
+                on_close=self._completion_window_closed
+            )
+        self._completion_window.add_summary(summary)
+
+    def _completion_window_closed(self):
+        self._completion_window = None
+
     def build_filename(self, url: str) -> str:
         info = self.info_cache.get(url, {})
         # Prefer user-edited title override if available
@@ -991,7 +1029,8 @@ class DownloaderApp:
             "auto_subtitles": self.url_frame.get_auto_subtitles(),
             "subtitle_langs": self.url_frame.get_subtitle_langs(),
             "retry_count": self.settings.get("retry_count", 2),
-            "retry_delay": self.settings.get("retry_delay", 3)
+            "retry_delay": self.settings.get("retry_delay", 3),
+            "task_logs": self.settings.get("task_logs", True)
         }
 
     def _open_file_path(self, path: str):
@@ -1130,8 +1169,7 @@ class DownloaderApp:
     # ================= NOTIFICATIONS / TRAY =================
 
     def notify(self, title: str, message: str):
-        if NOTIFY_AVAILABLE:
-            notification.notify(title=title, message=message, timeout=3)
+        get_notifier().notify(title, message, timeout=3)
 
     def on_minimize(self, event):
         if self.settings.get("minimize_to_tray", False) and TRAY_AVAILABLE:
@@ -1168,6 +1206,9 @@ class DownloaderApp:
         if self.settings.get("minimize_to_tray", False) and TRAY_AVAILABLE:
             self.hide_to_tray()
         else:
+            self.prefetcher.stop()
+            self.metadata_cache.close()
+            self.history_store.close()
             self.root.destroy()
 
     # ================= PRESETS =================
@@ -1224,7 +1265,8 @@ class DownloaderApp:
         """Check clipboard for URLs"""
         if self.clipboard_enabled:
             try:
-                text = pyperclip.paste()
+                # Tk reads the clipboard in-process; pyperclip would spawn xclip/xsel on every poll
+                text = self.root.clipboard_get()
                 if text != self.last_clip and text.startswith("http"):
                     self.url_frame.set_url(text)
                     platform = detect_platform(text)
@@ -1235,13 +1277,27 @@ class DownloaderApp:
                             self.root.after_cancel(self._preview_after)
                         except Exception:
                             pass
-                    self._preview_after = self.root.after(700, self.preview_media)
+                    if self.settings.get("clipboard_prefetch", False) and self.prefetcher.add(text):
+                        # Preview once the background fetch lands instead of blocking on yt-dlp here
+                        self._preview_after = self.root.after(500, self._preview_when_prefetched, text, 60)
+                    else:
+                        self._preview_after = self.root.after(700, self.preview_media)
                     if self.clipboard_auto_add:
                         self.add_to_queue()
             except:
                 pass
         
         self.root.after(CHECK_CLIPBOARD_INTERVAL * 1000, self.check_clipboard)
+
+    def _preview_when_prefetched(self, url: str, tries: int):
+        """Poll the metadata cache for a prefetched URL, then show its preview"""
+        self._preview_after = None
+        if self.url_frame.get_url() != url.strip():
+            return
+        if self.metadata_cache.get(url) or tries <= 0 or not self.prefetcher.pending():
+            self.preview_media()
+        else:
+            self._preview_after = self.root.after(500, self._preview_when_prefetched, url, tries - 1)
     
 def main():
     root = tk.Tk()
@@ -0,0 +1,450 @@
+"""Headless command line entry point: python -m downloader_cli URL [URL ...]
+
+Runs downloads through the same DownloadManager and settings schema as the
+GUIs without importing PySide6 or tkinter, so it works on servers without a
+display.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import signal
+import sys
+import threading
+import time
+
+import config
+import downloader_core
+from config import DEFAULT_SETTINGS, SETTINGS_FILE, FORMATS, QUALITY_OPTIONS
+from download_manager import DownloadManager, DownloadTask, DownloadStatus
+from downloader_core import QueueRunner, output_template
+from watch_folder import preset_overrides
+
+# Exit codes
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_NO_YTDLP = 3
+EXIT_INTERRUPTED = 130
+
+# Seconds between progress lines for a running task
+PROGRESS_INTERVAL = 2.0
+
+STATUS_MARKS = {
+    DownloadStatus.COMPLETED: "done",
+    DownloadStatus.FAILED: "FAILED",
+    DownloadStatus.CANCELLED: "cancelled",
+    DownloadStatus.PAUSED: "paused"
+}
+
+
+def load_settings(path: str = SETTINGS_FILE) -> dict:
+    """Load settings the same way the GUIs do: defaults overlaid with settings.json"""
+    settings = DEFAULT_SETTINGS.copy()
+    if path and os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                settings.update(json.load(f))
+        except Exception:
+            pass
+    return settings
+
+
+def resolve_tool(configured: str, name: str) -> str:
+    """Use the configured binary if it exists, otherwise look it up on PATH"""
+    if configured and os.path.exists(configured):
+        return configured
+    return shutil.which(name) or ""
+
+
+def read_urls(lines) -> list:
+    """Collect URLs from text lines, skipping blanks and # comments"""
+    urls = []
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            urls.append(line)
+    return urls
+
+
+def make_task(url: str, settings: dict, options: dict = None) -> DownloadTask:
+    """Create a queued task for a URL using the current settings.
+
+    `options` may override "format", "priority" and "weight" for this task, and
+    may carry a "preset" dict (as stored in settings.json) applied on top.
+    """
+    options = options or {}
+    preset = options.get("preset") or {}
+    task_settings = {**settings, **preset}
+    format_choice = options.get("format") or task_settings.get("format_choice", "mp4")
+    task = DownloadTask(
+        url=url,
+        path=output_template(task_settings, format_choice),
+        format_choice=format_choice,
+        platform=downloader_core.detect_platform(url)
+    )
+    task.overrides = preset_overrides(preset)
+    try:
+        task.priority = int(options.get("priority", task.priority))
+        task.weight = float(options.get("weight", task.weight))
+    except (TypeError, ValueError):
+        pass
+    return task
+
+
+def download_settings(settings: dict) -> dict:
+    """Subset of settings passed to each download, as the GUIs build it"""
+    return {
+        "quality_choice": settings.get("quality_choice", "best"),
+        "audio_codec": settings.get("audio_codec", "mp3"),
+        "audio_bitrate": settings.get("audio_bitrate", "192k"),
+        "embed_thumbnail": settings.get("embed_thumbnail", True),
+        "embed_metadata": settings.get("embed_metadata", True),
+        "subtitles": settings.get("subtitles", False),
+        "auto_subtitles": settings.get("auto_subtitles", False),
+        "subtitle_langs": settings.get("subtitle_langs", "en.*"),
+        "retry_count": settings.get("retry_count", 2),
+        "retry_delay": settings.get("retry_delay", 3),
+        "task_logs": settings.get("task_logs", True)
+    }
+
+
+class ProgressPrinter:
+    """Prints one compact line per state change, and periodic progress for running tasks"""
+
+    def __init__(self, stream=None, quiet: bool = False, interval: float = PROGRESS_INTERVAL):
+        self.stream = stream or sys.stderr
+        self.quiet = quiet
+        self.interval = interval
+        self.tasks = []
+        self._seen = {}
+        self._last_progress = {}
+        self._lock = threading.Lock()
+
+    def track(self, task: DownloadTask):
+        with self._lock:
+            self.tasks.append(task)
+
+    def _label(self, task: DownloadTask) -> str:
+        return task.url if len(task.url) <= 60 else task.url[:57] + "..."
+
+    def _write(self, text: str):
+        try:
+            self.stream.write(text + "\n")
+            self.stream.flush()
+        except Exception:
+            pass
+
+    def poll(self):
+        """Print anything that changed since the last poll"""
+        now = time.monotonic()
+        with self._lock:
+            tasks = list(self.tasks)
+        for task in tasks:
+            key = id(task)
+            status = task.status
+            if self._seen.get(key) != status:
+                self._seen[key] = status
+                if status in STATUS_MARKS:
+                    line = f"[{STATUS_MARKS[status]}] {self._label(task)}"
+                    if status == DownloadStatus.FAILED:
+                        reason = task.error_class or "error"
+                        line += f" ({reason}{': ' + task.last_error if task.last_error else ''})"
+                    self._write(line)
+                    continue
+            if self.quiet or status != DownloadStatus.DOWNLOADING:
+                continue
+            if now - self._last_progress.get(key, 0) >= self.interval and task.progress > 0:
+                self._last_progress[key] = now
+                self._write(f"[{task.progress:5.1f}%] {task.speed:>11} ETA {task.eta} {self._label(task)}")
+
+    def counts(self) -> dict:
+        with self._lock:
+            tasks = list(self.tasks)
+        counts = {}
+        for task in tasks:
+            counts[task.status] = counts.get(task.status, 0) + 1
+        return counts
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m downloader_cli",
+        description="Download media without the GUI."
+    )
+    parser.add_argument("urls", nargs="*", help="URLs to download")
+    parser.add_argument("-i", "--input", metavar="FILE", help="read URLs from FILE, one per line ('-' for stdin)")
+    parser.add_argument("-o", "--output", metavar="DIR", help="download folder")
+    parser.add_argument("-f", "--format", choices=sorted(set(FORMATS.values())), help="output format")
+    parser.add_argument("-q", "--quality", help="quality, e.g. best or 1080p")
+    parser.add_argument("-j", "--jobs", type=int, metavar="N", help="concurrent downloads")
+    parser.add_argument("--retries", type=int, metavar="N", help="retry count for transient errors")
+    parser.add_argument("--limit-rate", metavar="RATE", help="global bandwidth limit, e.g. 5M")
+    parser.add_argument("--settings", default=SETTINGS_FILE, metavar="PATH", help="settings file (default: %(default)s)")
+    parser.add_argument("--yt-dlp", dest="ytdlp", metavar="PATH", help="yt-dlp binary")
+    parser.add_argument("--ffmpeg", metavar="PATH", help="ffmpeg binary")
+    parser.add_argument("--daemon", action="store_true", help="keep running and read new URLs from stdin until stopped")
+    parser.add_argument("--quiet", action="store_true", help="only print finished tasks and the summary")
+    parser.add_argument(
+        "--serve", nargs="?", const="", metavar="HOST:PORT",
+        help="run the HTTP job API (default: api_host/api_port from settings); implies --daemon"
+    )
+    parser.add_argument("--queue-db", metavar="PATH", help="shared job queue file; URLs given are added to it and the command exits")
+    parser.add_argument("--worker", action="store_true", help="claim and run jobs from --queue-db until it is drained")
+    parser.add_argument(
+        "--watch", action="append", default=[], metavar="DIR[=PRESET]",
+        help="watch DIR for .txt/.csv URL lists, optionally with a preset (repeatable; adds to watch_folders); implies --daemon"
+    )
+    parser.add_argument("--worker-id", metavar="NAME", help="worker name recorded in the shared queue (default: host-pid)")
+    return parser
+
+
+def apply_overrides(settings: dict, args) -> dict:
+    """Overlay command line options on the loaded settings"""
+    if args.output:
+        settings["download_folder"] = args.output
+    if args.format:
+        settings["format_choice"] = args.format
+    if args.quality:
+        settings["quality_choice"] = args.quality
+    if args.jobs:
+        settings["max_concurrent"] = args.jobs
+    if args.retries is not None:
+        settings["retry_count"] = args.retries
+    if args.limit_rate:
+        settings["bandwidth_limit"] = args.limit_rate
+    return settings
+
+
+def _valid_quality(quality: str) -> bool:
+    return str(quality).lower() in {q.lower() for q in QUALITY_OPTIONS}
+
+
+class CLIApp:
+    """Wires settings, manager, scheduler and progress output together"""
+
+    def __init__(self, settings: dict, stream=None, quiet: bool = False):
+        self.settings = settings
+        self.manager = DownloadManager(
+            max_downloads=max(1, int(settings.get("max_concurrent", 3))),
+            bandwidth_limit=settings.get("bandwidth_limit", 0),
+            bandwidth_schedule=settings.get("bandwidth_schedule", [])
+        )
+        self.printer = ProgressPrinter(stream, quiet)
+        self.runner = QueueRunner(self.manager, download_settings(settings))
+        self.server = None
+        self.worker = None
+        self.watcher = None
+        self.interrupted = threading.Event()
+
+    def serve(self, host: str, port: int):
+        """Start the HTTP job API on the same manager and scheduler"""
+        from job_server import JobServer
+        self.server = JobServer(self.manager, self.add_url, host, port)
+        for task in list(self.printer.tasks):
+            self.server.track(task)
+        self.server.start()
+        return self.server
+
+    def join_queue(self, path: str, worker_id: str = None):
+        """Claim jobs from a shared queue instead of only local URLs"""
+        from job_queue import SharedJobQueue, QueueWorker
+        self.worker = QueueWorker(SharedJobQueue(path), self.manager, self.add_url, worker_id)
+        self.worker.start()
+        return self.worker
+
+    def watch(self, folders: list):
+        """Queue URLs from list files dropped into the given folders"""
+        from watch_folder import FolderWatcher
+        self.watcher = FolderWatcher(folders, self.settings, self._add_watched_urls, self._on_watched_file)
+        self.watcher.start()
+        return self.watcher
+
+    def _add_watched_urls(self, urls: list, folder: dict) -> int:
+        """Queue URLs until the queue is full; returns how many were ingested"""
+        options = {"preset": folder.get("preset") or {}}
+        for index, url in enumerate(urls):
+            if self.manager.find_task_by_url(url):
+                continue
+            if self.add_url(url, options) is None:
+                # Full; the watcher waits and offers the rest again
+                return index
+        return len(urls)
+
+    def _on_watched_file(self, path: str, ok: bool, count: int):
+        if ok:
+            self.printer._write(f"[watch] queued {count} URL(s) from {os.path.basename(path)}")
+        else:
+            self.printer._write(f"[watch] no URLs queued from {os.path.basename(path)}; moved to failed/")
+
+    def is_idle(self) -> bool:
+        if not self.runner.is_idle():
+            return False
+        return self.worker is None or (self.worker.is_idle() and self.worker.queue.pending() == 0)
+
+    def add_url(self, url: str, options: dict = None):
+        """Queue a URL, skipping ones already queued or running; returns the task or None"""
+        if self.manager.find_task_by_url(url):
+            return None
+        task = make_task(url, self.settings, options)
+        if not self.manager.add_task(task):
+            return None
+        self.printer.track(task)
+        if self.server:
+            self.server.track(task)
+        return task
+
+    def interrupt(self, *_args):
+        self.interrupted.set()
+
+    def _feed_stdin(self):
+        for line in sys.stdin:
+            for url in read_urls([line]):
+                self.add_url(url)
+
+    def run(self, daemon: bool = False) -> int:
+        os.makedirs(os.path.expanduser(self.settings.get("download_folder", "~/Downloads")), exist_ok=True)
+        self.runner.start()
+        if daemon:
+            threading.Thread(target=self._feed_stdin, daemon=True).start()
+        try:
+            while not self.interrupted.is_set():
+                self.printer.poll()
+                if not daemon and self.is_idle():
+                    break
+                self.interrupted.wait(0.2)
+        except KeyboardInterrupt:
+            self.interrupted.set()
+
+        if self.watcher:
+            self.watcher.stop()
+        self.runner.stop()
+        if self.server:
+            self.server.stop()
+        if self.worker:
+            # Hands unfinished jobs back so other workers pick them up
+            self.worker.stop(release=True)
+        if self.interrupted.is_set():
+            self.runner.cancel_all()
+        self.printer.poll()
+        return self.finish()
+
+    def finish(self) -> int:
+        counts = self.printer.counts()
+        done = counts.get(DownloadStatus.COMPLETED, 0)
+        failed = counts.get(DownloadStatus.FAILED, 0)
+        self.printer._write(
+            f"{done} completed, {failed} failed, "
+            f"{counts.get(DownloadStatus.CANCELLED, 0)} cancelled. {self.manager.get_error_summary()}"
+        )
+        if self.interrupted.is_set():
+            return EXIT_INTERRUPTED
+        return EXIT_FAILED if failed else EXIT_OK
+
+
+def main(argv=None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    settings = apply_overrides(load_settings(args.settings), args)
+    if not _valid_quality(settings.get("quality_choice", "best")):
+        parser.print_usage(sys.stderr)
+        print(f"error: unknown quality {settings['quality_choice']!r}", file=sys.stderr)
+        return EXIT_USAGE
+
+    urls = list(args.urls)
+    if args.input:
+        try:
+            if args.input == "-":
+                urls += read_urls(sys.stdin)
+            else:
+                with open(args.input, "r", encoding="utf-8") as f:
+                    urls += read_urls(f)
+        except OSError as e:
+            print(f"error: cannot read {args.input}: {e}", file=sys.stderr)
+            return EXIT_USAGE
+    elif not urls and not args.daemon and not sys.stdin.isatty():
+        urls += read_urls(sys.stdin)
+
+    serve = None
+    if args.serve is not None:
+        args.daemon = True
+        host, _, port = args.serve.rpartition(":") if ":" in args.serve else (args.serve, "", "")
+        try:
+            serve = (host or settings.get("api_host", "127.0.0.1"), int(port or settings.get("api_port", 8765)))
+        except ValueError:
+            print(f"error: invalid --serve address {args.serve!r}", file=sys.stderr)
+            return EXIT_USAGE
+
+    if args.worker and not args.queue_db:
+        parser.print_usage(sys.stderr)
+        print("error: --worker needs --queue-db", file=sys.stderr)
+        return EXIT_USAGE
+    if args.queue_db and not args.worker:
+        if not urls:
+            parser.print_usage(sys.stderr)
+            print("error: no URLs given", file=sys.stderr)
+            return EXIT_USAGE
+        from job_queue import SharedJobQueue
+        options = {"format": args.format} if args.format else {}
+        ids = SharedJobQueue(args.queue_db).enqueue(urls, options)
+        print(f"Queued {len(ids)} job(s) in {args.queue_db}", file=sys.stderr)
+        return EXIT_OK
+
+    watch_folders = list(settings.get("watch_folders", []) or [])
+    for spec in args.watch:
+        path, _, preset = spec.rpartition("=") if "=" in spec else (spec, "", "")
+        watch_folders.append({"path": path, "preset": preset})
+    if args.watch:
+        args.daemon = True
+
+    if not urls and not args.daemon and not args.worker:
+        parser.print_usage(sys.stderr)
+        print("error: no URLs given", file=sys.stderr)
+        return EXIT_USAGE
+
+    ytdlp = resolve_tool(args.ytdlp or downloader_core.YTDLP_PATH, "yt-dlp")
+    if not ytdlp:
+        print("error: yt-dlp not found. Pass --yt-dlp or set YTDLP_PATH in config.py", file=sys.stderr)
+        return EXIT_NO_YTDLP
+    downloader_core.YTDLP_PATH = ytdlp
+    ffmpeg = resolve_tool(args.ffmpeg or config.FFMPEG_PATH, "ffmpeg")
+    if ffmpeg:
+        downloader_core.FFMPEG_PATH = ffmpeg
+
+    app = CLIApp(settings, quiet=args.quiet)
+    for url in urls:
+        app.add_url(url)
+    if args.worker:
+        app.join_queue(args.queue_db, args.worker_id)
+    if watch_folders and args.daemon:
+        watcher = app.watch(watch_folders)
+        for folder in watcher.folders:
+            print(f"Watching {folder['path']} ({watcher.backend})", file=sys.stderr)
+    if serve:
+        try:
+            server = app.serve(*serve)
+        except OSError as e:
+            print(f"error: cannot listen on {serve[0]}:{serve[1]}: {e}", file=sys.stderr)
+            return EXIT_USAGE
+        host, port = server.address
+        print(f"Job API listening on http://{host}:{port}", file=sys.stderr)
+
+    previous = {}
+    for sig in (signal.SIGINT, getattr(signal, "SIGTERM", None)):
+        if sig is not None:
+            try:
+                previous[sig] = signal.signal(sig, app.interrupt)
+            except ValueError:
+                # Not on the main thread (e.g. embedded); Ctrl+C still raises KeyboardInterrupt
+                pass
+    try:
+        return app.run(daemon=args.daemon)
+    finally:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,31 @@
 """Core download functionality"""
 
 import os
+import signal
 import subprocess
 import threading
 import time
+from collections import deque
 from download_manager import DownloadTask, DownloadStatus
 from config import YTDLP_PATH, FFMPEG_PATH
-from tkinter import messagebox
+from bandwidth import format_rate
+from error_classifier import ErrorClass, classify_output, is_transient, last_error_line, parse_retry_after
+from media_info import parse_media_info
+from log_router import LogRouter, get_log_writer
 import re
 
+# Output lines kept per attempt for classifying failures
+ERROR_TAIL_LINES = 50
+
+# Backoff floor for 429 responses that carry no Retry-After hint
+RATE_LIMIT_BACKOFF = 30
+
+# URLs handed to one yt-dlp -j process; keeps command lines well under Windows' limit
+METADATA_BATCH_SIZE = 25
+
+# yt-dlp error lines name the extractor and the media id: "ERROR: [youtube] abc123: ..."
+_YTDLP_ERROR_PATTERN = re.compile(r"^ERROR: \[[^\]]+\] ([^:\s]+): (.*)")
+
 SPEED_MULTIPLIERS = {
     "B/s": 1,
     "KiB/s": 1024,
@@ -103,6 +120,22 @@ def get_output_extension(format_choice: str) -> str:
     }
     return ext_map.get(format_choice, "")
 
+def output_template(settings: dict, format_choice: str) -> str:
+    """Turn the filename_template setting into a yt-dlp output template.
+
+    Used when there is no preview info to build a filename from; yt-dlp fills
+    in the fields itself.
+    """
+    template = settings.get("filename_template", "{title} - {uploader}")
+    template = (
+        template.replace("{title}", "%(title)s")
+        .replace("{uploader}", "%(uploader)s")
+        .replace("{date}", "%(upload_date)s")
+    )
+    folder = os.path.expanduser(settings.get("download_folder", "~/Downloads"))
+    ext = get_output_extension(format_choice) or ".%(ext)s"
+    return os.path.join(folder, template + ext)
+
 def parse_progress(line: str) -> dict:
     """Parse yt-dlp progress line"""
     result = {
@@ -133,8 +166,162 @@ def parse_progress(line: str) -> dict:
 
     return result
 
-def fetch_media_info(url: str, log_callback=None) -> dict:
-    """Fetch media metadata using yt-dlp"""
+# Intermediate files yt-dlp and ffmpeg leave behind while a download is in flight
+PARTIAL_OUTPUT_PATTERN = re.compile(
+    r"(\.part(-Frag\d+)?|\.ytdl|\.temp|\.tmp|\.f\d+\.\w+(\.part)?)$",
+    re.IGNORECASE
+)
+
+def process_group_kwargs() -> dict:
+    """Popen arguments that start a child in its own process group (POSIX session)"""
+    if os.name == 'nt':
+        return {"creationflags": subprocess.CREATE_NO_WINDOW | subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+def signal_process_group(process, sig) -> bool:
+    """Send a signal to every process in the child's group"""
+    if process is None or os.name == 'nt':
+        return False
+    try:
+        os.killpg(process.pid, sig)
+        return True
+    except (ProcessLookupError, PermissionError, OSError):
+        return False
+
+def _process_group_alive(pgid: int) -> bool:
+    """Check whether any live (non-zombie) process remains in a group"""
+    if os.path.isdir("/proc/self"):
+        # Orphaned zombies still answer killpg(0); /proc tells them apart
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entry}/stat", "rb") as f:
+                    stat = f.read()
+                fields = stat[stat.rindex(b")") + 2:].split()
+                if int(fields[2]) == pgid and fields[0] != b"Z":
+                    return True
+            except Exception:
+                continue
+        return False
+    try:
+        os.killpg(pgid, 0)
+        return True
+    except (ProcessLookupError, PermissionError, OSError):
+        return False
+
+def terminate_process_tree(process, timeout: float = 3.0, on_exit=None):
+    """Terminate a child and all of its descendants without blocking the caller.
+
+    Sends SIGTERM to the whole process group, escalates to SIGKILL once
+    `timeout` expires and reaps the child in a background thread. `on_exit`
+    runs in that thread after the group is gone.
+    """
+    if process is None:
+        if on_exit:
+            on_exit()
+        return None
+
+    if os.name == 'nt':
+        def _reap():
+            try:
+                subprocess.run(
+                    ['taskkill', '/T', '/F', '/PID', str(process.pid)],
+                    capture_output=True,
+                    timeout=timeout,
+                    creationflags=subprocess.CREATE_NO_WINDOW
+                )
+            except Exception:
+                try:
+                    process.kill()
+                except Exception:
+                    pass
+            try:
+                process.wait(timeout=timeout)
+            except Exception:
+                pass
+            if on_exit:
+                on_exit()
+    else:
+        pgid = process.pid
+        signal_process_group(process, signal.SIGTERM)
+        # Throttled downloads may be stopped; they only act on SIGTERM once continued
+        signal_process_group(process, signal.SIGCONT)
+
+        def _reap():
+            deadline = time.monotonic() + timeout
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except Exception:
+                pass
+            while _process_group_alive(pgid) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            if process.poll() is None or _process_group_alive(pgid):
+                try:
+                    os.killpg(pgid, signal.SIGKILL)
+                except Exception:
+                    pass
+                try:
+                    process.wait(timeout=timeout)
+                except Exception:
+                    pass
+                # Reparented descendants are reaped by init; wait until they are gone
+                kill_deadline = time.monotonic() + timeout
+                while _process_group_alive(pgid) and time.monotonic() < kill_deadline:
+                    time.sleep(0.05)
+            if on_exit:
+                on_exit()
+
+    thread = threading.Thread(target=_reap, daemon=True)
+    thread.start()
+    return thread
+
+def stop_task_process(task: DownloadTask, timeout: float = 3.0, on_exit=None):
+    """Stop the process tree behind a task (cancel or pause) without blocking"""
+    return terminate_process_tree(task.process if task else None, timeout, on_exit)
+
+def cleanup_partial_outputs(task: DownloadTask):
+    """Remove the partial files a cancelled download left in its output folder"""
+    output_dir = os.path.dirname(task.path)
+    base_name = os.path.splitext(os.path.basename(task.path))[0]
+    if not base_name or not os.path.isdir(output_dir):
+        return
+    started = task.start_time.timestamp()
+    for file in os.listdir(output_dir):
+        # The exact stem only: "Song" must not match a running "Song (Live)"
+        if not file.startswith(base_name + "."):
+            continue
+        file_path = os.path.join(output_dir, file)
+        try:
+            # Only touch files this attempt wrote, never an older completed download
+            if os.path.getmtime(file_path) < started - 1:
+                continue
+            if file == os.path.basename(task.path) or PARTIAL_OUTPUT_PATTERN.search(file):
+                os.remove(file_path)
+        except Exception:
+            pass
+
+def lower_process_priority(process):
+    """Drop a running child to background CPU priority"""
+    try:
+        if os.name == 'nt':
+            import ctypes
+            BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
+            handle = ctypes.windll.kernel32.OpenProcess(0x0200, False, process.pid)  # PROCESS_SET_INFORMATION
+            if handle:
+                ctypes.windll.kernel32.SetPriorityClass(handle, BELOW_NORMAL_PRIORITY_CLASS)
+                ctypes.windll.kernel32.CloseHandle(handle)
+        else:
+            os.setpriority(os.PRIO_PROCESS, process.pid, 10)
+    except Exception:
+        pass
+
+def fetch_media_info(url: str, log_callback=None, cancel_event=None, low_priority: bool = False) -> dict:
+    """Fetch media metadata using yt-dlp, as the compact model from media_info.
+
+    Setting `cancel_event` kills the yt-dlp process and returns {}.
+    `low_priority` runs yt-dlp at background CPU priority (for prefetching).
+    """
     if not os.path.exists(YTDLP_PATH):
         if log_callback:
             log_callback("yt-dlp not found. Check YTDLP_PATH in config.py\n")
@@ -144,13 +331,10 @@ def fetch_media_info(url: str, log_callback=None) -> dict:
         if "spotify.com" in url:
             try:
                 import urllib.parse
-                import urllib.request
-                import json
+                from http_client import get_http_client
 
                 oembed_url = "https://open.spotify.com/oembed?url=" + urllib.parse.quote(url, safe="")
-                with urllib.request.urlopen(oembed_url, timeout=10) as response:
-                    data = response.read()
-                payload = json.loads(data.decode("utf-8"))
+                payload = get_http_client().get_json(oembed_url)
                 return {
                     "title": payload.get("title") or "Spotify Track",
                     "uploader": payload.get("provider_name") or "Spotify",
@@ -162,24 +346,145 @@ def fetch_media_info(url: str, log_callback=None) -> dict:
                 if log_callback:
                     log_callback(f"Spotify preview failed: {e}\n")
 
-        process = subprocess.run(
+        process = subprocess.Popen(
             [YTDLP_PATH, "-J", "--no-warnings", url],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            **process_group_kwargs()
         )
-        if process.returncode == 0 and process.stdout:
-            import json
-            return json.loads(process.stdout)
+        if low_priority:
+            lower_process_priority(process)
+        while True:
+            try:
+                stdout, stderr = process.communicate(timeout=0.2)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel_event is not None and cancel_event.is_set():
+                    terminate_process_tree(process, timeout=1.0)
+                    return {}
+        if cancel_event is not None and cancel_event.is_set():
+            return {}
+        if process.returncode == 0 and stdout:
+            return parse_media_info(stdout)
         if log_callback:
-            err = process.stderr.strip() if process.stderr else "Unknown error"
+            err = stderr.strip() if stderr else "Unknown error"
             log_callback(f"yt-dlp preview failed: {err}\n")
     except Exception as e:
         if log_callback:
             log_callback(f"yt-dlp preview error: {e}\n")
     return {}
 
-def build_command(task: DownloadTask, settings: dict) -> list:
+def is_batchable(url: str) -> bool:
+    """Single videos can share a yt-dlp -j run; playlists (one line per entry) and Spotify cannot"""
+    if "spotify.com" in url:
+        return False
+    if "list=" in url:
+        return False
+    return "/playlist" not in url and "/sets/" not in url
+
+
+def fetch_media_info_batch(urls: list, on_result, log_callback=None, cancel_event=None) -> int:
+    """Fetch metadata for several single-video URLs with one yt-dlp process.
+
+    yt-dlp works through the URLs in order and prints one JSON line per video,
+    so `on_result(url, info)` is called as each one completes. URLs that failed
+    get {} as soon as a later URL answers (or when the process exits), and
+    their error is logged. Returns the number of URLs that succeeded.
+    """
+    pending = list(dict.fromkeys(urls))
+    if not pending:
+        return 0
+    if not os.path.exists(YTDLP_PATH):
+        if log_callback:
+            log_callback("yt-dlp not found. Check YTDLP_PATH in config.py\n")
+        for url in pending:
+            on_result(url, {})
+        return 0
+
+    errors = {}
+    error_lines = []
+
+    def _read_errors(stream):
+        for line in stream:
+            match = _YTDLP_ERROR_PATTERN.match(line.strip())
+            if match:
+                errors[match.group(1)] = match.group(2)
+            if line.startswith("ERROR:"):
+                error_lines.append(line.strip())
+
+    def _log_failures(urls):
+        # Only called once stderr has been read, so each URL gets its own ERROR line
+        if log_callback:
+            for url in urls:
+                media_id = next((key for key in errors if key in url), None)
+                log_callback(f"yt-dlp preview failed for {url}: {errors.get(media_id) or 'no result'}\n")
+
+    succeeded = 0
+    failed = []
+    try:
+        process = subprocess.Popen(
+            [YTDLP_PATH, "-j", "--no-warnings", "--"] + pending,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            errors="replace",
+            **process_group_kwargs()
+        )
+    except Exception as e:
+        if log_callback:
+            log_callback(f"yt-dlp preview error: {e}\n")
+        for url in pending:
+            on_result(url, {})
+        return 0
+
+    stderr_thread = threading.Thread(target=_read_errors, args=(process.stderr,), daemon=True)
+    stderr_thread.start()
+    if cancel_event is not None:
+        def _watch_cancel():
+            while process.poll() is None:
+                if cancel_event.wait(0.2):
+                    terminate_process_tree(process, timeout=1.0)
+                    return
+        threading.Thread(target=_watch_cancel, daemon=True).start()
+
+    try:
+        for line in process.stdout:
+            if not line.startswith("{"):
+                continue
+            try:
+                info = parse_media_info(line)
+            except ValueError:
+                continue
+            source = info.get("original_url") or info.get("webpage_url") or ""
+            if source in pending:
+                index = pending.index(source)
+            else:
+                media_id = str(info.get("id") or "")
+                index = next((i for i, url in enumerate(pending) if media_id and media_id in url), None)
+                if index is None:
+                    # Can't tell which URL this belongs to; failing the others on its account would be a guess
+                    continue
+            # Everything before this URL was tried first and produced nothing
+            for url in pending[:index]:
+                failed.append(url)
+                on_result(url, {})
+            url = pending[index]
+            del pending[:index + 1]
+            succeeded += 1
+            on_result(url, info)
+    finally:
+        process.wait()
+        stderr_thread.join(timeout=1.0)
+    if not (cancel_event is not None and cancel_event.is_set()):
+        for url in pending:
+            failed.append(url)
+            on_result(url, {})
+    _log_failures(failed)
+    return succeeded
+
+def build_command(task: DownloadTask, settings: dict, rate_limit: float = 0) -> list:
     """Build yt-dlp command based on task and settings"""
     format_args = get_format_args(
         task.format_choice,
@@ -211,51 +516,114 @@ def build_command(task: DownloadTask, settings: dict) -> list:
         cmd.extend(["--sub-langs", langs])
         cmd.append("--embed-subs")
 
+    if rate_limit and rate_limit > 0:
+        cmd.extend(["--limit-rate", format_rate(rate_limit)])
+
     if format_args:
         cmd.extend(format_args)
 
     cmd.append(task.url)
     return cmd
 
-def download_task(task: DownloadTask, manager, settings: dict, on_progress_callback=None, on_log_callback=None):
-    """Execute a download task"""
+def _throttle_process(process, task: DownloadTask, delay: float):
+    """Hold a running download back for `delay` seconds to keep it within its bandwidth share"""
+    if os.name == 'nt' or delay <= 0:
+        return
+    if not signal_process_group(process, signal.SIGSTOP):
+        return
+    try:
+        deadline = time.monotonic() + delay
+        while time.monotonic() < deadline:
+            if task.status in [DownloadStatus.CANCELLED, DownloadStatus.PAUSED]:
+                break
+            time.sleep(min(0.1, max(0.0, deadline - time.monotonic())))
+    finally:
+        signal_process_group(process, signal.SIGCONT)
+
+def _wait_before_retry(task: DownloadTask, delay: float) -> bool:
+    """Sleep before a retry; returns False if the task was cancelled or paused meanwhile"""
+    deadline = time.monotonic() + delay
+    while time.monotonic() < deadline:
+        if task.status in [DownloadStatus.CANCELLED, DownloadStatus.PAUSED]:
+            return False
+        time.sleep(min(0.25, max(0.0, deadline - time.monotonic())))
+    return task.status not in [DownloadStatus.CANCELLED, DownloadStatus.PAUSED]
+
+def _stop_interrupted(task: DownloadTask, process):
+    """Tear down the process tree of a cancelled or paused task"""
+    if task.status == DownloadStatus.CANCELLED:
+        terminate_process_tree(process, on_exit=lambda: cleanup_partial_outputs(task))
+    else:
+        terminate_process_tree(process)
+
+def download_task(task: DownloadTask, manager, settings: dict, on_progress_callback=None, on_log_callback=None,
+                  on_error_callback=None):
+    """Execute a download task.
+
+    Output goes through a LogRouter: `on_log_callback` gets sampled progress and
+    other lines, `on_error_callback` (if given) gets warnings and errors, and the
+    full output is kept in a per-task log file unless "task_logs" is off.
+    """
+    if task.overrides:
+        settings = {**settings, **task.overrides}
+    budget = getattr(manager, "bandwidth", None)
+    budget_key = id(task)
+    if budget:
+        budget.register(budget_key, task.weight, task.priority)
+    router = LogRouter(
+        task.task_id, on_log_callback, on_error_callback,
+        writer=get_log_writer() if settings.get("task_logs", True) else None
+    )
+    try:
+        _run_download_attempts(task, manager, settings, budget, budget_key, on_progress_callback, router)
+    finally:
+        router.close()
+        if budget:
+            budget.unregister(budget_key)
+
+def _run_download_attempts(task, manager, settings, budget, budget_key, on_progress_callback, on_log_callback):
+    """Run yt-dlp for a task, retrying failed attempts"""
     retry_count = int(settings.get("retry_count", 0))
     retry_delay = int(settings.get("retry_delay", 2))
     attempts = 0
-
     while attempts <= retry_count:
         try:
             task.platform = detect_platform(task.url)
             task.status = DownloadStatus.DOWNLOADING
+            manager.mark_dirty(task)
 
             if task.platform in ["Instagram", "Facebook"] and "private" in task.url:
                 task.status = DownloadStatus.FAILED
                 if on_log_callback:
                     on_log_callback("Error: Private post not supported\n")
+                manager.record_error(task, ErrorClass.PRIVATE.value, retrying=False)
                 manager.complete_task(task, False)
                 return
 
-            cmd = build_command(task, settings)
+            # yt-dlp cannot change --limit-rate while running, so the start-time share is only
+            # used where processes cannot be suspended; elsewhere the share is enforced live
+            start_limit = budget.share_for(budget_key) if budget and os.name == 'nt' else 0
+            cmd = build_command(task, settings, start_limit)
 
+            # Own process group so cancel reaches ffmpeg children spawned for merging
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+                **process_group_kwargs()
             )
 
             task.process = process
+            output_tail = deque(maxlen=ERROR_TAIL_LINES)
 
             for line in process.stdout:
                 if task.status in [DownloadStatus.CANCELLED, DownloadStatus.PAUSED]:
-                    try:
-                        process.terminate()
-                    except Exception:
-                        pass
+                    _stop_interrupted(task, process)
                     return
                 if on_log_callback:
                     on_log_callback(line)
+                output_tail.append(line)
 
                 if "[download]" in line and "%" in line:
                     prog_data = parse_progress(line)
@@ -268,6 +636,8 @@ def download_task(task: DownloadTask, manager, settings: dict, on_progress_callb
                                 task.speed_history.pop(0)
                             avg_speed = sum(task.speed_history) / len(task.speed_history)
                             prog_data["speed"] = _format_speed(avg_speed)
+                            if budget:
+                                _throttle_process(process, task, budget.throttle_delay(budget_key, speed_val))
                     manager.update_progress(
                         task,
                         prog_data["progress"],
@@ -278,15 +648,13 @@ def download_task(task: DownloadTask, manager, settings: dict, on_progress_callb
                         on_progress_callback(task)
 
             if task.status in [DownloadStatus.CANCELLED, DownloadStatus.PAUSED]:
+                _stop_interrupted(task, process)
                 return
 
             try:
                 process.wait(timeout=5)
             except Exception:
-                try:
-                    process.kill()
-                except Exception:
-                    pass
+                terminate_process_tree(process, timeout=1.0)
                 return
 
             if process.returncode == 0:
@@ -296,29 +664,52 @@ def download_task(task: DownloadTask, manager, settings: dict, on_progress_callb
                     on_log_callback("âœ“ Download completed successfully!\n")
                 return
 
+            error_class = classify_output(output_tail)
+            task.last_error = last_error_line(output_tail)
             attempts += 1
+            if not is_transient(error_class):
+                # Permanent errors fail the same way on every attempt
+                manager.record_error(task, error_class.value, retrying=False)
+                manager.complete_task(task, False)
+                if on_log_callback:
+                    on_log_callback(f"âœ— Download failed: {error_class.value} (not retried)\n")
+                return
+
             if attempts <= retry_count:
+                manager.record_error(task, error_class.value, retrying=True)
+                delay = retry_delay
+                if error_class == ErrorClass.RATE_LIMITED:
+                    hint = parse_retry_after(output_tail)
+                    delay = hint if hint is not None else max(retry_delay, RATE_LIMIT_BACKOFF) * attempts
                 if on_log_callback:
-                    on_log_callback(f"Retrying in {retry_delay}s... ({attempts}/{retry_count})\n")
-                time.sleep(retry_delay)
+                    on_log_callback(f"{error_class.value}: retrying in {delay:g}s... ({attempts}/{retry_count})\n")
+                if not _wait_before_retry(task, delay):
+                    return
             else:
+                manager.record_error(task, error_class.value, retrying=False)
                 manager.complete_task(task, False)
                 if on_log_callback:
-                    on_log_callback("âœ— Download failed\n")
+                    on_log_callback(f"âœ— Download failed: {error_class.value}\n")
                 return
 
         except Exception as e:
             attempts += 1
+            task.last_error = str(e)
             if on_log_callback:
                 on_log_callback(f"Error: {str(e)}\n")
             if attempts > retry_count:
                 task.status = DownloadStatus.FAILED
+                manager.record_error(task, ErrorClass.UNKNOWN.value, retrying=False)
                 manager.complete_task(task, False)
                 return
+            manager.record_error(task, ErrorClass.UNKNOWN.value, retrying=True)
 
 
-def convert_file(input_file: str, output_format: str, quality: str, sample_rate: str, ffmpeg_path: str, log_callback=None, output_file_path=None, gif_mode="reduce_fps") -> bool:
-    """Convert a file using available tools (ffmpeg, Pillow, cairosvg)."""
+def convert_file(input_file: str, output_format: str, quality: str, sample_rate: str, ffmpeg_path: str, log_callback=None, output_file_path=None, gif_mode="reduce_fps", cancel_event=None) -> bool:
+    """Convert a file using available tools (ffmpeg, Pillow, cairosvg).
+
+    Setting `cancel_event` kills a running ffmpeg and returns False.
+    """
     def log(msg: str):
         if log_callback:
             log_callback(msg)
@@ -790,19 +1181,29 @@ def convert_file(input_file: str, output_format: str, quality: str, sample_rate:
                 cmd.extend(["-b:v", val])
 
         cmd.extend(["-y", output_file])
-        result = subprocess.run(
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
-            creationflags=subprocess.CREATE_NO_WINDOW if os.name == 'nt' else 0
+            **process_group_kwargs()
         )
-
-        if result.returncode == 0 and os.path.exists(output_file):
+        while True:
+            try:
+                _, stderr = process.communicate(timeout=0.2)
+                break
+            except subprocess.TimeoutExpired:
+                if cancel_event is not None and cancel_event.is_set():
+                    terminate_process_tree(process, timeout=1.0)
+                    log("Conversion cancelled.\n")
+                    return False
+
+        if process.returncode == 0 and os.path.exists(output_file):
             log(f"âœ“ Converted: {os.path.basename(output_file)}\n")
             return True
 
-        if result.stderr:
-            log(result.stderr + "\n")
+        if stderr:
+            log(stderr + "\n")
         return False
     except Exception as e:
         log(f"Conversion failed: {e}\n")
@@ -818,3 +1219,72 @@ def start_download_thread(task: DownloadTask, manager, settings: dict, on_progre
     thread.start()
     return thread
 
+class QueueRunner:
+    """Headless scheduler that starts queued tasks as download slots free up.
+
+    The GUIs drive the queue from their own timers; this is the equivalent
+    for the CLI and daemon entry points.
+    """
+
+    def __init__(self, manager, settings: dict, on_progress=None, on_log=None, poll_interval: float = 0.5):
+        self.manager = manager
+        self.settings = settings
+        self.on_progress = on_progress
+        self.on_log = on_log
+        self.poll_interval = poll_interval
+        self.threads = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        manager.subscribe("queue_updated", self._wake.set)
+        manager.subscribe("download_completed", self._wake.set)
+
+    def start(self):
+        """Start scheduling in a background thread"""
+        if self._thread and self._thread.is_alive():
+            return self._thread
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        """Stop starting new tasks; running downloads are left alone"""
+        self._stopped.set()
+        self._wake.set()
+
+    def is_idle(self) -> bool:
+        """Check whether nothing is queued or running"""
+        return self.manager.get_queue_count() == 0 and self.manager.get_active_count() == 0
+
+    def wait_until_idle(self, timeout: float = None) -> bool:
+        """Block until the queue has drained; returns False on timeout or stop"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while not self._stopped.is_set():
+            if self.is_idle():
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.1)
+        return False
+
+    def cancel_all(self):
+        """Cancel every queued and running task"""
+        for task in list(self.manager.queue) + list(self.manager.active_downloads):
+            self.manager.cancel_task(task)
+            stop_task_process(task)
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            while self.manager.get_active_count() < self.manager.max_downloads:
+                task = self.manager.get_next_task()
+                if not task:
+                    break
+                task.status = DownloadStatus.DOWNLOADING
+                log = (lambda msg, t=task: self.on_log(t, msg)) if self.on_log else None
+                self.threads[id(task)] = start_download_thread(
+                    task, self.manager, self.settings, self.on_progress, log
+                )
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+            self.threads = {key: thread for key, thread in self.threads.items() if thread.is_alive()}
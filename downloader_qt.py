@@ -2,9 +2,11 @@
 
 import os
 import json
-import uuid
 import sys
 import subprocess
+import itertools
+import threading
+import time
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
@@ -13,28 +15,42 @@ from PySide6.QtWidgets import (
     QSpinBox, QComboBox
 )
 from PySide6.QtCore import Qt, QTimer, Signal, QObject, QThread, QRunnable, QThreadPool, Slot
-from PySide6.QtGui import QFont, QIcon, QAction, QPixmap
-
-import pyperclip
+from PySide6.QtGui import QFont, QIcon, QAction, QPixmap, QClipboard
 
 from config import (
     BG, FG, BOX, BTN, GREEN, RED, YELLOW,
     LIGHT_BG, LIGHT_FG, LIGHT_BOX, LIGHT_BTN, LIGHT_GREEN, LIGHT_RED, LIGHT_YELLOW,
-    CHECK_CLIPBOARD_INTERVAL, SETTINGS_FILE, FORMATS, QUALITY_OPTIONS,
+    SELECTION_SETTLE_MS, SETTINGS_FILE, METADATA_CACHE_FILE, HISTORY_FILE, FORMATS, QUALITY_OPTIONS,
     YTDLP_PATH, FFMPEG_PATH
 )
 from download_manager import DownloadManager, DownloadTask, DownloadStatus
-from downloader_core import detect_platform, get_output_extension, fetch_media_info
+from downloader_core import (
+    detect_platform, get_output_extension, fetch_media_info, stop_task_process, output_template,
+    fetch_media_info_batch, is_batchable, METADATA_BATCH_SIZE
+)
+from watch_folder import FolderWatcher, preset_overrides
+from preview_pool import PreviewPool, DEFAULT_PREVIEW_WORKERS
+from history_store import HistoryStore
+from notifications import COALESCE_MS, CompletionSummary, get_notifier
+from metadata_cache import MetadataCache, MAX_ENTRIES
+from prefetch import Prefetcher, PREFETCH_PER_MINUTE, MAX_PENDING
+from thumbnail_cache import (
+    get_thumbnail_cache, decode_thumbnail, MemoryTier, ThumbnailLoader, DEFAULT_MAX_MB as THUMBNAIL_CACHE_MB
+)
 from ui_components_qt import (
     URLInputFrame, DownloadTableFrame, HistoryFrame, LogsFrame, AnimatedButton,
-    FileConverterDialog
+    FileConverterDialog, CompletionSummaryDialog, PREVIEW_THUMB_SIZE
 )
 
-try:
-    from plyer import notification
-    NOTIFY_AVAILABLE = True
-except Exception:
-    NOTIFY_AVAILABLE = False
+# Threads in the pool that runs downloads and conversions; the download
+# manager's own limit decides how many downloads actually start
+RUNNER_THREADS = 64
+
+# Total time closing the window waits for all running work to stop
+SHUTDOWN_DEADLINE_MS = 3000
+
+# Tasks in these states already cover their URL when it is dropped into a watched folder again
+WATCH_PENDING_STATUSES = (DownloadStatus.QUEUED, DownloadStatus.DOWNLOADING, DownloadStatus.PAUSED)
 
 
 class PreviewWorker(QThread):
@@ -58,23 +74,7 @@ class PreviewWorker(QThread):
                 thumb = info.get("thumbnail") or (info.get("thumbnails")[-1]["url"] if info.get("thumbnails") else None)
                 if thumb:
                     try:
-                        import urllib.request
-                        from PIL import Image
-                        import io
-                        
-                        with urllib.request.urlopen(thumb, timeout=10) as response:
-                            data = response.read()
-                        image = Image.open(io.BytesIO(data))
-                        image.thumbnail((96, 96))
-                        
-                        # Convert to QImage (thread-safe)
-                        img_byte_arr = io.BytesIO()
-                        image.save(img_byte_arr, format='PNG')
-                        img_byte_arr = img_byte_arr.getvalue()
-
-                        from PySide6.QtGui import QImage
-                        image_obj = QImage.fromData(img_byte_arr)
-                        self.thumbnail_ready.emit(image_obj)
+                        self.thumbnail_ready.emit(_load_thumbnail_image(thumb, 96))
                     except Exception as e:
                         self.error_signal.emit(f"Thumbnail error: {e}")
             else:
@@ -83,6 +83,68 @@ class PreviewWorker(QThread):
             self.error_signal.emit(f"Preview error: {e}")
 
 
+class WatchedBatch:
+    """Result of a watched-folder batch, filled in on the GUI thread"""
+
+    def __init__(self):
+        self.accepted = 0
+        self.done = threading.Event()
+
+
+class PreviewSignals(QObject):
+    """Signals emitted from preview pool threads"""
+    single_preview_ready = Signal(str, dict)  # url, info
+    thumbnail_loaded = Signal(str, object)  # thumbnail url, image or None
+    single_error = Signal(str)  # url
+    log_signal = Signal(str)
+
+
+# Decoded thumbnails by (thumbnail URL, size); QImage is safe to share across threads
+_thumbnail_images = MemoryTier(256)
+
+
+def _load_thumbnail_image(thumb_url: str, size: int):
+    """Fetch a thumbnail through the shared cache and scale it into a QImage (safe off the GUI thread)"""
+    key = (thumb_url, size)
+    image_obj = _thumbnail_images.get(key)
+    if image_obj is not None:
+        return image_obj
+    path = get_thumbnail_cache().fetch(thumb_url)
+    if not path:
+        raise OSError(f"could not download {thumb_url}")
+    return _thumbnail_images.put(key, _decode_thumbnail_qimage(path, size))
+
+
+def _decode_thumbnail_qimage(path: str, size: int):
+    """Decode an image file straight into a QImage that fits `size` x `size`.
+
+    Qt's reader scales while decoding (JPEGs through libjpeg's DCT scaling);
+    formats it cannot read go through Pillow, handing its RGBA pixels to
+    QImage without an intermediate encode.
+    """
+    from PySide6.QtGui import QImage, QImageReader
+
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source = reader.size()
+    if source.isValid() and max(source.width(), source.height()) > size:
+        reader.setScaledSize(source.scaled(size, size, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if not image.isNull():
+        return image
+    return _pil_to_qimage(decode_thumbnail(path, size))
+
+
+def _pil_to_qimage(image):
+    """QImage with the pixels of a Pillow image"""
+    from PySide6.QtGui import QImage
+
+    image = image.convert("RGBA")
+    data = image.tobytes("raw", "RGBA")
+    # QImage only borrows `data`; copy() gives it its own pixels before `data` is freed
+    return QImage(data, image.width, image.height, image.width * 4, QImage.Format.Format_RGBA8888).copy()
+
+
 class ConversionWorker(QThread):
     """Worker thread for MP4 to MP3 conversion"""
     log_signal = Signal(str)
@@ -131,13 +193,59 @@ class ConversionWorker(QThread):
         self.finished_signal.emit(success_count, len(self.files))
 
 
-class FileConversionWorker(QThread):
-    """Worker thread for universal file conversion"""
+class RunnerSignals(QObject):
+    """Signals of a pooled runner; QRunnable itself is not a QObject"""
     log_signal = Signal(str)
+    finished = Signal(int)  # runner key, once its work has returned
+
+
+# Runners still working when their window closed; the pool does not own them,
+# so they stay referenced here until the process exits
+_stranded_runners = []
+
+
+class PooledRunner(QRunnable):
+    """Work item for the window's runner pool.
+
+    `work` is the callable run on the pool thread. The window keeps each
+    runner (keyed by `key`) until its finished signal arrives, so the pool
+    must not delete it; `stop()` only sets `cancel_event` and never blocks.
+    """
+
+    signals_class = RunnerSignals
+    _keys = itertools.count(1)
+
+    def __init__(self, work):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.work = work
+        self.signals = self.signals_class()
+        self.cancel_event = threading.Event()
+        self.key = next(PooledRunner._keys)
+
+    def stop(self):
+        self.cancel_event.set()
+
+    def run(self):
+        try:
+            self.work()
+        except Exception as e:
+            print(f"{type(self).__name__} error: {e}")
+        finally:
+            self.signals.finished.emit(self.key)
+
+
+class FileConversionSignals(RunnerSignals):
     finished_signal = Signal(bool, str, bool)  # success, output_file, open_after
+
+
+class FileConversionRunner(PooledRunner):
+    """Converts one file on the runner pool"""
+
+    signals_class = FileConversionSignals
     
     def __init__(self, input_file, output_format, quality, sample_rate, ffmpeg_path, open_after=False, output_file_path=None, gif_mode="reduce_fps"):
-        super().__init__()
+        super().__init__(self.convert)
         self.input_file = input_file
         self.output_format = output_format
         self.quality = quality
@@ -154,33 +262,36 @@ class FileConversionWorker(QThread):
                 f"{os.path.splitext(os.path.basename(self.input_file))[0]}.{self.output_format}"
             )
     
-    def run(self):
+    def convert(self):
         from downloader_core import convert_file
         
-        def log_callback(msg):
-            self.log_signal.emit(msg)
-        
         success = convert_file(
             self.input_file,
             self.output_format,
             self.quality,
             self.sample_rate,
             self.ffmpeg_path,
-            log_callback,
+            self.signals.log_signal.emit,
             output_file_path=self.output_file,
-            gif_mode=self.gif_mode
+            gif_mode=self.gif_mode,
+            cancel_event=self.cancel_event
         )
-        self.finished_signal.emit(success, self.output_file, self.open_after)
+        if not self.cancel_event.is_set():
+            self.signals.finished_signal.emit(success, self.output_file, self.open_after)
 
 
-class BatchFileConversionWorker(QThread):
-    """Worker thread for batch file conversion"""
-    log_signal = Signal(str)
+class BatchFileConversionSignals(RunnerSignals):
     single_file_done = Signal(str, bool, str)  # output_file, success, error_msg
     finished_signal = Signal(int, int)  # completed_count, total_count
+
+
+class BatchFileConversionRunner(PooledRunner):
+    """Converts several files one after another on the runner pool"""
+
+    signals_class = BatchFileConversionSignals
     
     def __init__(self, input_files, output_format, quality, sample_rate, ffmpeg_path, output_folder=None, gif_mode="reduce_fps"):
-        super().__init__()
+        super().__init__(self.convert_all)
         self.input_files = input_files
         self.output_format = output_format
         self.quality = quality
@@ -188,23 +299,19 @@ class BatchFileConversionWorker(QThread):
         self.ffmpeg_path = ffmpeg_path
         self.output_folder = os.path.normpath(output_folder) if output_folder else ""
         self.gif_mode = gif_mode or "reduce_fps"
-        self._should_stop = False
-    
-    def stop(self):
-        """Signal thread to stop"""
-        self._should_stop = True
     
-    def run(self):
+    def convert_all(self):
         from downloader_core import convert_file
         
+        signals = self.signals
         completed_count = 0
         total_count = len(self.input_files)
         
-        self.log_signal.emit(f"Starting batch conversion of {total_count} file(s)...\n")
+        signals.log_signal.emit(f"Starting batch conversion of {total_count} file(s)...\n")
         
         for idx, input_file in enumerate(self.input_files, 1):
-            if self._should_stop:
-                self.log_signal.emit("Batch conversion cancelled\n")
+            if self.cancel_event.is_set():
+                signals.log_signal.emit("Batch conversion cancelled\n")
                 break
             
             try:
@@ -214,10 +321,7 @@ class BatchFileConversionWorker(QThread):
                     f"{os.path.splitext(os.path.basename(input_file))[0]}.{self.output_format}"
                 )
                 
-                self.log_signal.emit(f"[{idx}/{total_count}] Converting: {os.path.basename(input_file)}...\n")
-                
-                def log_callback(msg):
-                    self.log_signal.emit(msg)
+                signals.log_signal.emit(f"[{idx}/{total_count}] Converting: {os.path.basename(input_file)}...\n")
                 
                 success = convert_file(
                     input_file,
@@ -225,27 +329,28 @@ class BatchFileConversionWorker(QThread):
                     self.quality,
                     self.sample_rate,
                     self.ffmpeg_path,
-                    log_callback,
+                    signals.log_signal.emit,
                     output_file_path=output_file,
-                    gif_mode=self.gif_mode
+                    gif_mode=self.gif_mode,
+                    cancel_event=self.cancel_event
                 )
                 
                 if success:
-                    self.log_signal.emit(f"✓ Completed: {os.path.basename(output_file)}\n")
-                    self.single_file_done.emit(output_file, True, "")
+                    signals.log_signal.emit(f"✓ Completed: {os.path.basename(output_file)}\n")
+                    signals.single_file_done.emit(output_file, True, "")
                     completed_count += 1
-                else:
+                elif not self.cancel_event.is_set():
                     error_msg = f"Failed to convert {os.path.basename(input_file)}"
-                    self.log_signal.emit(f"✗ {error_msg}\n")
-                    self.single_file_done.emit(output_file, False, error_msg)
+                    signals.log_signal.emit(f"✗ {error_msg}\n")
+                    signals.single_file_done.emit(output_file, False, error_msg)
             
             except Exception as e:
                 error_msg = f"Error: {str(e)}"
-                self.log_signal.emit(f"✗ {error_msg}\n")
-                self.single_file_done.emit("", False, error_msg)
+                signals.log_signal.emit(f"✗ {error_msg}\n")
+                signals.single_file_done.emit("", False, error_msg)
         
-        self.log_signal.emit(f"\n=== Batch conversion complete: {completed_count}/{total_count} files converted ===\n")
-        self.finished_signal.emit(completed_count, total_count)
+        signals.log_signal.emit(f"\n=== Batch conversion complete: {completed_count}/{total_count} files converted ===\n")
+        signals.finished_signal.emit(completed_count, total_count)
 
 
 class UpdateResourcesWorker(QThread):
@@ -313,14 +418,19 @@ class UpdateResourcesWorker(QThread):
             self.finished_signal.emit(False, f"Update failed: {e}")
 
 
-class DownloadWorker(QThread):
-    """Worker thread for downloading media"""
+class DownloadSignals(RunnerSignals):
     progress_signal = Signal()
-    log_signal = Signal(str)
+    log_signal = Signal(str, str)  # text, task id
     completed_signal = Signal(bool)  # success
+
+
+class DownloadRunner(PooledRunner):
+    """Runs one download on the runner pool"""
+
+    signals_class = DownloadSignals
     
     def __init__(self, task, manager, settings):
-        super().__init__()
+        super().__init__(self.download)
         self.task = task
         self.manager = manager
         self.settings = settings
@@ -329,52 +439,27 @@ class DownloadWorker(QThread):
         self._log_buffer = []
         self._last_log_time = 0
         self._log_throttle = 0.2  # Emit logs max 5 times per second (reduced from 10)
-        self._should_stop = False
     
     def stop(self):
-        """Signal thread to stop - non-blocking"""
-        self._should_stop = True
+        """Signal the runner to stop - non-blocking"""
+        super().stop()
         if self.task and self.task.process:
-            # Perform process termination in background to avoid blocking UI
-            def terminate_process_async():
-                try:
-                    # Try taskkill first on Windows
-                    if os.name == 'nt':
-                        try:
-                            subprocess.run(['taskkill', '/F', '/PID', str(self.task.process.pid)], 
-                                         capture_output=True, timeout=2)
-                            return
-                        except:
-                            pass
-                    # Fallback to terminate
-                    try:
-                        self.task.process.terminate()
-                        # Wait a bit for graceful termination
-                        self.task.process.wait(timeout=2)
-                    except:
-                        try:
-                            self.task.process.kill()
-                        except:
-                            pass
-                except Exception:
-                    pass
-            
-            # Run termination in daemon thread to avoid blocking
-            import threading
-            thread = threading.Thread(target=terminate_process_async, daemon=True)
-            thread.start()
+            # Signals the whole process group (yt-dlp and its ffmpeg children) and
+            # escalates to a hard kill in a background reaper thread
+            stop_task_process(self.task)
     
-    def run(self):
+    def download(self):
         from downloader_core import download_task
         import time
-        
+
+        signals = self.signals
         try:
             def on_progress(t):
                 # Throttle progress updates to prevent UI flooding
                 now = time.time()
                 if now - self._last_progress_time >= self._progress_throttle:
                     self._last_progress_time = now
-                    self.progress_signal.emit()
+                    signals.progress_signal.emit()
             
             def on_log(msg):
                 # Buffer logs and emit in batches
@@ -385,25 +470,34 @@ class DownloadWorker(QThread):
                     if self._log_buffer:
                         combined = "".join(self._log_buffer)
                         self._log_buffer.clear()
-                        self.log_signal.emit(combined)
+                        signals.log_signal.emit(combined, self.task.task_id)
+
+            def on_error(msg):
+                # Warnings and errors skip the batching delay
+                self._log_buffer.append(msg)
+                combined = "".join(self._log_buffer)
+                self._log_buffer.clear()
+                self._last_log_time = time.time()
+                signals.log_signal.emit(combined, self.task.task_id)
             
-            # Run the download
-            download_task(self.task, self.manager, self.settings, on_progress, on_log)
+            # Run the download; progress lines are sampled and the full output goes to the task's log file
+            download_task(self.task, self.manager, self.settings, on_progress, on_log, on_error)
             
             # Flush any remaining logs
             if self._log_buffer:
                 combined = "".join(self._log_buffer)
                 self._log_buffer.clear()
-                self.log_signal.emit(combined)
+                signals.log_signal.emit(combined, self.task.task_id)
             
             # Emit completion
             success = self.task.status == DownloadStatus.COMPLETED
-            self.completed_signal.emit(success)
+            signals.completed_signal.emit(success)
         
         except Exception as e:
             # Catch any unhandled exceptions to prevent app crash
-            self.log_signal.emit(f"✗ Worker error: {str(e)}\n")
-            self.completed_signal.emit(False)
+            signals.log_signal.emit(f"✗ Worker error: {str(e)}\n", self.task.task_id)
+            signals.completed_signal.emit(False)
+
 
 
 class DownloaderAppQt(QMainWindow):
@@ -414,14 +508,22 @@ class DownloaderAppQt(QMainWindow):
     progress_signal = Signal()
     download_completed_signal = Signal()  # Thread-safe completion
     history_updated_signal = Signal()  # Thread-safe history updates
+    watch_urls_signal = Signal(list, dict, object)  # URL batch, folder, WatchedBatch for the result
     
     def __init__(self):
         super().__init__()
         
         self._is_shutting_down = False  # Flag to prevent new threads during shutdown
+        self._pending_watch_batch = None  # WatchedBatch the folder watcher is waiting on
         
         self.settings = self.load_settings()
-        self.manager = DownloadManager(max_downloads=self.settings.get("max_concurrent", 3))
+        self.history_store = HistoryStore(HISTORY_FILE)
+        self.manager = DownloadManager(
+            max_downloads=self.settings.get("max_concurrent", 3),
+            bandwidth_limit=self.settings.get("bandwidth_limit", "0"),
+            bandwidth_schedule=self.settings.get("bandwidth_schedule", []),
+            history_store=self.history_store
+        )
         self.manager.subscribe("download_progress", self.on_download_progress)
         # Emit signal instead of calling directly to ensure it runs on main thread
         self.download_completed_signal.connect(self.on_download_completed)
@@ -432,12 +534,37 @@ class DownloaderAppQt(QMainWindow):
         
         self.clipboard_enabled = self.settings.get("clipboard_enabled", False)
         self.clipboard_auto_add = self.settings.get("clipboard_auto_add", False)
+        self.clipboard_prefetch = self.settings.get("clipboard_prefetch", False)
         self.last_clip = ""
+        self._last_prefetch_clip = ""
         self.task_map = {}
+        # Downloads and conversions run on a pool; a runner stays referenced
+        # here until its finished signal arrives, so reaping never waits on a thread
+        self.runner_pool = QThreadPool(self)
+        self.runner_pool.setMaxThreadCount(RUNNER_THREADS)
+        self._runners = {}
+        self._download_runners = {}
         self.info_cache = {}
-        self.thumbnail_cache = {}
+        self.thumbnails = get_thumbnail_cache(self.settings.get("thumbnail_cache_mb", THUMBNAIL_CACHE_MB))
+        # Pixmaps can only be made and used on the GUI thread
+        self._thumbnail_pixmaps = MemoryTier(128)
         self.url_input_focused = False
         self._preview_in_progress = False
+        self.preview_pool = PreviewPool(
+            self.settings.get("preview_workers", DEFAULT_PREVIEW_WORKERS),
+            self.settings.get("preview_platform_limits")
+        )
+        self.preview_signals = PreviewSignals()
+        self.thumbnail_loader = ThumbnailLoader(self._load_preview_image, self.preview_signals.thumbnail_loaded.emit)
+        self._preview_pending = set()
+        self.metadata_cache = MetadataCache(
+            METADATA_CACHE_FILE, fetcher=fetch_media_info,
+            max_entries=self.settings.get("metadata_cache_size", MAX_ENTRIES)
+        )
+        self.prefetcher = Prefetcher(
+            self.metadata_cache, self.thumbnails, is_busy=self._is_busy_for_prefetch,
+            per_minute=self.settings.get("prefetch_per_minute", PREFETCH_PER_MINUTE)
+        )
         self._log_buffer = []
         self._log_flush_timer = QTimer()
         self._log_flush_timer.setSingleShot(True)
@@ -445,28 +572,55 @@ class DownloaderAppQt(QMainWindow):
         self._auto_preview_timer = QTimer()
         self._auto_preview_timer.setSingleShot(True)
         self._auto_preview_timer.timeout.connect(self.preview_all_media)
+        # Completions within one window share a notification and a summary dialog
+        self.notifier = get_notifier()
+        self._completion_timer = QTimer()
+        self._completion_timer.setSingleShot(True)
+        self._completion_timer.setInterval(COALESCE_MS)
+        self._completion_timer.timeout.connect(self._show_completion_ui)
+        self._completion_dialog = None
         
         # Connect signals
         self.log_signal.connect(self.add_log_safe)
         self.progress_signal.connect(self.update_all_downloads)
+        self.preview_signals.single_preview_ready.connect(self.on_single_preview_ready)
+        self.preview_signals.thumbnail_loaded.connect(self.on_preview_thumbnail_loaded)
+        self.preview_signals.single_error.connect(self.on_single_preview_error)
+        self.preview_signals.log_signal.connect(self.add_log_safe)
         
         self.setup_ui()
         self.apply_theme()
         
+        # Clipboard changes arrive as signals, so nothing runs while the clipboard is idle
+        clipboard = QApplication.clipboard()
+        clipboard.dataChanged.connect(self.check_clipboard)
+        self._selection_timer = QTimer()
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(SELECTION_SETTLE_MS)
+        self._selection_timer.timeout.connect(self.check_selection)
+        if clipboard.supportsSelection():
+            # X11 primary selection (highlighted text); fires repeatedly while a drag grows it
+            clipboard.selectionChanged.connect(self._selection_timer.start)
+        # Pick up a URL copied before the app started
+        QTimer.singleShot(0, self.check_clipboard)
+
         # Timers
-        self.clipboard_timer = QTimer()
-        self.clipboard_timer.timeout.connect(self.check_clipboard)
-        self.clipboard_timer.start(CHECK_CLIPBOARD_INTERVAL * 1000)
-        
         self.queue_timer = QTimer()
         self.queue_timer.timeout.connect(self.process_queue)
         self.queue_timer.start(1000)  # Reduced frequency from 500ms to 1000ms
+
+        # Watch folders stream URL lists from a background thread in batches
+        self.folder_watcher = None
+        self.watch_urls_signal.connect(self._add_watched_urls)
+        self._start_folder_watcher()
     
     def load_settings(self):
         settings = {
             "max_concurrent": 3,
             "clipboard_enabled": False,
             "clipboard_auto_add": False,
+            "clipboard_prefetch": False,
+            "prefetch_per_minute": PREFETCH_PER_MINUTE,
             "download_folder": "~/Downloads",
             "overwrite_policy": "ask",
             "notifications": True,
@@ -476,12 +630,18 @@ class DownloaderAppQt(QMainWindow):
             "minimize_to_tray": False,
             "retry_count": 2,
             "retry_delay": 3,
+            "bandwidth_limit": "0",
+            "bandwidth_schedule": [],
             "embed_thumbnail": True,
             "embed_metadata": True,
             "quality_choice": "best",
             "audio_codec": "mp3",
             "audio_bitrate": "320k",
-            "presets": {}
+            "presets": {},
+            "watch_folders": [],
+            "preview_workers": DEFAULT_PREVIEW_WORKERS,
+            "metadata_cache_size": MAX_ENTRIES,
+            "thumbnail_cache_mb": THUMBNAIL_CACHE_MB
         }
         
         if os.path.exists(SETTINGS_FILE):
@@ -507,10 +667,25 @@ class DownloaderAppQt(QMainWindow):
         
         try:
             # Stop timers first
-            if hasattr(self, 'clipboard_timer'):
-                self.clipboard_timer.stop()
+            try:
+                clipboard = QApplication.clipboard()
+                clipboard.dataChanged.disconnect(self.check_clipboard)
+                if clipboard.supportsSelection():
+                    clipboard.selectionChanged.disconnect(self._selection_timer.start)
+            except Exception:
+                pass
+            if hasattr(self, '_selection_timer'):
+                self._selection_timer.stop()
             if hasattr(self, 'queue_timer'):
                 self.queue_timer.stop()
+            if hasattr(self, '_completion_timer'):
+                self._completion_timer.stop()
+            if getattr(self, 'folder_watcher', None):
+                # Joined below under the shutdown deadline
+                self.folder_watcher.stop(timeout=0)
+            batch = self._pending_watch_batch
+            if batch:
+                batch.done.set()
             
             # Disconnect all signals before cleanup
             if hasattr(self, 'progress_signal'):
@@ -524,87 +699,58 @@ class DownloaderAppQt(QMainWindow):
                 except:
                     pass
             
-            # Clean up all download workers - call stop() first to kill subprocesses
-            if hasattr(self, '_download_workers'):
-                for task_id, worker in list(self._download_workers.items()):
-                    if worker:
-                        try:
-                            # Call stop() to force kill subprocess with taskkill
-                            if hasattr(worker, 'stop'):
-                                worker.stop()
-                            # Disconnect signals
-                            worker.progress_signal.disconnect()
-                            worker.log_signal.disconnect()
-                            worker.completed_signal.disconnect()
-                            worker.finished.disconnect()
-                        except:
-                            pass
-                        
-                        if worker.isRunning():
-                            worker.quit()
-                            if not worker.wait(2000):
-                                worker.terminate()
-                                worker.wait(500)
-                self._download_workers.clear()
-            
-            # Clean up bulk preview workers
-            if hasattr(self, '_bulk_preview_workers'):
-                for worker in self._bulk_preview_workers[:]:
-                    if worker:
-                        try:
-                            worker.finished.disconnect()
-                        except:
-                            pass
-                        if worker.isRunning():
-                            worker.quit()
-                            if not worker.wait(2000):
-                                worker.terminate()
-                                worker.wait(500)
-                self._bulk_preview_workers.clear()
-            
-            # Clean up file conversion worker
-            if hasattr(self, '_file_conversion_worker'):
-                if self._file_conversion_worker:
-                    try:
-                        self._file_conversion_worker.finished.disconnect()
-                    except:
-                        pass
-                    if self._file_conversion_worker.isRunning():
-                        self._file_conversion_worker.quit()
-                        if not self._file_conversion_worker.wait(2000):
-                            self._file_conversion_worker.terminate()
-                            self._file_conversion_worker.wait(500)
-                    self._file_conversion_worker = None
-            
-            # Clean up batch file conversion worker
-            if hasattr(self, '_batch_file_conversion_worker'):
-                if self._batch_file_conversion_worker:
-                    try:
-                        if hasattr(self._batch_file_conversion_worker, 'stop'):
-                            self._batch_file_conversion_worker.stop()
-                        self._batch_file_conversion_worker.finished.disconnect()
-                    except:
-                        pass
-                    if self._batch_file_conversion_worker.isRunning():
-                        self._batch_file_conversion_worker.quit()
-                        if not self._batch_file_conversion_worker.wait(2000):
-                            self._batch_file_conversion_worker.terminate()
-                            self._batch_file_conversion_worker.wait(500)
-                    self._batch_file_conversion_worker = None
-            
-            # Clean up update resources worker
-            if hasattr(self, '_update_resources_worker'):
-                if self._update_resources_worker:
-                    try:
-                        self._update_resources_worker.finished.disconnect()
-                    except:
-                        pass
-                    if self._update_resources_worker.isRunning():
-                        self._update_resources_worker.quit()
-                        if not self._update_resources_worker.wait(2000):
-                            self._update_resources_worker.terminate()
-                            self._update_resources_worker.wait(500)
-                    self._update_resources_worker = None
+            # Stop everything first so the jobs wind down in parallel,
+            # then wait for all of them under a single deadline. Running
+            # downloads are paused so they keep partial data and do not retry
+            for runner in self._download_runners.values():
+                if runner.task.status == DownloadStatus.DOWNLOADING:
+                    self.manager.pause_task(runner.task)
+            for runner in list(self._runners.values()):
+                try:
+                    runner.stop()
+                except Exception:
+                    pass
+            if hasattr(self, 'prefetcher'):
+                self.prefetcher.stop()
+            if hasattr(self, 'preview_pool'):
+                self.preview_pool.cancel_all()
+            if hasattr(self, 'thumbnail_loader'):
+                self.thumbnail_loader.cancel_all()
+            update_worker = getattr(self, '_update_resources_worker', None)
+            if update_worker:
+                try:
+                    update_worker.finished.disconnect()
+                except Exception:
+                    pass
+                update_worker.quit()
+
+            deadline = time.monotonic() + SHUTDOWN_DEADLINE_MS / 1000
+
+            def remaining_ms():
+                return max(0, int((deadline - time.monotonic()) * 1000))
+
+            self.runner_pool.clear()
+            idle = self.runner_pool.waitForDone(remaining_ms())
+            if not idle:
+                print("Some downloads or conversions were still stopping at exit")
+                _stranded_runners.extend(self._runners.values())
+            self._runners.clear()
+            self._download_runners.clear()
+            if hasattr(self, 'preview_pool'):
+                idle = self.preview_pool.shutdown(remaining_ms() / 1000) and idle
+            if getattr(self, 'folder_watcher', None) and not self.folder_watcher.join(remaining_ms() / 1000):
+                print("Folder watcher was still stopping at exit")
+            if update_worker and not update_worker.wait(remaining_ms()):
+                update_worker.terminate()
+                update_worker.wait(500)
+            self._update_resources_worker = None
+            # Work still running may record history or cache metadata; if any
+            # is, leave the stores open for process exit to release
+            if idle:
+                if hasattr(self, 'metadata_cache'):
+                    self.metadata_cache.close()
+                if hasattr(self, 'history_store'):
+                    self.history_store.close()
             
             self.save_settings()
         except Exception as e:
@@ -681,20 +827,15 @@ class DownloaderAppQt(QMainWindow):
         preview_header.addStretch()
         preview_container_layout.addWidget(self.preview_header_widget)
         
-        # Preview cards (show all without scroll cap)
-        from ui_components_qt import FlowLayout
-        self.preview_cards_frame = QFrame()
-        self.preview_cards_frame.setStyleSheet(
-            "QFrame { border: 1px solid #444; border-radius: 4px; background-color: #1a1a1a; }"
-        )
-        self.preview_cards_layout = FlowLayout(self.preview_cards_frame, margin=10, spacing=10)
-        preview_container_layout.addWidget(self.preview_cards_frame)
+        # Preview cards are rows of a model; only the cards in view are painted
+        from ui_components_qt import PreviewGallery
+        self.preview_gallery = PreviewGallery(self._preview_pixmap)
+        self.preview_gallery.delegate.thumbnail_needed.connect(self._request_preview_thumbnail)
+        self.preview_cards = self.preview_gallery.preview_model
+        preview_container_layout.addWidget(self.preview_gallery)
         
         main_panel_layout.addWidget(self.preview_container)
         
-        # Store preview cards
-        self.preview_cards = {}
-        
         # Action buttons
         btn_frame = QWidget()
         btn_layout = QHBoxLayout(btn_frame)
@@ -757,7 +898,8 @@ class DownloaderAppQt(QMainWindow):
         # History tab
         history_widget = QWidget()
         history_layout = QVBoxLayout(history_widget)
-        self.history_frame = HistoryFrame()
+        self.history_frame = HistoryFrame(self.history_store)
+        self.history_frame.rows_changed.connect(self._update_history_buttons_visibility)
         history_layout.addWidget(self.history_frame)
         
         # History controls
@@ -950,8 +1092,8 @@ class DownloaderAppQt(QMainWindow):
         """
         
         self.setStyleSheet(stylesheet)
-        self._apply_preview_card_theme()
-        self._apply_preview_container_theme()
+        if hasattr(self, "preview_gallery"):
+            self.preview_gallery.set_theme(self.settings.get("theme", "dark"))
 
         # Update platform hint color for current theme
         try:
@@ -959,26 +1101,6 @@ class DownloaderAppQt(QMainWindow):
         except Exception:
             pass
 
-    def _apply_preview_card_theme(self):
-        theme = self.settings.get("theme", "dark")
-        for card in self.preview_cards.values():
-            try:
-                card.apply_theme(theme)
-            except Exception:
-                pass
-
-    def _apply_preview_container_theme(self):
-        theme = self.settings.get("theme", "dark")
-        if hasattr(self, "preview_cards_frame"):
-            if theme == "light":
-                self.preview_cards_frame.setStyleSheet(
-                    "QFrame { border: 1px solid #cbd5e1; border-radius: 4px; background-color: #ffffff; }"
-                )
-            else:
-                self.preview_cards_frame.setStyleSheet(
-                    "QFrame { border: 1px solid #444; border-radius: 4px; background-color: #1a1a1a; }"
-                )
-    
     def update_platform_hint(self, url):
         if url.startswith("http"):
             platform = detect_platform(url)
@@ -1010,6 +1132,8 @@ class DownloaderAppQt(QMainWindow):
             self.clear_previews()
 
     def _schedule_auto_preview(self, url_text):
+        # Stop fetching URLs that were edited away without waiting for the debounce
+        self._cancel_stale_previews(self.url_frame.get_urls() if url_text else [])
         if not url_text:
             return
         # Debounce to avoid firing on every keystroke
@@ -1024,7 +1148,7 @@ class DownloaderAppQt(QMainWindow):
 
     def _refresh_preview_sizes(self):
         format_choice = self.url_frame.get_format()
-        for url, card in self.preview_cards.items():
+        for url in self.preview_cards.urls():
             info = self.info_cache.get(url)
             if not info:
                 continue
@@ -1041,7 +1165,7 @@ class DownloaderAppQt(QMainWindow):
                 duration_str = f"{duration}s"
 
             info_text = f"{uploader}\n{duration_str} | {size_str}"
-            card.set_data(title, info_text)
+            self.preview_cards.set_data(url, title, info_text)
     
     def _on_url_focus_in(self, event):
         """Track when user is typing in URL field"""
@@ -1054,24 +1178,26 @@ class DownloaderAppQt(QMainWindow):
         self.url_input_focused = False
         from PySide6.QtWidgets import QTextEdit
         QTextEdit.focusOutEvent(self.url_frame.url_input, event)
+        # A URL copied while the field had focus was skipped; there is no later poll to catch it
+        self.check_clipboard()
 
     def _set_preview_collapsed(self, collapsed: bool):
         """Collapse or expand preview area"""
-        if not hasattr(self, "preview_cards_frame") or not hasattr(self, "preview_container"):
+        if not hasattr(self, "preview_gallery") or not hasattr(self, "preview_container"):
             return
         if collapsed:
-            self.preview_cards_frame.setVisible(False)
+            self.preview_gallery.setVisible(False)
             header_height = self.preview_header_widget.sizeHint().height() if hasattr(self, "preview_header_widget") else 0
             target_height = header_height + 12
             self.preview_container.setMinimumHeight(target_height)
             self.preview_container.setMaximumHeight(target_height)
         else:
-            self.preview_cards_frame.setVisible(True)
+            self.preview_gallery.setVisible(True)
             self.preview_container.setMinimumHeight(0)
             self.preview_container.setMaximumHeight(16777215)
     
     def preview_all_media(self):
-        """Preview all URLs entered"""
+        """Preview all URLs entered, fetching several at once on the preview pool"""
         urls = self.url_frame.get_urls()
         
         if not urls:
@@ -1079,80 +1205,121 @@ class DownloaderAppQt(QMainWindow):
             return
         
         self._set_preview_collapsed(False)
+        self.prefetcher.yield_to_work()
+        
+        # Cancel fetches and drop cards for URLs no longer in the input;
+        # cards that are loaded or still loading are kept as they are
+        self._cancel_stale_previews(urls)
+        for url in self.preview_cards.urls():
+            if url not in urls:
+                self._remove_preview_card(url)
+        
+        # Loaded and still-loading URLs are skipped; failed ones are retried
+        new_urls = [url for url in urls if url not in self.info_cache and url not in self._preview_pending]
+        if not new_urls:
+            self._refresh_preview_sizes()
+            return
         
-        # Clear existing previews
-        self.clear_previews()
-        
-        self.log_signal.emit(f"Previewing {len(urls)} URL(s)...\n")
-        self._preview_in_progress = True
+        self.log_signal.emit(f"Previewing {len(new_urls)} URL(s)...\n")
         
-        # Create preview card for each URL
-        for url in urls:
-            from ui_components_qt import PreviewCard
-            card = PreviewCard()
-            card.set_loading(url)
-            card.apply_theme(self.settings.get("theme", "dark"))
-            self.preview_cards[url] = card
-            self.preview_cards_layout.addWidget(card)
-        
-        # Fetch info for each URL asynchronously
-        class BulkPreviewWorker(QThread):
-            single_preview_ready = Signal(str, dict)  # url, info
-            single_thumbnail_ready = Signal(str, object)  # url, image
-            single_error = Signal(str)  # url
-            log_signal = Signal(str)
-            
-            def __init__(self, urls):
-                super().__init__()
-                self.urls = urls
-            
-            def run(self):
-                for url in self.urls:
-                    try:
-                        info = fetch_media_info(url, self.log_signal.emit)
-                        if info:
-                            self.single_preview_ready.emit(url, info)
-                            
-                            # Load thumbnail
-                            thumb = info.get("thumbnail") or (info.get("thumbnails")[-1]["url"] if info.get("thumbnails") else None)
-                            if thumb:
-                                try:
-                                    import urllib.request
-                                    from PIL import Image
-                                    import io
-                                    
-                                    with urllib.request.urlopen(thumb, timeout=10) as response:
-                                        data = response.read()
-                                    image = Image.open(io.BytesIO(data))
-                                    image.thumbnail((80, 80))
-                                    
-                                    img_byte_arr = io.BytesIO()
-                                    image.save(img_byte_arr, format='PNG')
-                                    img_byte_arr = img_byte_arr.getvalue()
-                                    
-                                    from PySide6.QtGui import QImage
-                                    image_obj = QImage.fromData(img_byte_arr)
-                                    self.single_thumbnail_ready.emit(url, image_obj)
-                                except Exception:
-                                    pass
-                        else:
-                            self.single_error.emit(url)
-                    except Exception:
-                        self.single_error.emit(url)
-        
-        worker = BulkPreviewWorker(urls)
-        worker.single_preview_ready.connect(self.on_single_preview_ready)
-        worker.single_thumbnail_ready.connect(self.on_single_thumbnail_ready)
-        worker.single_error.connect(self.on_single_preview_error)
-        worker.log_signal.connect(self.add_log_safe)
-        worker.finished.connect(lambda *args: setattr(self, "_preview_in_progress", False))
-        worker.start()
-        
-        # Keep reference
-        if not hasattr(self, '_bulk_preview_workers'):
-            self._bulk_preview_workers = []
-        self._bulk_preview_workers.append(worker)
-        worker.finished.connect(lambda: self._bulk_preview_workers.remove(worker) if worker in self._bulk_preview_workers else None)
+        batches = {}
+        for url in new_urls:
+            if not self.preview_cards.add(url):
+                self.preview_cards.set_loading(url)
+            self._preview_pending.add(url)
+            # Cached metadata is shown right away; thumbnails load as cards scroll into view
+            info = self.metadata_cache.get(url)
+            if info:
+                self.on_single_preview_ready(url, info)
+                continue
+            if is_batchable(url):
+                batches.setdefault(detect_platform(url), []).append(url)
+                continue
+            self.preview_pool.submit(url, self._fetch_preview)
+        self._submit_preview_batches(batches)
+        self._update_preview_progress()
+
+    def _submit_preview_batches(self, batches):
+        """Fetch uncached videos of each platform through a few shared yt-dlp -j processes"""
+        width = self.preview_pool.width
+        for urls in batches.values():
+            if len(urls) == 1:
+                self.preview_pool.submit(urls[0], self._fetch_preview)
+                continue
+            # Enough chunks to keep every pool thread busy, each paying one process start
+            size = min(METADATA_BATCH_SIZE, max(2, -(-len(urls) // width)))
+            for start in range(0, len(urls), size):
+                self.preview_pool.submit_batch(urls[start:start + size], self._fetch_preview_batch)
+    
+    def _cached_info(self, url):
+        """Preview info for a URL from the cards shown or the persistent metadata cache"""
+        return self.info_cache.get(url) or self.metadata_cache.get(url) or {}
+
+    def _is_busy_for_prefetch(self):
+        """Real work the clipboard prefetch waits for: previews, or downloads waiting for a slot"""
+        return bool(self._preview_pending) or self.manager.get_queue_count() > 0
+
+    def _fetch_preview(self, job):
+        """Runs on a preview pool thread; results go back through signals"""
+        signals = self.preview_signals
+        try:
+            info = self.metadata_cache.get(job.url)
+            if not info:
+                info = fetch_media_info(job.url, signals.log_signal.emit, job.cancel_event)
+                if job.cancelled:
+                    return
+                if not info:
+                    signals.single_error.emit(job.url)
+                    return
+                info = self.metadata_cache.put(job.url, info)
+                signals.single_preview_ready.emit(job.url, info)
+        except Exception:
+            if not job.cancelled:
+                signals.single_error.emit(job.url)
+
+    def _fetch_preview_batch(self, job):
+        """Runs on a preview pool thread; one yt-dlp process answers every URL in the job"""
+        signals = self.preview_signals
+
+        def _on_result(url, info):
+            if url not in job.urls:
+                return
+            if not info:
+                signals.single_error.emit(url)
+                return
+            info = self.metadata_cache.put(url, info)
+            signals.single_preview_ready.emit(url, info)
+
+        try:
+            fetch_media_info_batch(list(job.urls), _on_result, signals.log_signal.emit, job.cancel_event)
+        except Exception:
+            for url in list(job.urls):
+                signals.single_error.emit(url)
+
+    def _preview_pixmap(self, thumb_url):
+        """Pixmap of a loaded preview thumbnail, or None (the card then asks for it)"""
+        return self._thumbnail_pixmaps.get((thumb_url, PREVIEW_THUMB_SIZE))
+
+    def _request_preview_thumbnail(self, thumb_url):
+        """Load the thumbnail of a card that came into view"""
+        self.thumbnail_loader.request(thumb_url)
+
+    def _load_preview_image(self, thumb_url):
+        """Runs on a thumbnail loader thread"""
+        return _load_thumbnail_image(thumb_url, PREVIEW_THUMB_SIZE)
+
+    def _remove_preview_card(self, url):
+        self.preview_cards.remove(url)
+        self.info_cache.pop(url, None)
+    
+    def _cancel_stale_previews(self, urls):
+        """Cancel previews for URLs that are no longer in the input"""
+        self.preview_pool.cancel_except(urls)
+        self._preview_pending &= set(urls)
+        self._update_preview_progress()
+
+    def _update_preview_progress(self):
+        self._preview_in_progress = bool(self._preview_pending)
     
     def on_single_preview_ready(self, url, info):
         """Handle single preview ready"""
@@ -1173,67 +1340,44 @@ class DownloaderAppQt(QMainWindow):
             
             info_text = f"{uploader}\n{duration_str} | {size_str}"
             
-            self.preview_cards[url].set_data(title, info_text)
+            self.preview_cards.set_data(url, title, info_text, info.get("thumbnail") or "")
             self.info_cache[url] = info
-            thumb_url = info.get("thumbnail")
-            if thumb_url:
-                self._cache_thumbnail_for_url(url, thumb_url)
-    
-    def on_single_thumbnail_ready(self, url, image_obj):
-        """Handle single thumbnail ready"""
-        if url in self.preview_cards:
-            card = self.preview_cards[url]
-            # Update thumbnail on existing card
-            pixmap = QPixmap.fromImage(image_obj)
-            card.thumbnail.setPixmap(pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-
-    def _cache_thumbnail_for_url(self, url: str, thumb_url: str):
-        """Download and cache thumbnail for later embedding."""
-        if url in self.thumbnail_cache:
-            return
-        import threading
-        import hashlib
-        import urllib.request
+        self._preview_pending.discard(url)
+        self._update_preview_progress()
+    
+    def on_preview_thumbnail_loaded(self, thumb_url, image_obj):
+        """Cache a loaded thumbnail as a pixmap and repaint the cards showing it"""
+        if image_obj is not None:
+            pixmap = QPixmap.fromImage(image_obj).scaled(
+                PREVIEW_THUMB_SIZE, PREVIEW_THUMB_SIZE,
+                Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
+            self._thumbnail_pixmaps.put((thumb_url, PREVIEW_THUMB_SIZE), pixmap)
+        self.preview_cards.thumbnail_changed(thumb_url, image_obj is not None)
 
-        def _worker():
-            try:
-                output_folder = self.url_frame.get_output_folder() or os.path.expanduser(
-                    self.settings.get("download_folder", "~/Downloads")
-                )
-                cache_dir = os.path.join(os.path.expanduser(output_folder), ".thumb_cache")
-                os.makedirs(cache_dir, exist_ok=True)
-                url_hash = hashlib.md5(url.encode("utf-8")).hexdigest()
-                ext = ".jpg"
-                lower = thumb_url.lower()
-                if ".png" in lower:
-                    ext = ".png"
-                elif ".webp" in lower:
-                    ext = ".webp"
-                file_path = os.path.join(cache_dir, f"{url_hash}{ext}")
-                with urllib.request.urlopen(thumb_url, timeout=15) as response:
-                    data = response.read()
-                with open(file_path, "wb") as f:
-                    f.write(data)
-                self.thumbnail_cache[url] = file_path
-            except Exception:
-                pass
+    def _thumbnail_file(self, url):
+        """Cached thumbnail file of a URL's preview, if one is on disk already.
 
-        threading.Thread(target=_worker, daemon=True).start()
+        Only thumbnails that were scrolled into view (or prefetched) are
+        downloaded; nothing is fetched here.
+        """
+        thumb_url = self._cached_info(url).get("thumbnail", "")
+        try:
+            return self.thumbnails.lookup(thumb_url) if thumb_url else ""
+        except Exception:
+            return ""
     
     def on_single_preview_error(self, url):
         """Handle single preview error"""
-        if url in self.preview_cards:
-            self.preview_cards[url].set_error(url)
+        self.preview_cards.set_error(url)
+        self._preview_pending.discard(url)
+        self._update_preview_progress()
     
     def clear_previews(self):
         """Clear all preview cards"""
-        # Remove all widgets from layout first
-        while self.preview_cards_layout.count() > 0:
-            item = self.preview_cards_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
-        
-        # Clear the dictionary
+        if hasattr(self, "preview_pool"):
+            self._cancel_stale_previews([])
+            self.thumbnail_loader.cancel_all()
         self.preview_cards.clear()
         self.info_cache.clear()
     
@@ -1263,6 +1407,7 @@ class DownloaderAppQt(QMainWindow):
         if not urls:
             QMessageBox.warning(self, "Missing", "Enter media URL(s)")
             return
+        self.prefetcher.yield_to_work()
         
         # Check for duplicate URLs already downloading
         duplicate_urls = [url for url in urls if self.is_url_already_downloading(url)]
@@ -1281,8 +1426,8 @@ class DownloaderAppQt(QMainWindow):
                 self.log_signal.emit("All URL(s) are already in queue. Skipped.\n")
                 return
         
-        # Check if previews exist
-        missing_previews = [url for url in urls if url not in self.info_cache]
+        # Check if previews exist (prefetched metadata counts)
+        missing_previews = [url for url in urls if not self._cached_info(url)]
         if missing_previews:
             reply = QMessageBox.question(
                 self,
@@ -1337,20 +1482,23 @@ class DownloaderAppQt(QMainWindow):
                 format_choice=format_choice,
                 platform=platform
             )
-            task.thumbnail_path = self.thumbnail_cache.get(url, "")
-            task.thumbnail_url = self.info_cache.get(url, {}).get("thumbnail", "")
+            task.thumbnail_path = self._thumbnail_file(url)
+            task.thumbnail_url = self._cached_info(url).get("thumbnail", "")
 
             # Use preview size for selected format if available
-            info = self.info_cache.get(url, {})
+            info = self._cached_info(url)
+            task.title = info.get("title") or ""
+            task.uploader = info.get("uploader") or ""
             size_val = self._get_expected_size_value(info, format_choice)
             if size_val:
                 task.file_size = self._format_size_value(size_val)
             
-            task_id = str(uuid.uuid4())
+            task_id = task.task_id
             self.task_map[task_id] = task
             self.manager.add_task(task)
             
             self.download_table.add_download(task_id, os.path.basename(save_path))
+            self.logs_frame.set_task_name(task_id, os.path.basename(save_path))
             # Update size immediately if known
             self.download_table.update_download(
                 task_id,
@@ -1374,6 +1522,106 @@ class DownloaderAppQt(QMainWindow):
         elif len(urls) > 0:
             self.log_signal.emit("No URLs were added to queue\n")
     
+    def _start_folder_watcher(self):
+        """Start watching the folders listed in the watch_folders setting"""
+        folders = self.settings.get("watch_folders", [])
+        if not folders:
+            return
+        try:
+            self.folder_watcher = FolderWatcher(
+                folders,
+                self.settings,
+                self._offer_watched_urls,
+                self._on_watched_file
+            )
+            self.folder_watcher.start()
+            for folder in self.folder_watcher.folders:
+                self.log_signal.emit(f"Watching folder: {folder['path']} ({self.folder_watcher.backend})\n")
+        except Exception as e:
+            self.folder_watcher = None
+            self.log_signal.emit(f"✗ Could not start folder watcher: {e}\n")
+
+    def _offer_watched_urls(self, urls, folder):
+        """Called on the watcher thread; waits for the GUI thread to queue the batch.
+
+        Returns how many URLs were ingested, so the watcher holds back the
+        rest while the queue is full.
+        """
+        batch = WatchedBatch()
+        # Closing the window sets `done` so the watcher thread can exit promptly
+        self._pending_watch_batch = batch
+        try:
+            self.watch_urls_signal.emit(urls, folder, batch)
+            while not batch.done.wait(0.1):
+                if self._is_shutting_down:
+                    return 0
+            return batch.accepted
+        finally:
+            self._pending_watch_batch = None
+
+    def _on_watched_file(self, path, ok, count):
+        """Called from the watcher thread once a list file has been processed"""
+        name = os.path.basename(path)
+        if ok:
+            self.log_signal.emit(f"Watch folder: queued {count} URL(s) from {name}\n")
+        else:
+            self.log_signal.emit(f"Watch folder: no URLs in {name}, moved to failed\n")
+
+    def _add_watched_urls(self, urls, folder, batch=None):
+        """Queue a batch of URLs from a watched folder using the folder's preset.
+
+        Stops at the first URL the full queue cannot take; `batch.accepted`
+        counts the URLs before it, including ones skipped as already known.
+        """
+        accepted = 0
+        try:
+            if not self._is_shutting_down:
+                accepted = self._queue_watched_urls(urls, folder)
+        finally:
+            if batch is not None:
+                batch.accepted = accepted
+                batch.done.set()
+
+    def _queue_watched_urls(self, urls, folder) -> int:
+        preset = folder.get("preset") or {}
+        task_settings = {**self.settings, **preset}
+        format_choice = preset.get("format_choice") or self.url_frame.get_format()
+        # Only URLs still in flight count as handled; dropping a failed one again retries it
+        known = {task.url for task in self.task_map.values() if task.status in WATCH_PENDING_STATUSES}
+        added_count = 0
+        accepted = 0
+
+        for url in urls:
+            if url in known or not url.startswith("http"):
+                accepted += 1
+                continue
+            if not self.manager.is_queue_available():
+                # The watcher offers the rest again once downloads free up room
+                break
+            save_path = output_template(task_settings, format_choice)
+            os.makedirs(os.path.dirname(save_path), exist_ok=True)
+            task = DownloadTask(
+                url=url,
+                path=save_path,
+                format_choice=format_choice,
+                platform=detect_platform(url)
+            )
+            task.overrides = preset_overrides(preset)
+            task_id = task.task_id
+            self.task_map[task_id] = task
+            self.manager.add_task(task)
+            self.download_table.add_download(task_id, os.path.basename(save_path))
+            self.logs_frame.set_task_name(task_id, os.path.basename(save_path))
+            known.add(url)
+            added_count += 1
+            accepted += 1
+
+        if added_count:
+            self._update_download_buttons_visibility()
+            self.log_signal.emit(f"Added {added_count} watched URL(s) to queue\n")
+            self.process_queue()
+        return accepted
+
     def download_now(self):
         """Immediate download"""
         try:
@@ -1418,18 +1666,21 @@ class DownloaderAppQt(QMainWindow):
                 format_choice=format_choice,
                 platform=platform
             )
-            task.thumbnail_path = self.thumbnail_cache.get(url, "")
-            task.thumbnail_url = self.info_cache.get(url, {}).get("thumbnail", "")
+            task.thumbnail_path = self._thumbnail_file(url)
+            task.thumbnail_url = self._cached_info(url).get("thumbnail", "")
 
-            info = self.info_cache.get(url, {})
+            info = self._cached_info(url)
+            task.title = info.get("title") or ""
+            task.uploader = info.get("uploader") or ""
             size_val = self._get_expected_size_value(info, format_choice)
             if size_val:
                 task.file_size = self._format_size_value(size_val)
             
-            task_id = str(uuid.uuid4())
+            task_id = task.task_id
             self.task_map[task_id] = task
             
             self.download_table.add_download(task_id, os.path.basename(save_path))
+            self.logs_frame.set_task_name(task_id, os.path.basename(save_path))
             self.log_signal.emit(f"Starting download: {url}\n")
             self.url_frame.clear()
             self._set_preview_collapsed(True)
@@ -1437,17 +1688,7 @@ class DownloaderAppQt(QMainWindow):
             # Update button visibility
             self._update_download_buttons_visibility()
             
-            # Start download with QThread worker
-            worker = DownloadWorker(task, self.manager, self.get_download_settings())
-            worker.progress_signal.connect(self.progress_signal.emit)
-            worker.log_signal.connect(self.add_log_safe)
-            worker.completed_signal.connect(lambda *args: None)  # Handled by manager
-            worker.start()
-            
-            # Keep reference
-            if not hasattr(self, '_download_workers'):
-                self._download_workers = {}
-            self._download_workers[task_id] = worker
+            self._start_download_runner(task_id, task)
         
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Download error: {str(e)}")
@@ -1484,52 +1725,54 @@ class DownloaderAppQt(QMainWindow):
                     )
                     self.log_signal.emit(f"Downloading: {task.url}\n")
                     
-                    # Start download with QThread worker
-                    worker = DownloadWorker(task, self.manager, self.get_download_settings())
-                    worker.progress_signal.connect(self.progress_signal.emit)
-                    worker.log_signal.connect(self.add_log_safe)
-                    worker.completed_signal.connect(lambda *args: None)  # Handled by manager
-                    worker.start()
-                    
-                    # Keep reference
-                    if not hasattr(self, '_download_workers'):
-                        self._download_workers = {}
-                    self._download_workers[task_id] = worker
+                    self._start_download_runner(task_id, task)
         except Exception as e:
             self.log_signal.emit(f"✗ Queue processing error: {str(e)}\n")
     
+    def _start_runner(self, runner):
+        """Queue a runner on the pool and keep it until its finished signal"""
+        self._runners[runner.key] = runner
+        runner.signals.log_signal.connect(self.add_log_safe)
+        runner.signals.finished.connect(self._reap_runner)
+        self.runner_pool.start(runner)
+
+    def _start_download_runner(self, task_id, task):
+        runner = DownloadRunner(task, self.manager, self.get_download_settings())
+        runner.signals.progress_signal.connect(self.progress_signal.emit)
+        runner.signals.completed_signal.connect(lambda *args: None)  # Handled by manager
+        self._download_runners[task_id] = runner
+        self._start_runner(runner)
+
+    @Slot(int)
+    def _reap_runner(self, key):
+        """Drop a runner whose run() has returned; never waits"""
+        runner = self._runners.pop(key, None)
+        if runner is None:
+            return
+        for task_id, download_runner in list(self._download_runners.items()):
+            if download_runner is runner:
+                del self._download_runners[task_id]
+    
     def pause_selected(self):
         """Pause selected download - non-blocking"""
-        selected = self.download_table.table.selectedItems()
-        if not selected:
+        task_id = self.download_table.selected_task_id()
+        if task_id is None:
             return
-        row = selected[0].row()
-        task_id = self.download_table.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         task = self.task_map.get(task_id)
         if task:
             self.manager.pause_task(task)
             
-            # Pause process in background
+            # Stop the process tree in background
             if task.process:
-                def pause_process_async():
-                    try:
-                        self.task.process.terminate()
-                    except Exception:
-                        pass
-                
-                import threading
-                thread = threading.Thread(target=pause_process_async, daemon=True)
-                thread.start()
+                stop_task_process(task)
             
             self.log_signal.emit("Paused download\n")
     
     def resume_selected(self):
         """Resume selected download"""
-        selected = self.download_table.table.selectedItems()
-        if not selected:
+        task_id = self.download_table.selected_task_id()
+        if task_id is None:
             return
-        row = selected[0].row()
-        task_id = self.download_table.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         task = self.task_map.get(task_id)
         if task and task.status == DownloadStatus.PAUSED:
             self.manager.resume_task(task)
@@ -1538,32 +1781,27 @@ class DownloaderAppQt(QMainWindow):
     
     def cancel_selected(self):
         """Cancel selected download - non-blocking"""
-        selected = self.download_table.table.selectedItems()
-        if not selected:
+        task_id = self.download_table.selected_task_id()
+        if task_id is None:
             return
-        row = selected[0].row()
-        task_id = self.download_table.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         task = self.task_map.get(task_id)
         if task:
             self.manager.cancel_task(task)
             
             # Terminate process in background to avoid blocking UI
-            if task.process and task_id in self._download_workers:
-                worker = self._download_workers.get(task_id)
-                if worker:
-                    worker.stop()  # This will handle async termination
+            runner = self._download_runners.get(task_id)
+            if task.process and runner:
+                runner.stop()  # This will handle async termination
             
             self.log_signal.emit("Cancelled download\n")
     
     def retry_selected(self):
         """Retry selected failed download from scratch"""
-        selected = self.download_table.table.selectedItems()
-        if not selected:
+        task_id = self.download_table.selected_task_id()
+        if task_id is None:
             self.log_signal.emit("No download selected\n")
             return
         
-        row = selected[0].row()
-        task_id = self.download_table.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
         task = self.task_map.get(task_id)
         
         if not task:
@@ -1592,28 +1830,19 @@ class DownloaderAppQt(QMainWindow):
         except Exception:
             pass
         
-        # Clean up old worker thread if it exists
-        if hasattr(self, '_download_workers') and task_id in self._download_workers:
-            old_worker = self._download_workers.pop(task_id)
-            if old_worker:
-                try:
-                    # Kill subprocess first
-                    if hasattr(old_worker, 'stop'):
-                        old_worker.stop()
-                    # Then stop the thread
-                    if old_worker.isRunning():
-                        old_worker.quit()
-                        old_worker.wait(500)
-                        if old_worker.isRunning():
-                            old_worker.terminate()
-                            old_worker.wait(500)
-                except:
-                    pass
+        # Stop the old runner; it is reaped when its finished signal arrives
+        old_runner = self._download_runners.pop(task_id, None)
+        if old_runner:
+            try:
+                old_runner.stop()
+            except Exception:
+                pass
         
         # Reset task to queued state
         task.status = DownloadStatus.QUEUED
         task.process = None
         task.last_error = ""
+        task.error_class = ""
         task.progress = 0.0
         task.speed = ""
         task.eta = ""
@@ -1631,7 +1860,7 @@ class DownloaderAppQt(QMainWindow):
             task.eta,
             task.progress
         )
-        self.download_table.table.selectRow(row)
+        self.download_table.select_task(task_id)
         
         # Retry the download
         self.log_signal.emit(f"Retrying download: {os.path.basename(task.path)}\n")
@@ -1650,114 +1879,67 @@ class DownloaderAppQt(QMainWindow):
             return
         
         self._update_pending = True
-        QTimer.singleShot(1000, self._do_update_downloads)  # Increased from 500ms to 1000ms
+        # Coalesce worker progress into one table update at the next frame
+        QTimer.singleShot(self.download_table.frame_interval_ms(), self._do_update_downloads)
     
     def _do_update_downloads(self):
-        """Actually perform the UI updates - only update changed items"""
-        if not hasattr(self, '_task_state_cache'):
-            self._task_state_cache = {}
-        
-        # Disable updates during batch operation to prevent multiple repaints
-        self.download_table.table.setUpdatesEnabled(False)
-        try:
-            for task_id, task in self.task_map.items():
-                # Create current state tuple
-                current_state = (
-                    task.status.value,
-                    task.file_size,
-                    task.speed,
-                    task.eta,
-                    round(task.progress, 1)  # Round to reduce precision changes
-                )
-                
-                # Only update if state changed
-                if self._task_state_cache.get(task_id) != current_state:
-                    self._task_state_cache[task_id] = current_state
-                    self.download_table.update_download(
-                        task_id,
-                        task.status.value,
-                        task.file_size,
-                        task.speed,
-                        task.eta,
-                        task.progress
-                    )
-        finally:
-            self.download_table.table.setUpdatesEnabled(True)
+        """Actually perform the UI updates - only tasks marked dirty since the last refresh"""
         self._update_pending = False
+        updates = []
+        for task_id in self.manager.take_dirty():
+            task = self.task_map.get(task_id)
+            if task is not None:
+                updates.append((
+                    task_id, task.status.value, task.file_size, task.speed, task.eta, task.progress,
+                    tuple(task.speed_history)
+                ))
+        # One model change per refresh; unchanged cells are skipped by the model
+        self.download_table.update_downloads(updates)
         
         # Update button visibility in case downloads were removed
         self._update_download_buttons_visibility()
     
     def on_download_completed(self):
         """Handle download completion"""
-        for task_id, task in list(self.task_map.items()):
-            if task.status in [DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED]:
-                self.download_table.update_download(
-                    task_id,
-                    task.status.value,
-                    task.file_size,
-                    task.speed,
-                    task.eta,
-                    task.progress
-                )
-                
-                # Clean up worker thread - wait for it to finish
-                if hasattr(self, '_download_workers') and task_id in self._download_workers:
-                    worker = self._download_workers.pop(task_id)
-                    if worker:
-                        try:
-                            # Give thread a moment to finish gracefully
-                            if worker.isRunning():
-                                worker.quit()
-                                if not worker.wait(1000):
-                                    worker.terminate()
-                                    worker.wait(500)
-                        except Exception:
-                            pass
-        
-        # Defer heavy operations to next event loop iteration
-        QTimer.singleShot(10, self._show_completion_ui)
+        # Show final states now rather than at the next progress refresh
+        self._do_update_downloads()
+        # Finished runners are reaped from their own finished signals.
+        # Not restarted by later completions, so a summary is never held back longer than one window
+        if not self._completion_timer.isActive():
+            self._completion_timer.start()
         self.process_queue()
+        self._log_error_summary_if_idle()
     
-    def _show_notification(self):
-        """Show notification in background thread"""
-        if NOTIFY_AVAILABLE and self.settings.get("notifications", True):
-            try:
-                notification.notify(
-                    title="Download Complete",
-                    message="Your download has finished!",
-                    timeout=5
-                )
-            except Exception:
-                pass
+    def _log_error_summary_if_idle(self):
+        """Log per-class failure counts once the queue has drained"""
+        if self.manager.get_active_count() or self.manager.get_queue_count():
+            return
+        summary = self.manager.get_error_summary()
+        if summary != getattr(self, "_last_error_summary", "No errors"):
+            self._last_error_summary = summary
+            self.log_signal.emit(f"Batch finished. {summary}\n")
     
     def _show_completion_ui(self):
-        """Show completion notification and update history (deferred)"""
-        # Defer heavy operations to background/timers
-        import threading
-        
-        # Show notification in background thread (non-blocking)
-        threading.Thread(target=self._show_notification, daemon=True).start()
-        
-        # Defer history loading to next event cycle
-        #QTimer.singleShot(50, self.load_history) # DISABLED - causes freeze
-        
-        # Show message box (non-modal so UI stays responsive)
-        if self.manager.history and self.manager.history[0].get("status") == DownloadStatus.COMPLETED.value:
-            latest = self.manager.history[0]
-            path = os.path.join(latest["location"], latest["file"])
-            msg = QMessageBox(self)
-            msg.setWindowTitle("Download Complete")
-            msg.setText("Open the downloaded file?")
-            msg.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
-            msg.setModal(False)
-            msg.buttonClicked.connect(lambda btn, p=path: self._open_file_path(p)
-                                      if msg.standardButton(btn) == QMessageBox.StandardButton.Yes else None)
-            msg.show()
+        """Report everything finished since the last summary at once"""
+        summary = CompletionSummary(self.manager.take_finished())
+        if not summary:
+            return
+        if self.settings.get("notifications", True):
+            self.notifier.notify(summary.title(), summary.message())
+        
+        # Cancellations were asked for; only a batch with results gets the dialog
+        if summary.counts[DownloadStatus.CANCELLED.value] == len(summary):
+            return
+        if self._completion_dialog is None:
+            self._completion_dialog = CompletionSummaryDialog(self)
+            self._completion_dialog.open_requested.connect(self._open_file_path)
+            self._completion_dialog.open_folder_requested.connect(self._open_folder_path)
+        self._completion_dialog.add_summary(summary)
+        self._completion_dialog.show()
     
     def build_filename(self, url: str) -> str:
         """Build filename from URL and info"""
-        info = self.info_cache.get(url, {})
+        info = self._cached_info(url)
         title = info.get("title", "download")
         uploader = info.get("uploader", "unknown")
         
@@ -1788,16 +1970,32 @@ class DownloaderAppQt(QMainWindow):
             "auto_subtitles": self.settings.get("auto_subtitles", False),
             "subtitle_langs": self.settings.get("subtitle_langs", "en.*"),
             "retry_count": self.settings.get("retry_count", 2),
-            "retry_delay": self.settings.get("retry_delay", 3)
+            "retry_delay": self.settings.get("retry_delay", 3),
+            "task_logs": self.settings.get("task_logs", True)
         }
     
     def check_clipboard(self):
         """Check clipboard for URLs"""
-        if not self.clipboard_enabled or self.url_input_focused:
+        self._handle_clipboard_text(QClipboard.Mode.Clipboard)
+
+    def check_selection(self):
+        """Check the X11 primary selection for URLs once it stops changing"""
+        self._handle_clipboard_text(QClipboard.Mode.Selection)
+
+    def _handle_clipboard_text(self, mode):
+        if not self.clipboard_enabled or self._is_shutting_down:
             return
         
         try:
-            text = pyperclip.paste()
+            text = QApplication.clipboard().text(mode)
+            if self.clipboard_prefetch and text != self._last_prefetch_clip:
+                # Speculatively fetch metadata even while the user is typing elsewhere
+                self._last_prefetch_clip = text
+                for line in text.splitlines()[:MAX_PENDING]:
+                    if line.strip().startswith("http"):
+                        self.prefetcher.add(line)
+            if self.url_input_focused:
+                return
             if text != self.last_clip and text.startswith("http"):
                 # Only update if URL field is empty or hasn't been modified
                 current_url = self.url_frame.get_url()
@@ -1814,16 +2012,8 @@ class DownloaderAppQt(QMainWindow):
             pass
     
     def load_history(self):
-        """Load history into table"""
-        self.history_frame.clear_all()
-        for item in self.manager.history[:20]:
-            self.history_frame.add_history_item(
-                item["file"],
-                item["location"],
-                item["format"],
-                item["status"],
-                item["url"]
-            )
+        """Show entries added to the history store since the table was last updated"""
+        self.history_frame.refresh_new()
         
         # Update button visibility
         self._update_history_buttons_visibility()
@@ -1893,18 +2083,18 @@ class DownloaderAppQt(QMainWindow):
         # Simplified for now
         QMessageBox.information(self, "Preset", "Preset saving coming soon!")
     
-    def add_log_safe(self, message):
+    def add_log_safe(self, message, task_id=""):
         """Thread-safe log addition"""
-        self._log_buffer.append(message)
+        self._log_buffer.append((message, task_id))
         if not self._log_flush_timer.isActive():
             self._log_flush_timer.start(500)
 
     def _flush_logs(self):
         if not self._log_buffer:
             return
-        combined = "".join(self._log_buffer)
+        chunks = list(self._log_buffer)
         self._log_buffer.clear()
-        self.logs_frame.add_log_raw(combined)
+        self.logs_frame.add_entries(chunks)
         
         # Update logs button visibility
         self._update_logs_button_visibility()
@@ -1971,6 +2161,11 @@ class DownloaderAppQt(QMainWindow):
         auto_add_check.setChecked(self.settings.get("clipboard_auto_add", False))
         general_layout.addWidget(auto_add_check)
         
+        prefetch_check = QCheckBox("Prefetch Info for Copied URLs")
+        prefetch_check.setChecked(self.settings.get("clipboard_prefetch", False))
+        prefetch_check.setToolTip("Fetch titles and thumbnails in the background as soon as a URL is copied")
+        general_layout.addWidget(prefetch_check)
+        
         notify_check = QCheckBox("Enable Notifications")
         notify_check.setChecked(self.settings.get("notifications", True))
         general_layout.addWidget(notify_check)
@@ -2033,6 +2228,24 @@ class DownloaderAppQt(QMainWindow):
         retry_layout.addStretch()
         download_layout.addLayout(retry_layout)
         
+        bandwidth_layout = QHBoxLayout()
+        bandwidth_layout.addWidget(QLabel("Bandwidth Limit (e.g. 5M, 0 = unlimited):"))
+        bandwidth_input = QLineEdit()
+        bandwidth_input.setText(str(self.settings.get("bandwidth_limit", "0")))
+        bandwidth_input.setMaximumWidth(120)
+        bandwidth_layout.addWidget(bandwidth_input)
+        bandwidth_layout.addStretch()
+        download_layout.addLayout(bandwidth_layout)
+        
+        preview_layout = QHBoxLayout()
+        preview_layout.addWidget(QLabel("Parallel Previews:"))
+        preview_spin = QSpinBox()
+        preview_spin.setRange(1, 16)
+        preview_spin.setValue(self.settings.get("preview_workers", DEFAULT_PREVIEW_WORKERS))
+        preview_layout.addWidget(preview_spin)
+        preview_layout.addStretch()
+        download_layout.addLayout(preview_layout)
+        
         layout.addWidget(download_group)
         
         # Media settings group
@@ -2111,12 +2324,15 @@ class DownloaderAppQt(QMainWindow):
         if dialog.exec():
             self.settings["clipboard_enabled"] = clipboard_check.isChecked()
             self.settings["clipboard_auto_add"] = auto_add_check.isChecked()
+            self.settings["clipboard_prefetch"] = prefetch_check.isChecked()
             self.settings["notifications"] = notify_check.isChecked()
             self.settings["max_concurrent"] = max_spin.value()
             self.settings["download_folder"] = folder_input.text()
             self.settings["overwrite_policy"] = overwrite_combo.currentText()
             self.settings["retry_count"] = retry_spin.value()
             self.settings["retry_delay"] = delay_spin.value()
+            self.settings["bandwidth_limit"] = bandwidth_input.text().strip() or "0"
+            self.settings["preview_workers"] = preview_spin.value()
             self.settings["embed_thumbnail"] = embed_thumb_check.isChecked()
             self.settings["embed_metadata"] = embed_meta_check.isChecked()
             self.settings["subtitles"] = subtitles_check.isChecked()
@@ -2124,9 +2340,19 @@ class DownloaderAppQt(QMainWindow):
             self.settings["theme"] = theme_combo.currentText()
             self.settings["high_contrast"] = contrast_check.isChecked()
             
+            was_enabled = self.clipboard_enabled
             self.clipboard_enabled = self.settings["clipboard_enabled"]
             self.clipboard_auto_add = self.settings["clipboard_auto_add"]
+            self.clipboard_prefetch = self.settings["clipboard_prefetch"]
+            if self.clipboard_enabled and not was_enabled:
+                self.check_clipboard()
             self.manager.max_downloads = self.settings["max_concurrent"]
+            # Applies to running downloads without restarting them
+            self.manager.bandwidth.configure(
+                limit=self.settings["bandwidth_limit"],
+                schedule=self.settings.get("bandwidth_schedule", [])
+            )
+            self.preview_pool.configure(width=self.settings["preview_workers"])
             
             self.save_settings()
             self.apply_theme()
@@ -2194,7 +2420,7 @@ class DownloaderAppQt(QMainWindow):
     
     def _update_download_buttons_visibility(self):
         """Show/hide download control buttons based on whether there are downloads"""
-        has_downloads = self.download_table.table.rowCount() > 0
+        has_downloads = self.download_table.row_count() > 0
         self.pause_btn.setVisible(has_downloads)
         self.resume_btn.setVisible(has_downloads)
         self.retry_btn.setVisible(has_downloads)
@@ -2202,26 +2428,22 @@ class DownloaderAppQt(QMainWindow):
     
     def _update_history_buttons_visibility(self):
         """Show/hide history buttons based on whether there's history"""
-        has_history = self.history_frame.table.rowCount() > 0
+        has_history = self.history_frame.has_rows()
         self.open_file_btn.setVisible(has_history)
         self.open_folder_btn.setVisible(has_history)
     
     def _update_logs_button_visibility(self):
         """Show/hide clear logs button based on whether there are logs"""
-        has_logs = len(self.logs_frame.log_text.toPlainText().strip()) > 0
+        has_logs = self.logs_frame.has_logs()
         self.logs_frame.clear_btn.setVisible(has_logs)
 
     def _restore_previews_if_needed(self):
-        if self.preview_cards:
+        if len(self.preview_cards):
             return
         if not self.info_cache:
             return
 
-        from ui_components_qt import PreviewCard
         for url, info in self.info_cache.items():
-            card = PreviewCard()
-            card.apply_theme(self.settings.get("theme", "dark"))
-
             title = info.get("title", "Unknown")
             uploader = info.get("uploader", "Unknown")
             duration = info.get("duration", 0)
@@ -2251,10 +2473,8 @@ class DownloaderAppQt(QMainWindow):
                 duration_str = f"{duration}s"
 
             info_text = f"{uploader}\n{duration_str} | {size_str}"
-            card.set_data(title, info_text)
-
-            self.preview_cards[url] = card
-            self.preview_cards_layout.addWidget(card)
+            self.preview_cards.add(url)
+            self.preview_cards.set_data(url, title, info_text, info.get("thumbnail") or "")
     
     def start_file_conversion(self, input_files, output_format, quality, sample_rate, output_folder, open_after, is_batch=False, gif_mode="reduce_fps"):
         """Start file conversion in worker thread (handles single or batch)"""
@@ -2272,15 +2492,10 @@ class DownloaderAppQt(QMainWindow):
         if len(input_files) > 1:
             # Batch conversion
             self.log_signal.emit(f"Starting batch conversion of {len(input_files)} files...\n")
-            worker = BatchFileConversionWorker(input_files, output_format, quality, sample_rate, FFMPEG_PATH, output_folder, gif_mode)
-            worker.log_signal.connect(self.add_log_safe)
-            worker.single_file_done.connect(self.on_single_conversion_done)
-            worker.finished_signal.connect(self.on_batch_conversion_finished)
-            worker.start()
-            
-            if not hasattr(self, '_batch_file_conversion_worker'):
-                self._batch_file_conversion_worker = None
-            self._batch_file_conversion_worker = worker
+            runner = BatchFileConversionRunner(input_files, output_format, quality, sample_rate, FFMPEG_PATH, output_folder, gif_mode)
+            runner.signals.single_file_done.connect(self.on_single_conversion_done)
+            runner.signals.finished_signal.connect(self.on_batch_conversion_finished)
+            self._start_runner(runner)
         else:
             # Single file conversion
             input_file = input_files[0]
@@ -2295,14 +2510,9 @@ class DownloaderAppQt(QMainWindow):
                 )
             self.log_signal.emit(f"Starting conversion: {os.path.basename(input_file)} → {os.path.basename(output_file)}\n")
             
-            worker = FileConversionWorker(input_file, output_format, quality, sample_rate, FFMPEG_PATH, open_after, output_file_path=output_file, gif_mode=gif_mode)
-            worker.log_signal.connect(self.add_log_safe)
-            worker.finished_signal.connect(self.on_conversion_finished)
-            worker.start()
-            
-            if not hasattr(self, '_file_conversion_worker'):
-                self._file_conversion_worker = None
-            self._file_conversion_worker = worker
+            runner = FileConversionRunner(input_file, output_format, quality, sample_rate, FFMPEG_PATH, open_after, output_file_path=output_file, gif_mode=gif_mode)
+            runner.signals.finished_signal.connect(self.on_conversion_finished)
+            self._start_runner(runner)
     
     def on_conversion_finished(self, success, output_file, open_after):
         """Handle conversion completion"""
@@ -2336,15 +2546,8 @@ class DownloaderAppQt(QMainWindow):
                 except Exception:
                     pass
             # Send completion notification
-            try:
-                if NOTIFY_AVAILABLE and self.settings.get("notifications", True):
-                    notification.notify(
-                        title="Conversion Complete",
-                        message=os.path.basename(output_file),
-                        timeout=5
-                    )
-            except Exception:
-                pass
+            if self.settings.get("notifications", True):
+                self.notifier.notify("Conversion Complete", os.path.basename(output_file))
             # Show back button after successful conversion
             if hasattr(self, '_file_converter_tab'):
                 self._file_converter_tab.back_btn.show()
@@ -0,0 +1,116 @@
+"""Classify yt-dlp failures so only transient errors are retried"""
+
+import re
+from enum import Enum
+
+
+class ErrorClass(Enum):
+    TIMEOUT = "Timeout"
+    SERVER_ERROR = "Server error"
+    RATE_LIMITED = "Rate limited"
+    NETWORK = "Network error"
+    REMOVED = "Removed"
+    PRIVATE = "Private"
+    GEO_BLOCKED = "Geo-blocked"
+    DRM = "DRM protected"
+    LOGIN_REQUIRED = "Login required"
+    NOT_FOUND = "Not found"
+    UNSUPPORTED = "Unsupported URL"
+    UNKNOWN = "Unknown"
+
+
+# Unknown failures keep the old retry behaviour
+TRANSIENT_CLASSES = {
+    ErrorClass.TIMEOUT,
+    ErrorClass.SERVER_ERROR,
+    ErrorClass.RATE_LIMITED,
+    ErrorClass.NETWORK,
+    ErrorClass.UNKNOWN
+}
+
+# Checked in order; the first match wins, so specific patterns come first
+ERROR_PATTERNS = [
+    # YouTube's bot check also mentions --cookies, but it is throttling and passes with time
+    (r"HTTP Error 429|Too Many Requests|rate[- ]limit|confirm you.?re not a bot", ErrorClass.RATE_LIMITED),
+    (r"HTTP Error 5\d\d|Internal Server Error|Bad Gateway|Service Unavailable|Gateway Time-?out", ErrorClass.SERVER_ERROR),
+    (r"timed out|timeout", ErrorClass.TIMEOUT),
+    (r"Private video|This video is private|private (post|account)|is private", ErrorClass.PRIVATE),
+    (r"available in your country|geo[- ]?restrict|blocked it in your country|available from your location", ErrorClass.GEO_BLOCKED),
+    (r"\bDRM\b|protected by digital rights", ErrorClass.DRM),
+    (r"Sign in to confirm your age|login required|requires? (a )?login|account (is )?required|members[- ]only|only available for registered users|use --cookies", ErrorClass.LOGIN_REQUIRED),
+    (r"has been removed|removed by the uploader|account (has been )?terminated|Video unavailable|no longer available|content isn't available|copyright claim", ErrorClass.REMOVED),
+    (r"HTTP Error 404|HTTP Error 410|\b404:? Not Found|does not exist", ErrorClass.NOT_FOUND),
+    (r"Unsupported URL|is not a valid URL|No video formats found|Unable to extract", ErrorClass.UNSUPPORTED),
+    (r"Connection (reset|refused|aborted)|Temporary failure in name resolution|Name or service not known|Network is unreachable|getaddrinfo failed|Remote end closed|IncompleteRead|SSL", ErrorClass.NETWORK),
+]
+
+_COMPILED_PATTERNS = [(re.compile(pattern, re.IGNORECASE), cls) for pattern, cls in ERROR_PATTERNS]
+
+_RETRY_AFTER_PATTERNS = [
+    re.compile(r"Retry-After[:=]?\s*(\d+)()", re.IGNORECASE),
+    re.compile(r"(?:retry|try again) (?:again )?(?:after|in) (\d+)\s*(s|sec|seconds?|m|min|minutes?)\b", re.IGNORECASE),
+]
+
+
+def is_transient(error_class: ErrorClass) -> bool:
+    """Check whether an error class is worth retrying"""
+    return error_class in TRANSIENT_CLASSES
+
+
+def classify_line(line: str):
+    """Classify a single output line, or None if nothing matches"""
+    for pattern, cls in _COMPILED_PATTERNS:
+        if pattern.search(line):
+            return cls
+    return None
+
+
+def classify_output(lines) -> ErrorClass:
+    """Classify the output of a failed yt-dlp run.
+
+    ERROR lines are checked first (last one wins, as yt-dlp prints the
+    final cause last), then WARNING lines. Other output, such as a
+    destination file named "My Private Video", is never classified.
+    """
+    lines = list(lines)
+    error_lines = [line for line in lines if "ERROR" in line]
+    warning_lines = [line for line in lines if "WARNING" in line]
+    for candidates in (error_lines, warning_lines):
+        for line in reversed(candidates):
+            cls = classify_line(line)
+            if cls:
+                return cls
+    return ErrorClass.UNKNOWN
+
+
+def last_error_line(lines) -> str:
+    """Get the last ERROR line of the output, if any"""
+    for line in reversed(list(lines)):
+        if "ERROR" in line:
+            return line.strip()
+    return ""
+
+
+def parse_retry_after(lines):
+    """Get the Retry-After hint in seconds from the output, if the server sent one"""
+    for line in reversed(list(lines)):
+        for pattern in _RETRY_AFTER_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                value = float(match.group(1))
+                if match.group(2).lower().startswith("m"):
+                    value *= 60
+                return value
+    return None
+
+
+def format_error_summary(error_counts: dict, retry_counts: dict = None) -> str:
+    """Format per-class failure counts, e.g. 'Failed: 2 Private, 1 Removed | Retried: 3 Timeout'"""
+    parts = []
+    if error_counts:
+        failed = ", ".join(f"{count} {name}" for name, count in sorted(error_counts.items(), key=lambda kv: -kv[1]))
+        parts.append(f"Failed: {failed}")
+    if retry_counts:
+        retried = ", ".join(f"{count} {name}" for name, count in sorted(retry_counts.items(), key=lambda kv: -kv[1]))
+        parts.append(f"Retried: {retried}")
+    return " | ".join(parts) if parts else "No errors"
@@ -0,0 +1,148 @@
+"""Persistent download history shared by every frontend.
+
+Finished downloads are rows in a SQLite file with a full-text index over
+title, URL, uploader and file name. Reads are keyset pages ordered newest
+first, so a view can fetch rows as it scrolls and pick up new entries with
+`page(after_id=...)` instead of reloading everything.
+"""
+
+import sqlite3
+import threading
+
+# Rows per page handed to views
+PAGE_SIZE = 200
+
+COLUMNS = ("file", "location", "url", "format", "status", "title", "uploader", "timestamp")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    file TEXT NOT NULL DEFAULT '',
+    location TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    format TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    uploader TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS history_status ON history (status, id);
+"""
+
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+    title, url, uploader, file, content='history', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS history_fts_insert AFTER INSERT ON history BEGIN
+    INSERT INTO history_fts (rowid, title, url, uploader, file)
+    VALUES (new.id, new.title, new.url, new.uploader, new.file);
+END;
+CREATE TRIGGER IF NOT EXISTS history_fts_delete AFTER DELETE ON history BEGIN
+    INSERT INTO history_fts (history_fts, rowid, title, url, uploader, file)
+    VALUES ('delete', old.id, old.title, old.url, old.uploader, old.file);
+END;
+"""
+
+
+def fts_query(text: str) -> str:
+    """Every word as a quoted prefix term, so `lofi beat` matches "Lofi Beats Mix" """
+    terms = [word.replace('"', '""') for word in text.split()]
+    return " ".join(f'"{term}"*' for term in terms if term)
+
+
+class HistoryStore:
+    """SQLite-backed history with full-text search and keyset paging"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error:
+            pass
+        self._conn.executescript(SCHEMA)
+        try:
+            self._conn.executescript(FTS_SCHEMA)
+            self.fts = True
+        except sqlite3.Error:
+            # SQLite built without FTS5: search falls back to LIKE scans
+            self.fts = False
+
+    def add(self, entry: dict) -> dict:
+        """Store a history entry (as from DownloadTask.to_dict); returns it with its id"""
+        values = [str(entry.get(column) or "") for column in COLUMNS]
+        with self._lock:
+            cursor = self._conn.execute(
+                f"INSERT INTO history ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})", values
+            )
+        return {**entry, "id": cursor.lastrowid}
+
+    def add_many(self, entries: list):
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    f"INSERT INTO history ({', '.join(COLUMNS)}) VALUES ({', '.join('?' * len(COLUMNS))})",
+                    [[str(entry.get(column) or "") for column in COLUMNS] for entry in entries]
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def page(self, query: str = "", status: str = "", before_id: int = None, after_id: int = None,
+             limit: int = PAGE_SIZE) -> list:
+        """Entries matching `query` and `status`, newest first.
+
+        `before_id` continues a listing below the last row already shown;
+        `after_id` returns only entries added since the newest row shown.
+        """
+        where, params = self._filter(query, status)
+        if before_id is not None:
+            where.append("h.id < ?")
+            params.append(before_id)
+        if after_id is not None:
+            where.append("h.id > ?")
+            params.append(after_id)
+        sql = self._select("h.*", where) + " ORDER BY h.id DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(sql, params + [limit]).fetchall()
+        return [dict(row) for row in rows]
+
+    def count(self, query: str = "", status: str = "") -> int:
+        where, params = self._filter(query, status)
+        with self._lock:
+            return self._conn.execute(self._select("COUNT(*)", where), params).fetchone()[0]
+
+    def latest(self, limit: int = 50) -> list:
+        return self.page(limit=limit)
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+    def _filter(self, query: str, status: str):
+        where, params = [], []
+        match = fts_query(query) if query else ""
+        if match and self.fts:
+            # A subquery runs the full-text match once; as a join, SQLite may probe it per row
+            where.append("h.id IN (SELECT rowid FROM history_fts WHERE history_fts MATCH ?)")
+            params.append(match)
+        elif query.strip():
+            for word in query.split():
+                where.append("(h.title LIKE ? OR h.url LIKE ? OR h.uploader LIKE ? OR h.file LIKE ?)")
+                params.extend([f"%{word}%"] * 4)
+        if status:
+            # With a text match, `+` keeps SQLite from walking the status index instead
+            where.append("+h.status = ?" if query.strip() else "h.status = ?")
+            params.append(status)
+        return where, params
+
+    def _select(self, columns: str, where: list) -> str:
+        sql = f"SELECT {columns} FROM history h"
+        return sql + (" WHERE " + " AND ".join(where) if where else "")
@@ -0,0 +1,226 @@
+"""Shared HTTP client for thumbnails, oEmbed and other small fetches.
+
+`urlopen` opens a new TCP (and TLS) connection for every request. This client
+keeps finished connections per host and reuses them, caps how many requests
+run against one host at once, and can revalidate earlier responses with
+If-None-Match / If-Modified-Since so unchanged resources come back as an
+empty 304.
+"""
+
+import http.client
+import json
+import socket
+import ssl
+import threading
+from collections import OrderedDict
+from urllib.parse import urlsplit, urljoin
+from urllib.request import getproxies, proxy_bypass
+
+# Seconds to wait for a connection or for data
+DEFAULT_TIMEOUT = 15
+
+# Requests in flight per host; extra callers wait for a slot
+MAX_PER_HOST = 4
+
+# Idle connections kept per host
+MAX_IDLE_PER_HOST = 4
+
+# Remembered ETag / Last-Modified responses for conditional requests
+VALIDATOR_ENTRIES = 256
+
+MAX_REDIRECTS = 5
+
+USER_AGENT = "Mozilla/5.0 (compatible; MediaDownloader)"
+
+# Errors that mean a pooled connection was closed by the server while idle
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError,
+                 BrokenPipeError, ConnectionAbortedError)
+
+
+class HttpError(Exception):
+    """A request that did not produce a usable response"""
+
+    def __init__(self, url: str, status: int = 0, reason: str = ""):
+        super().__init__(f"{url}: {status} {reason}".strip() if status else f"{url}: {reason}")
+        self.url = url
+        self.status = status
+
+
+class Response:
+    """A fully read response"""
+
+    def __init__(self, url: str, status: int, headers: dict, body: bytes, revalidated: bool = False):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        # True when the server answered 304 and `body` is the remembered copy
+        self.revalidated = revalidated
+
+    def json(self):
+        return json.loads(self.body.decode("utf-8"))
+
+
+class HttpClient:
+    """Keep-alive connection pool with per-host concurrency limits"""
+
+    def __init__(self, timeout: float = DEFAULT_TIMEOUT, max_per_host: int = MAX_PER_HOST,
+                 user_agent: str = USER_AGENT):
+        self.timeout = timeout
+        self.max_per_host = max(1, int(max_per_host))
+        self.user_agent = user_agent
+        self.connections_opened = 0
+        self._idle = {}
+        self._slots = {}
+        self._validators = OrderedDict()
+        self._lock = threading.Lock()
+        self._ssl = ssl.create_default_context()
+
+    def get(self, url: str, headers: dict = None, conditional: bool = False) -> Response:
+        """GET a URL, following redirects; raises HttpError for failures and 4xx/5xx.
+
+        With `conditional`, a previous response's ETag/Last-Modified are sent and
+        a 304 returns the remembered body.
+        """
+        request_headers = {"User-Agent": self.user_agent, "Accept-Encoding": "identity"}
+        request_headers.update(headers or {})
+        remembered = None
+        if conditional:
+            with self._lock:
+                remembered = self._validators.get(url)
+            if remembered is not None:
+                if remembered.headers.get("etag"):
+                    request_headers["If-None-Match"] = remembered.headers["etag"]
+                if remembered.headers.get("last-modified"):
+                    request_headers["If-Modified-Since"] = remembered.headers["last-modified"]
+
+        target = url
+        for _ in range(MAX_REDIRECTS + 1):
+            status, reason, response_headers, body = self._request(target, request_headers)
+            if status in (301, 302, 303, 307, 308) and response_headers.get("location"):
+                target = urljoin(target, response_headers["location"])
+                # Validators belong to the original URL
+                request_headers.pop("If-None-Match", None)
+                request_headers.pop("If-Modified-Since", None)
+                continue
+            break
+        else:
+            raise HttpError(url, reason="too many redirects")
+
+        if status == 304 and remembered is not None:
+            with self._lock:
+                self._validators.move_to_end(url)
+            return Response(target, 304, remembered.headers, remembered.body, revalidated=True)
+        if status >= 400:
+            raise HttpError(url, status, reason)
+        response = Response(target, status, response_headers, body)
+        if conditional and (response_headers.get("etag") or response_headers.get("last-modified")):
+            with self._lock:
+                self._validators[url] = response
+                self._validators.move_to_end(url)
+                while len(self._validators) > VALIDATOR_ENTRIES:
+                    self._validators.popitem(last=False)
+        return response
+
+    def get_json(self, url: str, conditional: bool = True):
+        return self.get(url, {"Accept": "application/json"}, conditional=conditional).json()
+
+    def close(self):
+        """Close every idle connection"""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _request(self, url: str, headers: dict):
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise HttpError(url, reason="unsupported URL")
+        key = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        proxy = self._proxy_for(parts)
+        if proxy and parts.scheme == "http":
+            # Plain HTTP through a proxy sends the absolute URL
+            path = url
+        with self._slot(key):
+            # A reused connection may have been closed by the server; retry once on a fresh one
+            for attempt in range(2):
+                conn, reused = self._checkout(key, parts, proxy)
+                try:
+                    conn.request("GET", path, headers=headers)
+                    response = conn.getresponse()
+                    body = response.read()
+                except _STALE_ERRORS as e:
+                    conn.close()
+                    if reused and attempt == 0:
+                        continue
+                    raise HttpError(url, reason=str(e) or type(e).__name__)
+                except (OSError, http.client.HTTPException) as e:
+                    conn.close()
+                    raise HttpError(url, reason=str(e) or type(e).__name__)
+                response_headers = {name.lower(): value for name, value in response.getheaders()}
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._checkin(key, conn)
+                return response.status, response.reason, response_headers, body
+
+    def _slot(self, key) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = threading.BoundedSemaphore(self.max_per_host)
+            return slot
+
+    def _checkout(self, key, parts, proxy):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+            self.connections_opened += 1
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        if proxy:
+            proxy_parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+            host, proxy_port = proxy_parts.hostname, proxy_parts.port or 8080
+        else:
+            host, proxy_port = parts.hostname, port
+        if parts.scheme == "https":
+            conn = http.client.HTTPSConnection(host, proxy_port, timeout=self.timeout, context=self._ssl)
+            if proxy:
+                conn.set_tunnel(parts.hostname, port)
+        else:
+            conn = http.client.HTTPConnection(host, proxy_port, timeout=self.timeout)
+        return conn, False
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _proxy_for(self, parts) -> str:
+        """Proxy from the environment, as urlopen would use"""
+        try:
+            if proxy_bypass(parts.hostname):
+                return ""
+        except (socket.error, OSError):
+            pass
+        return getproxies().get(parts.scheme, "")
+
+
+def get_http_client() -> HttpClient:
+    """The process-wide client, created on first use"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HttpClient()
+        return _shared_client
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
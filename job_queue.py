@@ -0,0 +1,330 @@
+"""Shared job queue for running several engine instances as workers.
+
+The queue is a SQLite file that every worker opens, e.g. on shared storage.
+Workers claim jobs under a lease and renew it with heartbeats; a job whose
+lease runs out (because its worker died or lost the share) is handed to the
+next worker that asks. Results and history are written back to the same file.
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+from download_manager import DownloadStatus
+from downloader_core import stop_task_process
+
+# Seconds a claimed job stays assigned without a heartbeat
+LEASE_SECONDS = 30.0
+
+# Jobs whose lease expired this many times are failed instead of reassigned
+MAX_LEASE_ATTEMPTS = 3
+
+# Seconds an idle worker waits before asking for work again
+CLAIM_POLL_INTERVAL = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    options TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'queued',
+    worker TEXT,
+    lease_expires REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created REAL NOT NULL,
+    updated REAL NOT NULL,
+    path TEXT,
+    error TEXT,
+    error_class TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created);
+CREATE TABLE IF NOT EXISTS history (
+    job_id TEXT,
+    worker TEXT,
+    entry TEXT NOT NULL,
+    finished REAL NOT NULL
+);
+"""
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+class SharedJobQueue:
+    """SQLite-backed job queue with leases.
+
+    Each thread gets its own connection. Claims run inside BEGIN IMMEDIATE so
+    two workers can never take the same job.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = LEASE_SECONDS, max_attempts: int = MAX_LEASE_ATTEMPTS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # Rollback journal rather than WAL: WAL needs shared memory, which network filesystems lack
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def _transaction(self):
+        return _Transaction(self._connect())
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def enqueue(self, urls, options: dict = None) -> list:
+        """Add URLs to the queue and return their job ids"""
+        now = time.time()
+        encoded = json.dumps(options or {})
+        ids = []
+        with self._transaction() as conn:
+            for url in urls:
+                job_id = str(uuid.uuid4())
+                conn.execute(
+                    "INSERT INTO jobs (id, url, options, created, updated) VALUES (?, ?, ?, ?, ?)",
+                    (job_id, url, encoded, now, now)
+                )
+                ids.append(job_id)
+        return ids
+
+    def claim(self, worker: str):
+        """Lease the oldest available job to a worker, or return None"""
+        now = time.time()
+        with self._transaction() as conn:
+            # Jobs that ran out of lease too often are given up on
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', error = 'Worker lease expired', error_class = 'Lease expired', "
+                "worker = NULL, updated = ? WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, now, self.max_attempts)
+            )
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY created LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'leased', worker = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated = ? WHERE id = ?",
+                (worker, now + self.lease_seconds, now, row["id"])
+            )
+            # Return the row as leased, not as it was before the update
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+        job = dict(row)
+        job["options"] = json.loads(job["options"] or "{}")
+        return job
+
+    def heartbeat(self, job_ids, worker: str) -> set:
+        """Renew leases; returns the ids this worker no longer holds"""
+        now = time.time()
+        lost = set()
+        with self._transaction() as conn:
+            for job_id in job_ids:
+                cursor = conn.execute(
+                    "UPDATE jobs SET lease_expires = ?, updated = ? "
+                    "WHERE id = ? AND worker = ? AND status = 'leased'",
+                    (now + self.lease_seconds, now, job_id, worker)
+                )
+                if cursor.rowcount == 0:
+                    lost.add(job_id)
+        return lost
+
+    def complete(self, job_id: str, worker: str, status: str, path: str = "", error: str = "",
+                 error_class: str = "", entry: dict = None) -> bool:
+        """Record the result of a job; ignored if the lease has moved to another worker"""
+        now = time.time()
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = ?, path = ?, error = ?, error_class = ?, lease_expires = NULL, "
+                "updated = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+                (status, path, error, error_class, now, job_id, worker)
+            )
+            if cursor.rowcount == 0:
+                return False
+            if entry is not None:
+                conn.execute(
+                    "INSERT INTO history (job_id, worker, entry, finished) VALUES (?, ?, ?, ?)",
+                    (job_id, worker, json.dumps(entry), now)
+                )
+        return True
+
+    def release(self, job_id: str, worker: str):
+        """Give a job back without counting it as an attempt, e.g. on shutdown"""
+        with self._transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL, lease_expires = NULL, "
+                "attempts = MAX(0, attempts - 1), updated = ? WHERE id = ? AND worker = ? AND status = 'leased'",
+                (time.time(), job_id, worker)
+            )
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a job that has not finished; its worker notices on the next heartbeat"""
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'cancelled', lease_expires = NULL, updated = ? "
+                "WHERE id = ? AND status IN ('queued', 'leased')",
+                (time.time(), job_id)
+            )
+            return cursor.rowcount > 0
+
+    def get(self, job_id: str):
+        row = self._connect().execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return dict(row) if row else None
+
+    def counts(self) -> dict:
+        """Number of jobs per status"""
+        rows = self._connect().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def pending(self) -> int:
+        """Jobs that are queued or still leased"""
+        counts = self.counts()
+        return counts.get("queued", 0) + counts.get("leased", 0)
+
+    def history(self, limit: int = 50) -> list:
+        rows = self._connect().execute(
+            "SELECT job_id, worker, entry, finished FROM history ORDER BY finished DESC LIMIT ?", (limit,)
+        ).fetchall()
+        result = []
+        for job_id, worker, entry, finished in rows:
+            item = json.loads(entry)
+            item.update({"job_id": job_id, "worker": worker, "finished": finished})
+            result.append(item)
+        return result
+
+
+class _Transaction:
+    """BEGIN IMMEDIATE ... COMMIT, rolled back on error"""
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def __enter__(self):
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.conn.execute("COMMIT")
+        else:
+            self.conn.execute("ROLLBACK")
+        return False
+
+
+class QueueWorker:
+    """Claims jobs from a SharedJobQueue into a local DownloadManager.
+
+    `submit_url(url, options)` queues a local task for a job (returning it, or
+    None); the local scheduler runs it. Leases are renewed while tasks run and
+    results are written back when they finish.
+    """
+
+    def __init__(self, queue: SharedJobQueue, manager, submit_url, worker_id: str = None,
+                 poll_interval: float = CLAIM_POLL_INTERVAL):
+        self.queue = queue
+        self.manager = manager
+        self.submit_url = submit_url
+        self.worker_id = worker_id or default_worker_id()
+        self.poll_interval = poll_interval
+        self.jobs = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        manager.subscribe("download_completed", self._wake.set)
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, release: bool = True):
+        """Stop claiming; unfinished jobs are handed back to the queue"""
+        self._stopped.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+        self._collect_finished()
+        if release:
+            for job_id, task in list(self.jobs.items()):
+                self.manager.cancel_task(task)
+                stop_task_process(task)
+                self.queue.release(job_id, self.worker_id)
+            self.jobs.clear()
+
+    def is_idle(self) -> bool:
+        return not self.jobs
+
+    def _free_slots(self) -> int:
+        return self.manager.max_downloads - self.manager.get_active_count() - self.manager.get_queue_count()
+
+    def _loop(self):
+        last_heartbeat = time.monotonic()
+        while not self._stopped.is_set():
+            try:
+                self._collect_finished()
+                claimed = False
+                while self._free_slots() > 0 and not self._stopped.is_set():
+                    job = self.queue.claim(self.worker_id)
+                    if job is None:
+                        break
+                    claimed = True
+                    task = self.submit_url(job["url"], job["options"])
+                    if task is None:
+                        self.queue.complete(job["id"], self.worker_id, "failed", error="Rejected by worker")
+                        continue
+                    self.jobs[job["id"]] = task
+                if time.monotonic() - last_heartbeat >= self.queue.lease_seconds / 3:
+                    last_heartbeat = time.monotonic()
+                    self._heartbeat()
+            except sqlite3.Error as e:
+                # Shared storage hiccups must not kill the worker; the lease covers the gap
+                print(f"Shared queue error: {e}")
+                claimed = False
+            if not claimed:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
+
+    def _heartbeat(self):
+        if not self.jobs:
+            return
+        for job_id in self.queue.heartbeat(list(self.jobs), self.worker_id):
+            # Cancelled remotely or reassigned after we missed our lease
+            task = self.jobs.pop(job_id, None)
+            if task is not None:
+                self.manager.cancel_task(task)
+                stop_task_process(task)
+
+    def _collect_finished(self):
+        for job_id, task in list(self.jobs.items()):
+            if task.status == DownloadStatus.COMPLETED:
+                status = "completed"
+            elif task.status == DownloadStatus.FAILED:
+                status = "failed"
+            elif task.status == DownloadStatus.CANCELLED:
+                status = "cancelled"
+            else:
+                continue
+            self.jobs.pop(job_id, None)
+            self.queue.complete(
+                job_id, self.worker_id, status,
+                path=task.path, error=task.last_error, error_class=task.error_class,
+                entry=task.to_dict()
+            )
@@ -0,0 +1,346 @@
+"""Local HTTP/JSON API for submitting and monitoring downloads.
+
+Endpoints:
+    POST /jobs                      {"urls": [...], "format": "mp3", "priority": 0}
+    GET  /jobs?status=&platform=&offset=&limit=
+    GET  /jobs/<id>
+    POST /jobs/<id>/pause|resume|cancel
+    GET  /summary
+    GET  /events                    server-sent events, one "snapshot" per change
+
+Status reads are served from a snapshot rebuilt by a single publisher thread,
+so polls never contend with the download threads for the manager lock.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from download_manager import DownloadStatus
+from downloader_core import stop_task_process
+
+# Minimum seconds between snapshot rebuilds while tasks are changing
+SNAPSHOT_INTERVAL = 0.25
+
+# Snapshots are rebuilt at least this often even without manager events
+SNAPSHOT_MAX_AGE = 1.0
+
+# Largest request body accepted, in bytes
+MAX_BODY = 4 * 1024 * 1024
+
+# Seconds between SSE keep-alive comments on an idle stream
+SSE_KEEPALIVE = 15.0
+
+
+def task_to_json(task) -> dict:
+    """Serialize the fields of a task that API clients see"""
+    return {
+        "id": task.task_id,
+        "url": task.url,
+        "path": task.path,
+        "format": task.format_choice,
+        "platform": task.platform,
+        "status": task.status.value,
+        "progress": round(task.progress, 1),
+        "speed": task.speed,
+        "eta": task.eta,
+        "size": task.file_size,
+        "error": task.last_error,
+        "error_class": task.error_class,
+        "priority": task.priority,
+        "started": task.start_time.isoformat()
+    }
+
+
+class Snapshot:
+    """Immutable view of every job at one point in time"""
+
+    def __init__(self, version: int, jobs: list, summary: dict):
+        self.version = version
+        self.jobs = jobs
+        self.by_id = {job["id"]: job for job in jobs}
+        self.summary = summary
+        self.jobs_body = json.dumps({"version": version, "jobs": jobs}).encode("utf-8")
+        self.summary_body = json.dumps(summary).encode("utf-8")
+
+
+class SnapshotPublisher:
+    """Rebuilds the job snapshot after manager events, at a bounded rate.
+
+    Readers take `self.current` without any lock; the reference is swapped
+    atomically once a new snapshot is complete.
+    """
+
+    def __init__(self, manager, tasks: dict, interval: float = SNAPSHOT_INTERVAL):
+        self.manager = manager
+        self.tasks = tasks
+        self.interval = interval
+        self.current = Snapshot(0, [], {})
+        self._dirty = threading.Event()
+        self._changed = threading.Condition()
+        self._stopped = threading.Event()
+        self._build_lock = threading.Lock()
+        self._thread = None
+        for event in ("queue_updated", "download_started", "download_progress", "download_completed"):
+            manager.subscribe(event, self._dirty.set)
+
+    def start(self):
+        self.rebuild()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._dirty.set()
+        with self._changed:
+            self._changed.notify_all()
+
+    def mark_dirty(self):
+        self._dirty.set()
+
+    def rebuild(self):
+        """Build and publish a new snapshot"""
+        with self._build_lock:
+            jobs = [task_to_json(task) for task in list(self.tasks.values())]
+            counts = {}
+            for job in jobs:
+                counts[job["status"]] = counts.get(job["status"], 0) + 1
+            summary = {
+                "total": len(jobs),
+                "counts": counts,
+                "errors": dict(self.manager.error_counts),
+                "retries": dict(self.manager.retry_counts)
+            }
+            snapshot = Snapshot(self.current.version + 1, jobs, summary)
+            self.current = snapshot
+        with self._changed:
+            self._changed.notify_all()
+        return snapshot
+
+    def wait_for_change(self, version: int, timeout: float) -> Snapshot:
+        """Block until a snapshot newer than `version` exists, or the timeout passes"""
+        with self._changed:
+            self._changed.wait_for(
+                lambda: self.current.version > version or self._stopped.is_set(),
+                timeout
+            )
+        return self.current
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            self._dirty.wait(SNAPSHOT_MAX_AGE)
+            if self._stopped.is_set():
+                break
+            self._dirty.clear()
+            self.rebuild()
+            # Coalesce bursts of progress events into one rebuild per interval
+            time.sleep(self.interval)
+
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MediaDownloaderAPI/1.0"
+    # Headers and body are separate writes; without this keep-alive polls stall on delayed ACKs
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        # Keep stderr for the CLI's own progress output
+        pass
+
+    # Responses
+
+    def _send(self, status: int, body: bytes, content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_json(self, status: int, payload):
+        self._send(status, json.dumps(payload).encode("utf-8"))
+
+    def _error(self, status: int, message: str):
+        self._send_json(status, {"error": message})
+
+    def _read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            raise ValueError("request body too large")
+        raw = self.rfile.read(length) if length else b""
+        return json.loads(raw.decode("utf-8")) if raw else {}
+
+    # Routing
+
+    def do_GET(self):
+        api = self.server.api
+        parsed = urlparse(self.path)
+        parts = [p for p in parsed.path.split("/") if p]
+        snapshot = api.publisher.current
+
+        if parts == ["jobs"]:
+            query = parse_qs(parsed.query)
+            if not query:
+                self._send(200, snapshot.jobs_body)
+                return
+            self._send_json(200, {"version": snapshot.version, "jobs": filter_jobs(snapshot.jobs, query)})
+        elif len(parts) == 2 and parts[0] == "jobs":
+            job = snapshot.by_id.get(parts[1])
+            if job is None:
+                self._error(404, "no such job")
+            else:
+                self._send_json(200, job)
+        elif parts == ["summary"]:
+            self._send(200, snapshot.summary_body)
+        elif parts == ["events"]:
+            self._stream_events()
+        else:
+            self._error(404, "not found")
+
+    def do_POST(self):
+        api = self.server.api
+        parts = [p for p in urlparse(self.path).path.split("/") if p]
+        try:
+            body = self._read_json()
+        except ValueError as e:
+            self._error(400, f"invalid JSON: {e}")
+            return
+
+        if parts == ["jobs"]:
+            urls = body.get("urls") if isinstance(body, dict) else None
+            if isinstance(urls, str):
+                urls = [urls]
+            if not urls or not isinstance(urls, list):
+                self._error(400, "expected {\"urls\": [...]}")
+                return
+            options = {k: body[k] for k in ("format", "priority", "weight") if k in body}
+            ids, skipped = api.submit(urls, options)
+            self._send_json(201 if ids else 200, {"ids": ids, "skipped": skipped})
+        elif len(parts) == 3 and parts[0] == "jobs" and parts[2] in ("pause", "resume", "cancel"):
+            ok, message = api.control(parts[1], parts[2])
+            if ok:
+                self._send_json(200, {"id": parts[1], "status": message})
+            else:
+                self._error(404 if message == "no such job" else 409, message)
+        else:
+            self._error(404, "not found")
+
+    def _stream_events(self):
+        """Stream a snapshot event whenever anything changes"""
+        publisher = self.server.api.publisher
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        version = -1
+        try:
+            while not self.server.api.stopped.is_set():
+                snapshot = publisher.wait_for_change(version, SSE_KEEPALIVE)
+                if snapshot.version == version:
+                    self.wfile.write(b": keep-alive\n\n")
+                else:
+                    version = snapshot.version
+                    self.wfile.write(
+                        b"event: snapshot\nid: " + str(version).encode() +
+                        b"\ndata: " + snapshot.jobs_body + b"\n\n"
+                    )
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def filter_jobs(jobs: list, query: dict) -> list:
+    """Filter snapshot jobs by ?status=, ?platform= and page with ?offset=&limit="""
+    statuses = {s.lower() for value in query.get("status", []) for s in value.split(",") if s}
+    platforms = {p.lower() for value in query.get("platform", []) for p in value.split(",") if p}
+    result = [
+        job for job in jobs
+        if (not statuses or job["status"].lower() in statuses)
+        and (not platforms or job["platform"].lower() in platforms)
+    ]
+    try:
+        offset = max(0, int(query.get("offset", ["0"])[0]))
+        limit = int(query.get("limit", ["0"])[0])
+    except ValueError:
+        return result
+    return result[offset:offset + limit] if limit > 0 else result[offset:]
+
+
+class JobServer:
+    """HTTP front end over a DownloadManager.
+
+    `submit_url(url, options)` creates and queues a task (returning it, or None
+    when the URL is skipped); the caller's scheduler runs it like any other task.
+    """
+
+    def __init__(self, manager, submit_url, host: str = "127.0.0.1", port: int = 8765):
+        self.manager = manager
+        self.submit_url = submit_url
+        self.tasks = {}
+        self.stopped = threading.Event()
+        self.publisher = SnapshotPublisher(manager, self.tasks)
+        self.httpd = ThreadingHTTPServer((host, port), JobRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self
+        self._thread = None
+
+    @property
+    def address(self):
+        return self.httpd.server_address[:2]
+
+    def track(self, task):
+        """Expose a task queued outside the API (e.g. from the command line)"""
+        self.tasks[task.task_id] = task
+        self.publisher.mark_dirty()
+
+    def submit(self, urls: list, options: dict):
+        ids, skipped = [], []
+        for url in urls:
+            url = str(url).strip()
+            task = self.submit_url(url, options) if url else None
+            if task is None:
+                skipped.append(url)
+                continue
+            self.tasks[task.task_id] = task
+            ids.append(task.task_id)
+        # Submitters expect to see their jobs on the very next poll
+        self.publisher.rebuild()
+        return ids, skipped
+
+    def control(self, task_id: str, action: str):
+        """Pause, resume or cancel a task; returns (ok, new status or reason)"""
+        task = self.tasks.get(task_id)
+        if task is None:
+            return False, "no such job"
+        if action == "cancel":
+            if task.status in [DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED]:
+                return False, f"job already {task.status.value.lower()}"
+            self.manager.cancel_task(task)
+            stop_task_process(task)
+        elif action == "pause":
+            if task.status not in [DownloadStatus.QUEUED, DownloadStatus.DOWNLOADING]:
+                return False, f"cannot pause a {task.status.value.lower()} job"
+            self.manager.pause_task(task)
+            stop_task_process(task)
+        elif action == "resume":
+            if task.status != DownloadStatus.PAUSED:
+                return False, f"cannot resume a {task.status.value.lower()} job"
+            self.manager.resume_task(task)
+        self.publisher.rebuild()
+        return True, task.status.value
+
+    def start(self):
+        """Serve in a background thread"""
+        self.publisher.start()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self):
+        self.stopped.set()
+        self.publisher.stop()
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,196 @@
+"""Routing of yt-dlp output before it reaches a frontend.
+
+Most of a download's output is `[download]  42.0% of ...` progress lines,
+which the download table already shows. LogRouter passes one progress line
+per task every PROGRESS_SAMPLE_SECONDS (plus the final 100% line) to the
+log callback, sends warnings and errors to an error callback, and hands
+every line, unfiltered, to a background writer that keeps rotating per-task
+log files.
+"""
+
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+
+from log_store import classify_level
+from config import user_cache_dir
+
+# Seconds between progress lines forwarded per task
+PROGRESS_SAMPLE_SECONDS = 5.0
+
+# A task's log file is rotated to <name>.1 before it grows past this size
+MAX_LOG_BYTES = 1024 * 1024
+
+# Task log files kept in the directory; the oldest are deleted
+MAX_LOG_FILES = 200
+
+# Log files held open by the writer thread
+OPEN_FILES = 32
+
+
+def default_log_dir() -> str:
+    """Per-user directory for task logs, next to the thumbnail cache"""
+    return os.path.join(user_cache_dir(), "logs")
+
+
+def is_progress_line(line: str) -> bool:
+    return "[download]" in line and "%" in line
+
+
+class LogFileWriter:
+    """Appends log text to per-task files on a single background thread"""
+
+    def __init__(self, log_dir: str = None, max_bytes: int = MAX_LOG_BYTES, max_files: int = MAX_LOG_FILES):
+        self.log_dir = log_dir or default_log_dir()
+        self.max_bytes = max_bytes
+        self.max_files = max_files
+        self._queue = queue.Queue()
+        self._files = OrderedDict()
+        self._thread = threading.Thread(target=self._loop, daemon=True)
+        self._thread.start()
+
+    def path_for(self, task_id: str) -> str:
+        return os.path.join(self.log_dir, f"{task_id}.log")
+
+    def write(self, task_id: str, text: str):
+        self._queue.put((task_id, text))
+
+    def close_task(self, task_id: str):
+        """Close a finished task's file once its queued lines are written"""
+        self._queue.put((task_id, None))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far is on disk"""
+        done = threading.Event()
+        self._queue.put((None, done))
+        return done.wait(timeout)
+
+    def _loop(self):
+        while True:
+            task_id, text = self._queue.get()
+            # Drain what is already queued so a burst costs one flush per file
+            batch = [(task_id, text)]
+            while len(batch) < 1000:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            touched = set()
+            for task_id, text in batch:
+                try:
+                    if task_id is None:
+                        for handle in self._files.values():
+                            handle.flush()
+                        text.set()
+                    elif text is None:
+                        handle = self._files.pop(task_id, None)
+                        if handle:
+                            handle.close()
+                    else:
+                        handle = self._open(task_id)
+                        if handle.tell() and handle.tell() + len(text) > self.max_bytes:
+                            self._rotate(task_id)
+                            handle = self._open(task_id)
+                        handle.write(text)
+                        touched.add(task_id)
+                except Exception as e:
+                    print(f"Task log write failed: {e}")
+            for task_id in touched:
+                handle = self._files.get(task_id)
+                if handle:
+                    try:
+                        handle.flush()
+                    except Exception:
+                        pass
+
+    def _open(self, task_id: str):
+        handle = self._files.get(task_id)
+        if handle is not None:
+            self._files.move_to_end(task_id)
+            return handle
+        os.makedirs(self.log_dir, exist_ok=True)
+        path = self.path_for(task_id)
+        if not os.path.exists(path):
+            self._prune()
+        handle = self._files[task_id] = open(path, "a", encoding="utf-8", errors="replace")
+        while len(self._files) > OPEN_FILES:
+            self._files.popitem(last=False)[1].close()
+        return handle
+
+    def _rotate(self, task_id: str):
+        self._files.pop(task_id).close()
+        path = self.path_for(task_id)
+        os.replace(path, path + ".1")
+
+    def _prune(self):
+        """Delete the oldest task logs once the directory holds max_files"""
+        logs = {}
+        try:
+            for entry in os.scandir(self.log_dir):
+                if entry.name.endswith((".log", ".log.1")):
+                    # A task just rotated may only have its .1 file
+                    path = os.path.join(self.log_dir, entry.name.rsplit(".log", 1)[0] + ".log")
+                    logs[path] = max(logs.get(path, 0), entry.stat().st_mtime)
+        except OSError:
+            return
+        if len(logs) < self.max_files:
+            return
+        for path in sorted(logs, key=logs.get)[:len(logs) - self.max_files + 1]:
+            for name in (path, path + ".1"):
+                try:
+                    os.remove(name)
+                except OSError:
+                    pass
+
+
+class LogRouter:
+    """Callable log sink for one task: samples progress, splits errors, keeps the full log on disk"""
+
+    def __init__(self, task_id: str, on_log=None, on_error=None, writer: LogFileWriter = None,
+                 sample_seconds: float = PROGRESS_SAMPLE_SECONDS, clock=time.monotonic):
+        self.task_id = task_id
+        self.on_log = on_log
+        self.on_error = on_error
+        self.writer = writer
+        self.sample_seconds = sample_seconds
+        self.clock = clock
+        self.forwarded = 0
+        self.dropped = 0
+        self._last_progress = None
+
+    def __call__(self, line: str):
+        if self.writer is not None:
+            self.writer.write(self.task_id, line if line.endswith("\n") else line + "\n")
+        if is_progress_line(line):
+            now = self.clock()
+            due = self._last_progress is None or now - self._last_progress >= self.sample_seconds
+            if not (due or "100%" in line):
+                self.dropped += 1
+                return
+            self._last_progress = now
+        elif self.on_error is not None and classify_level(line) in ("warning", "error"):
+            self.forwarded += 1
+            self.on_error(line)
+            return
+        if self.on_log is not None:
+            self.forwarded += 1
+            self.on_log(line)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close_task(self.task_id)
+
+
+def get_log_writer() -> LogFileWriter:
+    """The process-wide task log writer, started on first use"""
+    global _shared_writer
+    with _shared_lock:
+        if _shared_writer is None:
+            _shared_writer = LogFileWriter()
+        return _shared_writer
+
+
+_shared_writer = None
+_shared_lock = threading.Lock()
@@ -0,0 +1,110 @@
+"""Bounded in-memory log store with per-task buffers.
+
+Every line goes into one global ring buffer and, when it belongs to a
+download, into that task's own ring buffer, so a task's output survives
+after chatter from other tasks has pushed it out of the global view. All
+buffers are fixed-size deques: appends are O(1) and memory is capped no
+matter how long the session runs.
+"""
+
+import threading
+from collections import OrderedDict, deque
+from typing import NamedTuple
+
+LEVELS = ("debug", "info", "warning", "error")
+_LEVEL_RANK = {level: rank for rank, level in enumerate(LEVELS)}
+
+# Lines kept across all tasks
+GLOBAL_LINES = 20000
+
+# Lines kept per task, and how many tasks keep their own buffer
+TASK_LINES = 2000
+MAX_TASKS = 200
+
+# Longer lines (e.g. a dumped JSON document) are truncated
+MAX_LINE_CHARS = 2000
+
+
+class LogEntry(NamedTuple):
+    seq: int
+    task_id: str
+    level: str
+    text: str
+
+
+def classify_level(line: str) -> str:
+    """Level of a log line from yt-dlp's prefixes and the app's markers"""
+    head = line.lstrip()[:16].lower()
+    if head.startswith(("error", "✗", "[error]")) or "error:" in head:
+        return "error"
+    if head.startswith(("warning", "[warning]")):
+        return "warning"
+    if head.startswith("[debug]"):
+        return "debug"
+    return "info"
+
+
+def level_at_least(level: str, minimum: str) -> bool:
+    return _LEVEL_RANK.get(level, 1) >= _LEVEL_RANK.get(minimum, 0)
+
+
+class LogStore:
+    """Global and per-task ring buffers of log lines"""
+
+    def __init__(self, max_lines: int = GLOBAL_LINES, task_lines: int = TASK_LINES, max_tasks: int = MAX_TASKS):
+        self.task_lines = task_lines
+        self.max_tasks = max_tasks
+        self._lines = deque(maxlen=max_lines)
+        self._tasks = OrderedDict()
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def append(self, text: str, task_id: str = "") -> list:
+        """Add the lines of `text`; returns the new entries"""
+        entries = []
+        with self._lock:
+            buffer = None
+            if task_id:
+                buffer = self._tasks.get(task_id)
+                if buffer is None:
+                    buffer = self._tasks[task_id] = deque(maxlen=self.task_lines)
+                    while len(self._tasks) > self.max_tasks:
+                        self._tasks.popitem(last=False)
+                else:
+                    self._tasks.move_to_end(task_id)
+            for line in text.splitlines():
+                if not line.strip():
+                    continue
+                if len(line) > MAX_LINE_CHARS:
+                    line = line[:MAX_LINE_CHARS] + "…"
+                self._seq += 1
+                entry = LogEntry(self._seq, task_id, classify_level(line), line)
+                self._lines.append(entry)
+                if buffer is not None:
+                    buffer.append(entry)
+                entries.append(entry)
+        return entries
+
+    def lines(self, task_id: str = None, min_level: str = "debug", text: str = "", limit: int = None) -> list:
+        """Entries matching a task (None for all), a minimum level and a substring; newest last"""
+        with self._lock:
+            source = list(self._tasks.get(task_id, ())) if task_id else list(self._lines)
+        needle = text.lower()
+        matched = [
+            entry for entry in source
+            if level_at_least(entry.level, min_level) and (not needle or needle in entry.text.lower())
+        ]
+        return matched[-limit:] if limit else matched
+
+    def tasks(self) -> list:
+        """Ids of tasks with a buffer, least recently logged first"""
+        with self._lock:
+            return list(self._tasks)
+
+    def clear(self):
+        with self._lock:
+            self._lines.clear()
+            self._tasks.clear()
+
+    def __len__(self) -> int:
+        return len(self._lines)
@@ -0,0 +1,63 @@
+"""Compact model of yt-dlp -J output.
+
+A single `-J` document carries every format with its fragment list and HTTP
+headers, caption URLs for a hundred languages and more; megabytes per video
+of which the frontends read a dozen fields. `parse_media_info` prunes while
+the JSON is decoded, so the bulky parts are dropped as soon as each object is
+built instead of after the whole tree exists, and returns a plain dict with
+only those fields plus a small format table. Callers keep using `.get()`.
+"""
+
+import json
+
+# Top-level fields kept from the -J output
+INFO_FIELDS = (
+    "id", "title", "uploader", "duration", "upload_date", "thumbnail",
+    "webpage_url", "original_url", "extractor_key", "playlist_count"
+)
+
+# Per-format fields used for size estimates and quality detection
+FORMAT_FIELDS = ("format_id", "ext", "vcodec", "acodec", "height", "filesize", "filesize_approx")
+_FORMAT_FIELD_SET = frozenset(FORMAT_FIELDS)
+
+# Keys that are never read and can be large on their own
+DROP_KEYS = frozenset((
+    "fragments", "http_headers", "automatic_captions", "subtitles", "requested_formats",
+    "requested_downloads", "requested_subtitles", "heatmap", "chapters", "description",
+    "tags", "categories", "downloader_options", "_format_sort_fields", "_version"
+))
+
+
+def _prune(pairs: list) -> dict:
+    """object_pairs_hook: shrink each JSON object as soon as it is decoded"""
+    keys = {key for key, _ in pairs}
+    if "format_id" in keys and "extractor" not in keys:
+        # A format entry (the video itself also has a format_id, but names its extractor)
+        return {key: value for key, value in pairs if key in _FORMAT_FIELD_SET and value is not None}
+    return {key: value for key, value in pairs if key not in DROP_KEYS}
+
+
+def compact_info(info: dict) -> dict:
+    """Reduce yt-dlp -J output (full or already pruned) to the fields the frontends use"""
+    compact = {key: info[key] for key in INFO_FIELDS if info.get(key) not in (None, "")}
+    if not compact.get("thumbnail") and info.get("thumbnails"):
+        try:
+            compact["thumbnail"] = info["thumbnails"][-1]["url"]
+        except (KeyError, IndexError, TypeError):
+            pass
+    formats = []
+    for fmt in info.get("formats") or []:
+        # Storyboards and other image-only formats are never downloaded
+        if fmt.get("vcodec") == "none" and fmt.get("acodec") == "none":
+            continue
+        # Formats without a size or height do not help estimates or the quality list
+        if not (fmt.get("filesize") or fmt.get("filesize_approx") or fmt.get("height")):
+            continue
+        formats.append({key: fmt[key] for key in FORMAT_FIELDS if fmt.get(key) is not None})
+    compact["formats"] = formats
+    return compact
+
+
+def parse_media_info(text: str) -> dict:
+    """Decode yt-dlp -J output straight into the compact model"""
+    return compact_info(json.loads(text, object_pairs_hook=_prune))
@@ -0,0 +1,279 @@
+"""Persistent cache of yt-dlp media metadata shared by every frontend.
+
+Entries are keyed by a canonical media id derived from the URL (so youtu.be,
+watch?v= and music.youtube.com links for one video share an entry) and hold
+the compact model from media_info rather than the full `-J` blob. Entries
+live in a SQLite file with an LRU size cap; recently used ones are also kept
+in memory so lookups do not touch the disk. Expired entries are still returned while a
+background thread fetches a fresh copy.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+from downloader_core import detect_platform
+from media_info import compact_info
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# How long metadata stays fresh, per detect_platform() name. Instagram, TikTok
+# and Facebook hand out signed thumbnail URLs that expire within a day or so.
+DEFAULT_TTLS = {
+    "YouTube": 7 * DAY,
+    "YT Music": 7 * DAY,
+    "Spotify": 30 * DAY,
+    "Instagram": 12 * HOUR,
+    "Facebook": 12 * HOUR,
+    "TikTok": 12 * HOUR
+}
+DEFAULT_TTL = 3 * DAY
+
+# Entries kept on disk and in memory
+MAX_ENTRIES = 5000
+MEMORY_ENTRIES = 500
+
+# Pending access-time updates written in one go
+TOUCH_FLUSH_SIZE = 64
+
+# Query parameters that never change what a URL points to
+TRACKING_PARAMS = ("utm_", "si", "feature", "igsh", "igshid", "fbclid", "is_from_webapp", "sender_device")
+
+_KEY_PATTERNS = (
+    ("youtube", re.compile(r"(?:youtube\.com/(?:shorts|live|embed|v)/|youtu\.be/)([\w-]{11})")),
+    ("instagram", re.compile(r"instagram\.com/(?:[\w.]+/)?(?:p|reels?|tv)/([\w-]+)")),
+    ("tiktok", re.compile(r"tiktok\.com/.*?/video/(\d+)")),
+    ("facebook", re.compile(r"facebook\.com/(?:.*?/)?videos/(?:[\w.-]+/)?(\d+)")),
+    ("spotify", re.compile(r"open\.spotify\.com/(?:intl-\w+/)?((?:track|album|playlist|episode|show)/\w+)"))
+)
+
+# detect_platform() misses short links such as youtu.be, so keys decide when they can
+KEY_PLATFORMS = {
+    "youtube": "YouTube",
+    "instagram": "Instagram",
+    "tiktok": "TikTok",
+    "facebook": "Facebook",
+    "spotify": "Spotify"
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    platform TEXT NOT NULL,
+    info TEXT NOT NULL,
+    fetched REAL NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+"""
+
+
+def media_key(url: str) -> str:
+    """Canonical id for the media a URL points to"""
+    url = url.strip()
+    for prefix, pattern in _KEY_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return f"{prefix}:{match.group(1)}"
+    parts = urlsplit(url)
+    query = parse_qsl(parts.query, keep_blank_values=True)
+    host = parts.netloc.lower()
+    if host.startswith(("www.", "m.")):
+        host = host.split(".", 1)[1]
+    if "youtube.com" in host:
+        video = dict(query).get("v")
+        if video:
+            return f"youtube:{video}"
+    if "facebook.com" in host:
+        video = dict(query).get("v")
+        if video:
+            return f"facebook:{video}"
+    query = sorted((k, v) for k, v in query if not k.lower().startswith(TRACKING_PARAMS))
+    path = parts.path.rstrip("/") or "/"
+    return f"url:{host}{path}" + (f"?{urlencode(query)}" if query else "")
+
+
+class MetadataCache:
+    """SQLite-backed metadata cache with an in-memory LRU in front.
+
+    `fetcher(url)` is used to refresh expired entries in the background; it
+    should return yt-dlp -J output (fetch_media_info) or {} on failure.
+    Several processes may open the same file.
+    """
+
+    def __init__(self, path: str, fetcher=None, ttls: dict = None,
+                 max_entries: int = MAX_ENTRIES, memory_entries: int = MEMORY_ENTRIES):
+        self.path = path
+        self.fetcher = fetcher
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.max_entries = max(1, int(max_entries))
+        self.memory_entries = max(1, int(memory_entries))
+        self._memory = OrderedDict()
+        self._touched = {}
+        self._lock = threading.RLock()
+        self._refresh_queue = deque()
+        self._refreshing = set()
+        self._refresh_thread = None
+        self._conn = sqlite3.connect(path, timeout=10, check_same_thread=False, isolation_level=None)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error:
+            pass
+        self._conn.executescript(SCHEMA)
+        self._count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def ttl_for(self, platform: str) -> float:
+        return self.ttls.get(platform, DEFAULT_TTL)
+
+    def get(self, url: str, allow_stale: bool = True):
+        """Return cached metadata for a URL, or None.
+
+        An expired entry is returned as well (unless `allow_stale` is False)
+        and queued for a background refresh.
+        """
+        key = media_key(url)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            else:
+                try:
+                    row = self._conn.execute(
+                        "SELECT platform, info, fetched FROM entries WHERE key = ?", (key,)
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row is None:
+                    return None
+                entry = (json.loads(row[1]), row[2], row[0])
+                self._remember(key, entry)
+            self._touch(key, now)
+        info, fetched, platform = entry
+        if now - fetched < self.ttl_for(platform):
+            return info
+        if self.fetcher is not None:
+            self._schedule_refresh(url, key)
+        return info if allow_stale else None
+
+    def put(self, url: str, info: dict) -> dict:
+        """Store metadata for a URL and return the compact copy that was cached"""
+        if not info:
+            return info
+        compact = compact_info(info)
+        key = media_key(url)
+        platform = detect_platform(url)
+        if platform == "Unknown":
+            platform = KEY_PLATFORMS.get(key.split(":", 1)[0], platform)
+        now = time.time()
+        with self._lock:
+            self._remember(key, (compact, now, platform))
+            self._touched.pop(key, None)
+            try:
+                exists = self._conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, url, platform, info, fetched, accessed) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, url, platform, json.dumps(compact, separators=(",", ":")), now, now)
+                )
+                if not exists:
+                    self._count += 1
+                self._flush_touched()
+                if self._count > self.max_entries:
+                    self._evict()
+            except sqlite3.Error as e:
+                print(f"Metadata cache error: {e}")
+        return compact
+
+    def invalidate(self, url: str):
+        key = media_key(url)
+        with self._lock:
+            self._memory.pop(key, None)
+            self._touched.pop(key, None)
+            try:
+                if self._conn.execute("DELETE FROM entries WHERE key = ?", (key,)).rowcount:
+                    self._count -= 1
+            except sqlite3.Error:
+                pass
+
+    def __len__(self) -> int:
+        return self._count
+
+    def close(self):
+        with self._lock:
+            try:
+                self._flush_touched()
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+    def _remember(self, key: str, entry: tuple):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key: str, now: float):
+        # Access times only order eviction, so they are written in batches
+        self._touched[key] = now
+        if len(self._touched) >= TOUCH_FLUSH_SIZE:
+            try:
+                self._flush_touched()
+            except sqlite3.Error:
+                pass
+
+    def _flush_touched(self):
+        if not self._touched:
+            return
+        touched = [(accessed, key) for key, accessed in self._touched.items()]
+        self._touched.clear()
+        self._conn.executemany("UPDATE entries SET accessed = ? WHERE key = ?", touched)
+
+    def _evict(self):
+        """Drop the least recently used entries beyond max_entries (caller holds the lock)"""
+        # Re-count: other processes share the file
+        self._count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        keys = [row[0] for row in self._conn.execute(
+            "SELECT key FROM entries ORDER BY accessed LIMIT ?", (excess,)
+        )]
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+        for key in keys:
+            self._memory.pop(key, None)
+        self._count -= len(keys)
+
+    def _schedule_refresh(self, url: str, key: str):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            self._refresh_queue.append((url, key))
+            if self._refresh_thread is None or not self._refresh_thread.is_alive():
+                self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+                self._refresh_thread.start()
+
+    def _refresh_loop(self):
+        while True:
+            with self._lock:
+                if not self._refresh_queue:
+                    self._refresh_thread = None
+                    return
+                url, key = self._refresh_queue.popleft()
+            try:
+                info = self.fetcher(url)
+                if info:
+                    self.put(url, info)
+            except Exception as e:
+                print(f"Metadata refresh failed for {url}: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
@@ -0,0 +1,144 @@
+"""Coalesced completion notifications shared by the frontends.
+
+The first download to finish opens a COALESCE_MS window; everything that
+finishes inside it is reported once, as a CompletionSummary ("37 completed,
+2 failed"), instead of a dialog and a notification per file. Desktop
+notifications go through one long-lived Notifier thread, so a burst of
+completions never starts a thread each.
+"""
+
+import os
+import queue
+import threading
+from collections import Counter
+
+from download_manager import DownloadStatus
+
+try:
+    from plyer import notification
+    NOTIFY_AVAILABLE = True
+except Exception:
+    notification = None
+    NOTIFY_AVAILABLE = False
+
+# Completions arriving this long after the first one share its summary
+COALESCE_MS = 1500
+
+# Order and wording of the counts in a summary line
+SUMMARY_STATUSES = (
+    (DownloadStatus.COMPLETED.value, "completed"),
+    (DownloadStatus.FAILED.value, "failed"),
+    (DownloadStatus.CANCELLED.value, "cancelled"),
+)
+
+
+def entry_path(entry: dict) -> str:
+    return os.path.join(entry.get("location") or "", entry.get("file") or "")
+
+
+class CompletionSummary:
+    """Finished downloads reported together, as history entries"""
+
+    def __init__(self, entries=()):
+        self.entries = list(entries)
+        self.counts = Counter(entry.get("status") for entry in self.entries)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def extend(self, entries):
+        entries = list(entries)
+        self.entries.extend(entries)
+        self.counts.update(entry.get("status") for entry in entries)
+
+    @property
+    def completed(self) -> list:
+        return [entry for entry in self.entries if entry.get("status") == DownloadStatus.COMPLETED.value]
+
+    def text(self) -> str:
+        """`37 completed, 2 failed`; statuses with no entries are left out"""
+        parts = [f"{self.counts[status]} {label}" for status, label in SUMMARY_STATUSES if self.counts[status]]
+        return ", ".join(parts) or "Nothing finished"
+
+    def title(self) -> str:
+        if len(self.entries) == 1:
+            status = self.entries[0].get("status")
+            if status == DownloadStatus.FAILED.value:
+                return "Download Failed"
+            if status == DownloadStatus.CANCELLED.value:
+                return "Download Cancelled"
+            return "Download Complete"
+        return "Downloads Finished"
+
+    def message(self) -> str:
+        if len(self.entries) == 1:
+            return self.entries[0].get("file") or self.text()
+        return self.text()
+
+
+class Notifier:
+    """Delivers desktop notifications on a single reusable background thread.
+
+    Notifications still queued when a newer one arrives are replaced by it;
+    only the latest state of a burst is worth showing.
+    """
+
+    def __init__(self, send=None):
+        self.send = send or _plyer_send
+        self.sent = 0
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def notify(self, title: str, message: str, timeout: int = 5):
+        with self._lock:
+            while True:
+                try:
+                    pending = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if isinstance(pending, threading.Event):
+                    pending.set()
+            self._queue.put((title, message, timeout))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="notifier", daemon=True)
+                self._thread.start()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far has been delivered or superseded"""
+        done = threading.Event()
+        with self._lock:
+            if self._thread is None:
+                return True
+            self._queue.put(done)
+        return done.wait(timeout)
+
+    def _loop(self):
+        while True:
+            item = self._queue.get()
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+            try:
+                self.send(*item)
+                self.sent += 1
+            except Exception as e:
+                print(f"Notification failed: {e}")
+
+
+def _plyer_send(title: str, message: str, timeout: int):
+    if NOTIFY_AVAILABLE:
+        notification.notify(title=title, message=message, timeout=timeout)
+
+
+def get_notifier() -> Notifier:
+    """The process-wide notifier, whose thread starts with the first notification"""
+    global _shared_notifier
+    with _shared_lock:
+        if _shared_notifier is None:
+            _shared_notifier = Notifier()
+        return _shared_notifier
+
+
+_shared_notifier = None
+_shared_lock = threading.Lock()
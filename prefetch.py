@@ -0,0 +1,153 @@
+"""Speculative metadata prefetch for URLs seen on the clipboard.
+
+When a URL is copied, its metadata and thumbnail are fetched in the
+background into the metadata and thumbnail caches, so a later preview or
+queue is instant. Prefetching is low priority: it runs one fetch at a time,
+is capped by a token bucket, waits while the app is busy with real work and
+abandons an in-flight fetch when the user starts a preview.
+"""
+
+import threading
+import time
+from collections import deque
+
+from downloader_core import fetch_media_info
+
+# Prefetches allowed per minute, and how many may run back to back
+PREFETCH_PER_MINUTE = 6
+PREFETCH_BURST = 2
+
+# URLs waiting to be prefetched; the oldest are dropped first
+MAX_PENDING = 20
+
+# Seconds between checks while the app is busy
+BUSY_POLL = 0.5
+
+
+def _low_priority_fetch(url: str, cancel_event) -> dict:
+    return fetch_media_info(url, cancel_event=cancel_event, low_priority=True)
+
+
+class TokenBucket:
+    """Allows `rate` events per second on average, with bursts of up to `burst`"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 1e-6)
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    def delay(self) -> float:
+        """Seconds until a token is available (0 if one is now)"""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def take(self, stop_event: threading.Event) -> bool:
+        """Wait for a token; returns False if `stop_event` was set first"""
+        while True:
+            wait = self.delay()
+            if wait <= 0:
+                self._tokens -= 1
+                return True
+            if stop_event.wait(wait):
+                return False
+
+
+class Prefetcher:
+    """Fetches metadata for URLs on a single background thread.
+
+    `is_busy()` reports real work in progress (previews, saturated download
+    slots); prefetching waits until it returns False. `fetcher(url,
+    cancel_event)` defaults to a low-priority fetch_media_info.
+    """
+
+    def __init__(self, metadata_cache, thumbnails=None, fetcher=None, is_busy=None,
+                 per_minute: float = PREFETCH_PER_MINUTE, burst: int = PREFETCH_BURST):
+        self.metadata_cache = metadata_cache
+        self.thumbnails = thumbnails
+        self.fetcher = fetcher or _low_priority_fetch
+        self.is_busy = is_busy or (lambda: False)
+        self.bucket = TokenBucket(per_minute / 60.0, burst)
+        self.completed = 0
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._stopped = threading.Event()
+        self._current = None
+        self._thread = None
+
+    def add(self, url: str) -> bool:
+        """Queue a URL unless it is cached and fresh or already queued"""
+        url = url.strip()
+        if not url.startswith("http") or self.metadata_cache.get(url, allow_stale=False):
+            return False
+        with self._cond:
+            if url in self._pending or (self._current and self._current[0] == url):
+                return False
+            # Newest first: the last copied URL is the one most likely to be used next
+            self._pending.appendleft(url)
+            while len(self._pending) > MAX_PENDING:
+                self._pending.pop()
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+            self._cond.notify()
+        return True
+
+    def yield_to_work(self):
+        """Abandon the in-flight prefetch (it is queued again) so real work gets the resources"""
+        with self._cond:
+            if self._current:
+                self._current[1].set()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending) + (1 if self._current else 0)
+
+    def stop(self):
+        self._stopped.set()
+        with self._cond:
+            self._pending.clear()
+            if self._current:
+                self._current[1].set()
+            self._cond.notify_all()
+
+    def _wait_until_idle(self) -> bool:
+        while self.is_busy():
+            if self._stopped.wait(BUSY_POLL):
+                return False
+        return not self._stopped.is_set()
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            with self._cond:
+                if not self._pending:
+                    self._thread = None
+                    return
+                url = self._pending.popleft()
+            if self.metadata_cache.get(url, allow_stale=False):
+                continue
+            if not (self._wait_until_idle() and self.bucket.take(self._stopped) and self._wait_until_idle()):
+                return
+            cancel_event = threading.Event()
+            with self._cond:
+                self._current = (url, cancel_event)
+            try:
+                info = self.fetcher(url, cancel_event)
+                if cancel_event.is_set():
+                    if not self._stopped.is_set():
+                        with self._cond:
+                            self._pending.appendleft(url)
+                    continue
+                if info:
+                    info = self.metadata_cache.put(url, info)
+                    if self.thumbnails is not None and info.get("thumbnail"):
+                        self.thumbnails.fetch(info["thumbnail"])
+                    self.completed += 1
+            except Exception as e:
+                print(f"Prefetch failed for {url}: {e}")
+            finally:
+                with self._cond:
+                    self._current = None
@@ -0,0 +1,194 @@
+"""Bounded worker pool for media previews.
+
+Each preview is a full `yt-dlp -J` process that mostly waits on the network,
+so several run side by side. The pool caps the total number of concurrent
+fetches and, separately, how many may hit one platform at once so a large
+batch does not trip rate limits. Jobs for URLs that no longer apply can be
+cancelled; a running fetch is killed through its cancel event.
+"""
+
+import threading
+import time
+from collections import deque
+
+from downloader_core import detect_platform
+
+DEFAULT_PREVIEW_WORKERS = 4
+
+# Platforms known to throttle metadata requests aggressively
+DEFAULT_PLATFORM_LIMITS = {
+    "Instagram": 1,
+    "Facebook": 1,
+    "TikTok": 2
+}
+
+
+class PreviewJob:
+    """A queued or running preview; batch jobs cover several URLs"""
+
+    def __init__(self, url: str, work, urls: list = None):
+        self.url = url
+        self.urls = list(urls or [url])
+        self.platform = detect_platform(url)
+        self.work = work
+        self.cancel_event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self.cancel_event.is_set()
+
+
+class PreviewPool:
+    """Runs `work(job)` callables for URLs on a fixed number of threads.
+
+    At most one job per URL is queued or running. `work` receives the job and
+    should check `job.cancel_event` (fetch_media_info takes it directly) and
+    deliver its own results, e.g. by emitting signals.
+    """
+
+    def __init__(self, width: int = DEFAULT_PREVIEW_WORKERS, platform_limits: dict = None):
+        self.width = max(1, int(width or DEFAULT_PREVIEW_WORKERS))
+        self.platform_limits = dict(DEFAULT_PLATFORM_LIMITS if platform_limits is None else platform_limits)
+        self._queue = deque()
+        self._jobs = {}
+        self._running = {}
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._threads = []
+
+    def configure(self, width: int = None, platform_limits: dict = None):
+        """Change the pool width or platform limits; extra threads start on demand"""
+        with self._cond:
+            if width:
+                self.width = max(1, int(width))
+            if platform_limits is not None:
+                self.platform_limits = dict(platform_limits)
+            self._cond.notify_all()
+
+    def submit(self, url: str, work) -> PreviewJob:
+        """Queue a preview; returns the existing job if the URL is already pending"""
+        with self._cond:
+            job = self._jobs.get(url)
+            if job is not None and not job.cancelled:
+                return job
+            job = PreviewJob(url, work)
+            self._jobs[url] = job
+            self._queue.append(job)
+            self._ensure_threads()
+            self._cond.notify()
+            return job
+
+    def submit_batch(self, urls: list, work):
+        """Queue one job for several URLs (e.g. one yt-dlp -j run); URLs already pending are left out.
+
+        Returns the job, or None if every URL was already pending. Cancelling
+        a URL removes it from `job.urls`; the job is only cancelled once none
+        are left, so `work` should skip results for URLs no longer listed.
+        """
+        with self._cond:
+            urls = [url for url in dict.fromkeys(urls) if url not in self._jobs or self._jobs[url].cancelled]
+            if not urls:
+                return None
+            job = PreviewJob(urls[0], work, urls)
+            for url in urls:
+                self._jobs[url] = job
+            self._queue.append(job)
+            self._ensure_threads()
+            self._cond.notify()
+            return job
+
+    def cancel(self, url: str) -> bool:
+        with self._cond:
+            job = self._jobs.pop(url, None)
+            if job is None:
+                return False
+            if url in job.urls:
+                job.urls.remove(url)
+            if job.urls:
+                return True
+            job.cancel_event.set()
+            self._remove_queued(job)
+            self._cond.notify_all()
+            return True
+
+    def cancel_except(self, urls) -> int:
+        """Cancel every job whose URL is not in `urls`; returns how many were cancelled"""
+        keep = set(urls)
+        with self._cond:
+            stale = [url for url in self._jobs if url not in keep]
+        return sum(1 for url in stale if self.cancel(url))
+
+    def cancel_all(self) -> int:
+        return self.cancel_except(())
+
+    def pending(self) -> int:
+        """Queued plus running jobs"""
+        with self._cond:
+            return len(self._jobs)
+
+    def shutdown(self, wait: float = 2.0) -> bool:
+        """Cancel everything and stop the worker threads, waiting at most `wait` seconds in total.
+
+        Returns whether every worker thread has exited.
+        """
+        self.cancel_all()
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            threads = list(self._threads)
+        deadline = time.monotonic() + wait
+        for thread in threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in threads)
+
+    def _remove_queued(self, job: PreviewJob):
+        try:
+            self._queue.remove(job)
+        except ValueError:
+            pass
+
+    def _ensure_threads(self):
+        self._threads = [t for t in self._threads if t.is_alive()]
+        while len(self._threads) < min(self.width, len(self._queue) + len(self._running)):
+            thread = threading.Thread(target=self._worker, daemon=True)
+            self._threads.append(thread)
+            thread.start()
+
+    def _next_job(self):
+        """Pop the first queued job whose platform has a free slot (caller holds the lock)"""
+        if len(self._running) >= self.width:
+            return None
+        busy = {}
+        for job in self._running.values():
+            busy[job.platform] = busy.get(job.platform, 0) + 1
+        for job in self._queue:
+            limit = self.platform_limits.get(job.platform)
+            if limit is None or busy.get(job.platform, 0) < limit:
+                self._queue.remove(job)
+                return job
+        return None
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                job = self._next_job()
+                while job is None:
+                    if self._stopped or not self._queue:
+                        # Idle threads exit; submit starts new ones when needed
+                        self._threads = [t for t in self._threads if t is not threading.current_thread()]
+                        return
+                    self._cond.wait()
+                    job = self._next_job()
+                self._running[id(job)] = job
+            try:
+                if not job.cancelled:
+                    job.work(job)
+            except Exception as e:
+                print(f"Preview error for {job.url}: {e}")
+            finally:
+                with self._cond:
+                    self._running.pop(id(job), None)
+                    for url in job.urls:
+                        if self._jobs.get(url) is job:
+                            del self._jobs[url]
+                    self._cond.notify_all()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Tests for the global bandwidth budget"""
+
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bandwidth import BandwidthBudget, parse_rate, MIN_SHARE
+
+
+MiB = 1024 * 1024
+
+
+def test_parse_rate():
+    """Rates accept yt-dlp style suffixes and fall back to unlimited"""
+    assert parse_rate("5M") == 5 * MiB
+    assert parse_rate("750K") == 750 * 1024
+    assert parse_rate("1.5MiB/s") == 1.5 * MiB
+    assert parse_rate(2048) == 2048
+    assert parse_rate("0") == 0
+    assert parse_rate("fast") == 0
+    assert parse_rate(None) == 0
+
+
+def test_weighted_split():
+    """New tasks split the budget by weight"""
+    budget = BandwidthBudget("10M")
+    budget.register("a", weight=1)
+    budget.register("b", weight=3)
+    shares = budget.allocations()
+    assert abs(sum(shares.values()) - 10 * MiB) < 1
+    assert shares["b"] > shares["a"] * 2.5
+
+
+def test_unlimited_budget():
+    """A zero limit leaves every task unthrottled"""
+    budget = BandwidthBudget(0)
+    budget.register("a")
+    assert budget.share_for("a") == 0
+    assert budget.throttle_delay("a", 50 * MiB) == 0
+
+
+def test_priority_tiers():
+    """Higher priority tasks are served before lower ones"""
+    budget = BandwidthBudget("10M")
+    budget.register("low", priority=0)
+    budget.register("high", priority=5)
+    shares = budget.allocations()
+    assert shares["low"] == MIN_SHARE
+    assert shares["high"] > 9 * MiB
+
+
+def test_idle_share_redistributed():
+    """Share a slow task is not using goes to the others"""
+    budget = BandwidthBudget("10M")
+    budget.register("slow")
+    budget.register("fast")
+    budget.report_speed("slow", 1 * MiB)
+    budget.report_speed("fast", 5 * MiB)
+    shares = budget.allocations()
+    assert shares["slow"] < 2 * MiB
+    assert shares["fast"] > 8 * MiB
+
+
+def test_finished_task_releases_share():
+    """Unregistering a task hands its share back"""
+    budget = BandwidthBudget("9M")
+    for key in ("a", "b", "c"):
+        budget.register(key)
+    assert abs(budget.share_for("a") - 3 * MiB) < 1
+    budget.unregister("c")
+    assert abs(budget.share_for("a") - 4.5 * MiB) < 1
+
+
+def test_live_reconfigure():
+    """Changing the limit updates shares without re-registering"""
+    budget = BandwidthBudget("4M")
+    budget.register("a")
+    assert abs(budget.share_for("a") - 4 * MiB) < 1
+    budget.configure(limit="8M")
+    assert abs(budget.share_for("a") - 8 * MiB) < 1
+
+
+def test_schedule_overrides_limit():
+    """Time-of-day windows, including ones that wrap midnight, override the base limit"""
+    budget = BandwidthBudget("2M", schedule=[{"start": "22:00", "end": "06:00", "limit": "50M"}])
+    assert budget.current_limit(datetime(2026, 1, 1, 23, 30)) == 50 * MiB
+    assert budget.current_limit(datetime(2026, 1, 1, 3, 0)) == 50 * MiB
+    assert budget.current_limit(datetime(2026, 1, 1, 12, 0)) == 2 * MiB
+
+
+def test_throttle_delay_over_share():
+    """A task running above its share is told to pause"""
+    budget = BandwidthBudget("1M")
+    budget.register("a")
+    budget._tasks["a"]["last_report"] -= 1.0
+    delay = budget.throttle_delay("a", 4 * MiB)
+    assert delay > 0
+    budget._tasks["a"]["last_report"] -= 1.0
+    assert budget.throttle_delay("a", 0.5 * MiB) == 0
+
+
+if __name__ == '__main__':
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""Tests for DownloadManager's dirty-task tracking"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from download_manager import DownloadManager, DownloadTask
+
+
+def _task(i: int) -> DownloadTask:
+    return DownloadTask(url=f"https://example.com/v{i}", path=f"/tmp/v{i}.mp4", format_choice="mp4")
+
+
+def test_state_changes_mark_tasks_dirty_once():
+    manager = DownloadManager()
+    first, second, idle = _task(1), _task(2), _task(3)
+    for task in (first, second, idle):
+        manager.add_task(task)
+    assert manager.take_dirty() == {first.task_id, second.task_id, idle.task_id}
+    assert manager.take_dirty() == set()
+
+    started = manager.get_next_task()
+    manager.update_progress(started, 10.0, "1 MiB/s", "00:05")
+    manager.update_progress(started, 20.0, "1 MiB/s", "00:04")
+    manager.pause_task(second)
+    assert manager.take_dirty() == {first.task_id, second.task_id}
+
+    manager.complete_task(started)
+    assert manager.take_dirty() == {first.task_id}
+
+
+def test_marks_from_worker_threads_are_not_lost():
+    manager = DownloadManager()
+    tasks = [_task(i) for i in range(400)]
+    seen = set()
+
+    def worker(batch):
+        for task in batch:
+            manager.update_progress(task, 50.0)
+
+    threads = [threading.Thread(target=worker, args=(tasks[i::4],)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    while any(thread.is_alive() for thread in threads):
+        seen |= manager.take_dirty()
+    seen |= manager.take_dirty()
+    assert seen == {task.task_id for task in tasks}
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Offscreen tests for the Qt download table model"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication
+from ui_components_qt import DownloadTableFrame, PROGRESS_COLUMN
+
+ROWS = 10_000
+UPDATES_PER_TICK = 500
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def test_stress_updates_touch_only_changed_rows(app):
+    frame = DownloadTableFrame()
+    frame.resize(900, 600)
+    frame.show()
+    for i in range(ROWS):
+        frame.add_download(f"task-{i}", f"video-{i}.mp4")
+    app.processEvents()
+
+    changed_rows = []
+    frame.model.dataChanged.connect(lambda first, last, roles=None: changed_rows.append(first.row()))
+    ticks = 20
+    started = time.perf_counter()
+    for tick in range(ticks):
+        for n in range(UPDATES_PER_TICK):
+            i = (tick * UPDATES_PER_TICK + n * 7) % ROWS
+            frame.update_download(f"task-{i}", "Downloading", "10.0 MB", "1.0 MB/s", "00:10", tick + n / 1000)
+        app.processEvents()
+    per_tick = (time.perf_counter() - started) / ticks
+
+    assert len(changed_rows) == ticks * UPDATES_PER_TICK
+    # An O(rows) lookup per update would be 5M row scans per tick
+    assert per_tick < 0.25, f"{per_tick * 1000:.0f} ms per tick"
+
+    # Same values again: nothing to repaint
+    changed_rows.clear()
+    frame.update_download("task-0", "Downloading", "10.0 MB", "1.0 MB/s", "00:10", 0.0)
+    frame.update_download("task-0", "Downloading", "10.0 MB", "1.0 MB/s", "00:10", 0.0)
+    assert len(changed_rows) <= 1
+
+
+def test_batch_update_is_one_model_change(app):
+    frame = DownloadTableFrame()
+    for i in range(100):
+        frame.add_download(i, f"file{i}")
+    signals = []
+    frame.model.dataChanged.connect(lambda first, last, roles=None: signals.append((first.row(), last.row())))
+    frame.update_downloads([(i, "Downloading", "1 MB", "1 MB/s", "00:01", 5.0) for i in (10, 40, 70)])
+    frame.update_downloads([(40, "Downloading", "1 MB", "1 MB/s", "00:01", 5.0)])
+    assert signals == [(10, 70)]
+    assert frame.model.index(40, 5).data() == "5.0%"
+
+
+def test_only_visible_rows_are_painted_and_animated(app):
+    frame = DownloadTableFrame()
+    frame.resize(900, 300)
+    frame.show()
+    for i in range(2000):
+        frame.add_download(i, f"file{i}")
+    frame.grab()
+    painted = set(frame.delegate.shown)
+    assert painted and max(painted) < 50
+
+    visible = frame.visible_rows()
+    frame.update_download(0, "Downloading", "1 MB", "1 MB/s", "00:01", 80.0, [1.0, 3.0, 2.0])
+    frame.update_download(1999, "Downloading", "1 MB", "1 MB/s", "00:01", 50.0)
+    assert 0 in visible and 1999 not in visible
+    assert frame.delegate.shown[0] == 0.0
+
+    deadline = time.monotonic() + 5
+    steps = 0
+    while frame._frame_timer.isActive() and time.monotonic() < deadline:
+        app.processEvents()
+        steps += 1
+    # Eased over several frames, and the off-screen row was never touched
+    assert frame.delegate.shown[0] == 80.0 and steps > 1
+    assert 1999 not in frame.delegate.shown
+    assert frame.model.index(0, PROGRESS_COLUMN).data() == "80.0%"
+
+
+def test_remove_keeps_index_in_step(app):
+    frame = DownloadTableFrame()
+    for i in range(5):
+        frame.add_download(i, f"file{i}")
+    frame.remove_download(1)
+    frame.update_download(3, "Completed", "1 MB", "", "", 100)
+    model = frame.model
+    assert frame.row_count() == 4
+    assert model.row_of(3) == 2
+    assert model.index(2, 1).data() == "Completed"
+    assert model.index(2, 5).data() == "100.0%"
+    frame.select_task(4)
+    assert frame.selected_task_id() == 4
+    frame.clear_all()
+    assert frame.row_count() == 0 and model.row_of(4) == -1
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Tests for the headless command line entry point"""
+
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import downloader_cli
+import downloader_core
+
+
+def test_import_does_not_load_gui_toolkits():
+    """Starting the CLI never pulls in PySide6 or tkinter"""
+    code = (
+        "import sys, downloader_cli; "
+        "print(','.join(m for m in ('PySide6', 'tkinter', 'pyperclip', 'PIL') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=str(Path(__file__).parent),
+        capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_read_urls_skips_blanks_and_comments():
+    assert downloader_cli.read_urls(["https://a\n", "\n", "# note\n", "  https://b  \n"]) == ["https://a", "https://b"]
+
+
+def test_output_template_uses_ytdlp_fields(tmp_path):
+    settings = {"filename_template": "{title} - {uploader}", "download_folder": str(tmp_path)}
+    assert downloader_core.output_template(settings, "mp3") == str(tmp_path / "%(title)s - %(uploader)s.mp3")
+    assert downloader_core.output_template(settings, "best").endswith(".%(ext)s")
+
+
+def test_make_task_applies_preset(tmp_path):
+    """Folder presets pick the format, destination and per-download settings"""
+    preset = {"format_choice": "mp3", "audio_bitrate": "320k", "download_folder": str(tmp_path / "music")}
+    task = downloader_cli.make_task("https://example.com/v", {"filename_template": "{title}"}, {"preset": preset})
+    assert task.format_choice == "mp3"
+    assert task.path == str(tmp_path / "music" / "%(title)s.mp3")
+    assert task.overrides == {"audio_bitrate": "320k"}
+
+
+FAKE_YTDLP = r'''#!{python}
+import sys
+url = sys.argv[-1]
+if "bad" in url:
+    print("ERROR: [youtube] abc: Private video", flush=True)
+    sys.exit(1)
+print("[download]  50.0% of 1.00MiB at 1.00MiB/s ETA 00:01", flush=True)
+print("[download] 100.0% of 1.00MiB at 1.00MiB/s ETA 00:00", flush=True)
+'''
+
+
+@pytest.fixture
+def fake_ytdlp(tmp_path, monkeypatch):
+    script = tmp_path / "yt-dlp"
+    script.write_text(FAKE_YTDLP.replace("{python}", sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setattr(downloader_core, "YTDLP_PATH", downloader_core.YTDLP_PATH)
+    return script
+
+
+def _main(tmp_path, fake_ytdlp, *args):
+    settings = tmp_path / "settings.json"
+    settings.write_text('{"retry_count": 0, "embed_thumbnail": false, "embed_metadata": false}')
+    return downloader_cli.main([
+        "--settings", str(settings), "--yt-dlp", str(fake_ytdlp),
+        "-o", str(tmp_path / "out"), "--quiet", *args
+    ])
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_exit_codes(tmp_path, fake_ytdlp, capsys):
+    """0 when everything downloads, 1 when anything fails"""
+    assert _main(tmp_path, fake_ytdlp, "https://example.com/good") == downloader_cli.EXIT_OK
+    assert _main(tmp_path, fake_ytdlp, "https://example.com/good", "https://example.com/bad") == downloader_cli.EXIT_FAILED
+    err = capsys.readouterr().err
+    assert "[FAILED] https://example.com/bad (Private" in err
+    assert "1 completed, 1 failed" in err
+
+
+def test_usage_and_missing_ytdlp(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(""))
+    assert downloader_cli.main(["--settings", str(tmp_path / "none.json")]) == downloader_cli.EXIT_USAGE
+    assert downloader_cli.main(["-q", "9000p", "https://x"]) == downloader_cli.EXIT_USAGE
+    monkeypatch.setattr(downloader_cli.shutil, "which", lambda name: None)
+    code = downloader_cli.main(["--yt-dlp", str(tmp_path / "missing"), "https://example.com/v"])
+    assert code == downloader_cli.EXIT_NO_YTDLP
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_urls_from_file(tmp_path, fake_ytdlp):
+    url_file = tmp_path / "urls.txt"
+    url_file.write_text("https://example.com/one\n# skipped\nhttps://example.com/two\n")
+    assert _main(tmp_path, fake_ytdlp, "-i", str(url_file)) == downloader_cli.EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
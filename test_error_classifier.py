@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Tests for yt-dlp error classification and retry policy"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import downloader_core
+from download_manager import DownloadManager, DownloadTask, DownloadStatus
+from error_classifier import (
+    ErrorClass, classify_output, is_transient, parse_retry_after, format_error_summary
+)
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("ERROR: [youtube] abc: Private video. Sign in if you've been granted access", ErrorClass.PRIVATE),
+    ("ERROR: [youtube] abc: Video unavailable. This video has been removed by the uploader", ErrorClass.REMOVED),
+    ("ERROR: [generic] Unsupported URL: https://example.com/page", ErrorClass.UNSUPPORTED),
+    ("ERROR: unable to download video data: HTTP Error 404: Not Found", ErrorClass.NOT_FOUND),
+    ("ERROR: [youtube] abc: The uploader has not made this video available in your country", ErrorClass.GEO_BLOCKED),
+    ("ERROR: [youtube] abc: This video is DRM protected", ErrorClass.DRM),
+    ("ERROR: unable to download video data: HTTP Error 429: Too Many Requests", ErrorClass.RATE_LIMITED),
+    ("ERROR: unable to download video data: HTTP Error 503: Service Unavailable", ErrorClass.SERVER_ERROR),
+    ("ERROR: [download] Got error: The read operation timed out", ErrorClass.TIMEOUT),
+    ("ERROR: [Errno -3] Temporary failure in name resolution", ErrorClass.NETWORK),
+    ("ERROR: something nobody has seen before", ErrorClass.UNKNOWN),
+    ("ERROR: [youtube] abc: Sign in to confirm you're not a bot. Use --cookies-from-browser or --cookies "
+     "for the authentication", ErrorClass.RATE_LIMITED),
+    ("ERROR: [youtube] abc: Sign in to confirm your age. This video may be inappropriate for some users.",
+     ErrorClass.LOGIN_REQUIRED),
+    ("ERROR: Postprocessing: ffmpeg not found. Please install or provide the path", ErrorClass.UNKNOWN),
+])
+def test_classify_output(line, expected):
+    """Each pattern maps to its error class"""
+    assert classify_output(["[youtube] abc: Downloading webpage\n", line]) == expected
+
+
+def test_only_error_and_warning_lines_are_classified():
+    """A file name is not an error message"""
+    output = ["[download] Destination: My Private Video Tour.mp4\n", "ERROR: something nobody has seen before\n"]
+    assert classify_output(output) == ErrorClass.UNKNOWN
+    assert classify_output(["WARNING: [youtube] HTTP Error 503: Service Unavailable\n"]) == ErrorClass.SERVER_ERROR
+
+
+def test_transient_classes():
+    """Only network-level failures are retried"""
+    assert is_transient(ErrorClass.TIMEOUT)
+    assert is_transient(ErrorClass.RATE_LIMITED)
+    assert not is_transient(ErrorClass.PRIVATE)
+    assert not is_transient(ErrorClass.UNSUPPORTED)
+
+
+def test_parse_retry_after():
+    """Retry-After hints are read in seconds or minutes"""
+    assert parse_retry_after(["HTTP Error 429: Too Many Requests (Retry-After: 120)"]) == 120
+    assert parse_retry_after(["rate limited, try again in 2 minutes"]) == 120
+    assert parse_retry_after(["HTTP Error 429: Too Many Requests"]) is None
+
+
+def test_format_error_summary():
+    """Summary lists failures and retries by class"""
+    summary = format_error_summary({"Private": 2, "Removed": 1}, {"Timeout": 3})
+    assert summary == "Failed: 2 Private, 1 Removed | Retried: 3 Timeout"
+    assert format_error_summary({}) == "No errors"
+
+
+FAKE_YTDLP = r'''#!{python}
+import os, sys
+with open(os.environ["FAKE_YTDLP_RUNS"], "a") as f:
+    f.write("run\n")
+print(os.environ["FAKE_YTDLP_ERROR"], flush=True)
+sys.exit(1)
+'''
+
+
+@pytest.fixture
+def failing_ytdlp(tmp_path, monkeypatch):
+    script = tmp_path / "yt-dlp"
+    script.write_text(FAKE_YTDLP.replace("{python}", sys.executable))
+    script.chmod(0o755)
+    runs = tmp_path / "runs.txt"
+    monkeypatch.setattr(downloader_core, "YTDLP_PATH", str(script))
+    monkeypatch.setenv("FAKE_YTDLP_RUNS", str(runs))
+    return runs
+
+
+def _run(tmp_path, monkeypatch, error_line):
+    monkeypatch.setenv("FAKE_YTDLP_ERROR", error_line)
+    manager = DownloadManager()
+    task = DownloadTask(url="https://example.com/v", path=str(tmp_path / "video.mp4"), format_choice="mp4")
+    settings = {"retry_count": 2, "retry_delay": 0, "embed_thumbnail": False, "embed_metadata": False}
+    downloader_core.download_task(task, manager, settings)
+    return manager, task
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_permanent_error_fails_fast(tmp_path, monkeypatch, failing_ytdlp):
+    """Private videos fail after a single attempt"""
+    manager, task = _run(tmp_path, monkeypatch, "ERROR: [youtube] abc: Private video")
+    assert task.status == DownloadStatus.FAILED
+    assert task.error_class == ErrorClass.PRIVATE.value
+    assert len(failing_ytdlp.read_text().splitlines()) == 1
+    assert manager.error_counts == {"Private": 1}
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_transient_error_is_retried(tmp_path, monkeypatch, failing_ytdlp):
+    """Server errors use every retry and are counted per class"""
+    manager, task = _run(tmp_path, monkeypatch, "ERROR: HTTP Error 503: Service Unavailable")
+    assert task.status == DownloadStatus.FAILED
+    assert len(failing_ytdlp.read_text().splitlines()) == 3
+    assert manager.retry_counts == {"Server error": 2}
+    assert manager.error_counts == {"Server error": 1}
+    assert manager.get_error_summary() == "Failed: 1 Server error | Retried: 2 Server error"
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_rate_limit_honours_retry_after(tmp_path, monkeypatch, failing_ytdlp):
+    """A 429 with a Retry-After hint waits for the hinted time"""
+    waits = []
+    monkeypatch.setattr(downloader_core, "_wait_before_retry", lambda task, delay: waits.append(delay) or True)
+    _run(tmp_path, monkeypatch, "ERROR: HTTP Error 429: Too Many Requests (Retry-After: 7)")
+    assert waits == [7, 7]
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
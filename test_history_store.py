@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Tests for the persistent history store and the Qt history view"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from download_manager import DownloadManager, DownloadTask
+from history_store import HistoryStore
+
+ENTRIES = 100_000
+
+
+def _entry(i):
+    return {
+        "file": f"clip {i}.mp4", "location": "/videos", "url": f"https://example.com/watch?v={i}",
+        "format": "MP4 (Video)", "status": "Failed" if i % 10 == 0 else "Completed",
+        "title": f"Episode {i} of {'cooking' if i % 2 else 'gardening'}",
+        "uploader": f"channel{i % 100}", "timestamp": "2024-01-01T00:00:00",
+    }
+
+
+def test_search_and_pages_over_100k_entries(tmp_path):
+    store = HistoryStore(str(tmp_path / "history.db"))
+    store.add_many([_entry(i) for i in range(ENTRIES)])
+
+    first = store.page("garden channel40")
+    assert [row["title"] for row in first[:2]] == ["Episode 99940 of gardening", "Episode 99840 of gardening"]
+    assert store.count("garden channel40", "Failed") == ENTRIES // 100
+
+    # Keyset paging continues below the last row shown without overlap
+    second = store.page("garden channel40", before_id=first[-1]["id"])
+    assert len(first) == 200 and len(second) == 200
+    assert second[0]["id"] < first[-1]["id"]
+    assert store.page(status="Failed", limit=1)[0]["file"] == "clip 99990.mp4"
+    store.close()
+
+
+@pytest.mark.parametrize("query,status", [("garden channel40", ""), ("garden channel40", "Failed"), ("", "Failed")])
+def test_filtered_queries_never_scan_the_history_table(tmp_path, query, status):
+    # Timing lives in the history-search benchmark; here the plan must use an index
+    store = HistoryStore(str(tmp_path / "history.db"))
+    where, params = store._filter(query, status)
+    for sql, args in ((store._select("h.*", where) + " ORDER BY h.id DESC LIMIT ?", params + [200]),
+                      (store._select("COUNT(*)", where), params)):
+        plan = [row[-1] for row in store._conn.execute("EXPLAIN QUERY PLAN " + sql, args)]
+        assert not any(step.split()[:2] == ["SCAN", "h"] for step in plan), plan
+    store.close()
+
+
+def test_manager_persists_history_across_instances(tmp_path):
+    path = str(tmp_path / "history.db")
+    store = HistoryStore(path)
+    manager = DownloadManager(history_store=store)
+    task = DownloadTask(url="https://example.com/a", path="/videos/a.mp4", format_choice="MP4 (Video)")
+    task.title, task.uploader = "Lofi Beats Mix", "Chill Channel"
+    manager.add_task(task)
+    manager.complete_task(manager.get_next_task())
+    store.close()
+
+    reopened = HistoryStore(path)
+    manager = DownloadManager(history_store=reopened)
+    assert manager.history[0]["title"] == "Lofi Beats Mix"
+    assert [row["file"] for row in reopened.page("lofi beat")] == ["a.mp4"]
+    assert reopened.page("chill", after_id=manager.history[0]["id"]) == []
+    reopened.close()
+
+
+def test_view_fetches_lazily_and_inserts_new_rows(tmp_path):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    pytest.importorskip("PySide6")
+    from PySide6.QtWidgets import QApplication
+    from ui_components_qt import HistoryFrame
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    store = HistoryStore(str(tmp_path / "history.db"))
+    store.add_many([_entry(i) for i in range(1000)])
+    frame = HistoryFrame(store)
+    model = frame.model
+    assert model.rowCount() == 200 and model.canFetchMore()
+    model.fetchMore()
+    assert model.rowCount() == 400
+
+    store.add(_entry(1000))
+    frame.refresh_new()
+    assert model.rowCount() == 401
+    assert model.entry(0)["file"] == "clip 1000.mp4"
+
+    frame.search.setText("episode 1000")
+    frame.apply_filter()
+    assert model.rowCount() == 1 and not model.canFetchMore()
+    frame.table.selectRow(0)
+    assert frame.get_selected()["url"] == "https://example.com/watch?v=1000"
+    store.close()
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Tests for the pooled HTTP client"""
+
+import sys
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from http_client import HttpClient, HttpError
+
+
+class CountingServer:
+    """Keep-alive HTTP/1.1 server that counts TCP connections and concurrent requests"""
+
+    def __init__(self, delay: float = 0.0):
+        server = self
+        self.connections = 0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def setup(self):
+                super().setup()
+                with server.lock:
+                    server.connections += 1
+
+            def _send(self, status, body=b"", headers=()):
+                self.send_response(status)
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                with server.lock:
+                    server.active += 1
+                    server.peak = max(server.peak, server.active)
+                time.sleep(delay)
+                with server.lock:
+                    server.active -= 1
+                if self.path == "/etag":
+                    if self.headers.get("If-None-Match") == '"v1"':
+                        self._send(304, headers=[("ETag", '"v1"')])
+                    else:
+                        self._send(200, b'{"title": "cached"}', [("ETag", '"v1"')])
+                elif self.path == "/old":
+                    self._send(302, headers=[("Location", "/image")])
+                elif self.path == "/missing":
+                    self._send(404, b"no")
+                else:
+                    self._send(200, b"x" * 2048)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.httpd.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_requests_reuse_one_connection():
+    with CountingServer() as server:
+        for _ in range(20):
+            with urllib.request.urlopen(f"{server.url}/image", timeout=5) as response:
+                response.read()
+        assert server.connections == 20
+
+        client = HttpClient()
+        for _ in range(20):
+            assert len(client.get(f"{server.url}/image").body) == 2048
+        assert client.connections_opened == 1
+        assert server.connections == 21
+        client.close()
+
+
+def test_concurrency_per_host_is_bounded():
+    with CountingServer(delay=0.05) as server:
+        client = HttpClient(max_per_host=2)
+        threads = [threading.Thread(target=client.get, args=(f"{server.url}/image",)) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert server.peak == 2
+        assert client.connections_opened == 2
+
+
+def test_conditional_requests_and_errors():
+    with CountingServer() as server:
+        client = HttpClient()
+        first = client.get(f"{server.url}/etag", conditional=True)
+        second = client.get(f"{server.url}/etag", conditional=True)
+        assert first.status == 200 and not first.revalidated
+        assert second.status == 304 and second.revalidated
+        assert second.json() == {"title": "cached"}
+
+        assert client.get(f"{server.url}/old").url.endswith("/image")
+        with pytest.raises(HttpError) as error:
+            client.get(f"{server.url}/missing")
+        assert error.value.status == 404
+        assert client.connections_opened == 1
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the shared job queue and multi-process worker mode"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from job_queue import SharedJobQueue
+
+
+def test_concurrent_claims_are_exclusive(tmp_path):
+    """Workers racing on the same file never get the same job twice"""
+    db = str(tmp_path / "queue.db")
+    SharedJobQueue(db).enqueue([f"https://example.com/{i}" for i in range(40)])
+    claimed = []
+
+    def worker(name):
+        queue = SharedJobQueue(db)
+        while True:
+            job = queue.claim(name)
+            if job is None:
+                return
+            claimed.append(job["id"])
+
+    threads = [threading.Thread(target=worker, args=(f"w{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(claimed) == 40
+    assert len(set(claimed)) == 40
+
+
+def test_expired_lease_is_reassigned(tmp_path):
+    """A job whose worker stops heartbeating goes to the next worker"""
+    queue = SharedJobQueue(str(tmp_path / "queue.db"), lease_seconds=0.1)
+    job_id = queue.enqueue(["https://example.com/v"])[0]
+    assert queue.claim("dead")["id"] == job_id
+    assert queue.claim("alive") is None
+    time.sleep(0.15)
+
+    job = queue.claim("alive")
+    assert job["id"] == job_id and job["attempts"] == 2
+    assert job["status"] == "leased" and job["worker"] == "alive"
+    assert job["lease_expires"] > time.time()
+    assert queue.heartbeat([job_id], "dead") == {job_id}
+    assert not queue.complete(job_id, "dead", "completed")
+    assert queue.complete(job_id, "alive", "completed", path="/tmp/v.mp4", entry={"file": "v.mp4"})
+    assert queue.counts() == {"completed": 1}
+    assert queue.history()[0]["worker"] == "alive"
+
+
+def test_lease_attempts_are_capped(tmp_path):
+    queue = SharedJobQueue(str(tmp_path / "queue.db"), lease_seconds=0.01, max_attempts=2)
+    job_id = queue.enqueue(["https://example.com/v"])[0]
+    for worker in ("a", "b"):
+        assert queue.claim(worker)["id"] == job_id
+        time.sleep(0.02)
+    assert queue.claim("c") is None
+    assert queue.get(job_id)["status"] == "failed"
+
+
+def test_release_and_cancel(tmp_path):
+    queue = SharedJobQueue(str(tmp_path / "queue.db"))
+    job_id = queue.enqueue(["https://example.com/v"])[0]
+    queue.claim("a")
+    queue.release(job_id, "a")
+    assert queue.get(job_id)["status"] == "queued"
+    assert queue.claim("b")["attempts"] == 1
+    assert queue.cancel(job_id)
+    assert queue.heartbeat([job_id], "b") == {job_id}
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_worker_processes_drain_the_queue_once(tmp_path):
+    """Several worker processes finish every job, each exactly once.
+
+    Throughput scaling is measured by `benchmarks.py worker-scaling`.
+    """
+    from benchmarks import ThrottledServer, run_workers
+
+    with ThrottledServer(rate=64 * 1024 * 1024) as source:
+        run_workers(tmp_path, source, workers=3, jobs=12, size=1024)
+    queue = SharedJobQueue(str(tmp_path / "queue-3.db"))
+    history = queue.history()
+    assert len(history) == 12
+    assert len({entry["job_id"] for entry in history}) == 12
+    assert all(queue.get(entry["job_id"])["attempts"] == 1 for entry in history)
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
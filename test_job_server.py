@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""Tests for the local HTTP job API"""
+
+import http.client
+import json
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from download_manager import DownloadManager, DownloadTask
+from job_server import JobServer
+
+
+@pytest.fixture
+def api():
+    manager = DownloadManager()
+
+    def submit(url, options):
+        task = DownloadTask(url=url, path=f"/tmp/{len(manager.queue)}.mp4",
+                            format_choice=options.get("format", "mp4"),
+                            platform="YouTube" if "youtube" in url else "Other")
+        return task if manager.add_task(task) else None
+
+    server = JobServer(manager, submit, "127.0.0.1", 0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def _request(server, method, path, body=None):
+    conn = http.client.HTTPConnection(*server.address, timeout=5)
+    payload = json.dumps(body).encode() if body is not None else None
+    conn.request(method, path, body=payload, headers={"Content-Type": "application/json"})
+    response = conn.getresponse()
+    data = json.loads(response.read() or b"null")
+    conn.close()
+    return response.status, data
+
+
+def test_bulk_submit_and_filter(api):
+    status, data = _request(api, "POST", "/jobs", {
+        "urls": ["https://youtube.com/a", "https://example.com/b", "https://youtube.com/c"],
+        "format": "mp3"
+    })
+    assert status == 201 and len(data["ids"]) == 3
+
+    status, data = _request(api, "GET", "/jobs")
+    assert status == 200 and len(data["jobs"]) == 3
+    assert all(job["format"] == "mp3" for job in data["jobs"])
+
+    _, data = _request(api, "GET", "/jobs?platform=youtube&limit=1")
+    assert [job["url"] for job in data["jobs"]] == ["https://youtube.com/a"]
+
+    _, summary = _request(api, "GET", "/summary")
+    assert summary["counts"] == {"Queued": 3}
+
+
+def test_pause_resume_cancel(api):
+    _, data = _request(api, "POST", "/jobs", {"urls": ["https://example.com/v"]})
+    job_id = data["ids"][0]
+
+    assert _request(api, "POST", f"/jobs/{job_id}/pause") == (200, {"id": job_id, "status": "Paused"})
+    assert api.manager.get_queue_count() == 0
+    assert _request(api, "POST", f"/jobs/{job_id}/resume")[1]["status"] == "Queued"
+    assert api.manager.get_queue_count() == 1
+    assert _request(api, "POST", f"/jobs/{job_id}/cancel")[1]["status"] == "Cancelled"
+    assert _request(api, "POST", f"/jobs/{job_id}/cancel")[0] == 409
+    assert _request(api, "GET", f"/jobs/{job_id}")[1]["status"] == "Cancelled"
+    assert _request(api, "POST", "/jobs/nope/pause")[0] == 404
+
+
+def test_bad_requests(api):
+    assert _request(api, "POST", "/jobs", {"url": "x"})[0] == 400
+    assert _request(api, "GET", "/nowhere")[0] == 404
+
+
+def test_polls_do_not_take_manager_lock(api):
+    """Status reads are served from the snapshot even while the manager lock is held"""
+    _request(api, "POST", "/jobs", {"urls": ["https://example.com/v"]})
+    with api.manager._lock:
+        status, data = _request(api, "GET", "/jobs")
+    assert status == 200 and len(data["jobs"]) == 1
+
+
+def test_event_stream_sends_updates(api):
+    _, data = _request(api, "POST", "/jobs", {"urls": ["https://example.com/v"]})
+    task = api.tasks[data["ids"][0]]
+
+    conn = http.client.HTTPConnection(*api.address, timeout=5)
+    conn.request("GET", "/events")
+    response = conn.getresponse()
+    assert response.getheader("Content-Type") == "text/event-stream"
+
+    def read_event():
+        lines = []
+        while True:
+            line = response.fp.readline().decode().rstrip("\n")
+            if not line:
+                return lines
+            lines.append(line)
+
+    first = read_event()
+    assert first[0] == "event: snapshot"
+    threading.Timer(0.05, lambda: api.manager.update_progress(task, 42.0, "1.00MiB/s")).start()
+    while True:
+        event = read_event()
+        jobs = json.loads(event[-1][len("data: "):])["jobs"]
+        if jobs[0]["progress"] == 42.0:
+            break
+    conn.close()
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
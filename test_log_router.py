@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Tests for progress sampling, error routing and task log files"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from log_router import LogFileWriter, LogRouter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_progress_is_sampled_and_errors_split_out(tmp_path):
+    clock = FakeClock()
+    logs, errors = [], []
+    writer = LogFileWriter(str(tmp_path))
+    router = LogRouter("task", logs.append, errors.append, writer=writer, sample_seconds=5, clock=clock)
+    router("[youtube] abc: Downloading webpage\n")
+    for i in range(200):
+        clock.now = i * 0.1
+        router(f"[download]  {i / 2:.1f}% of 10.00MiB at 1.00MiB/s ETA 00:10\n")
+    router("WARNING: unable to extract uploader\n")
+    router("[download] 100% of 10.00MiB in 00:20\n")
+    router("ERROR: unable to write file\n")
+
+    progress = [line for line in logs if line.startswith("[download]")]
+    # One line per 5 s of the 20 s run, plus the final 100%
+    assert len(progress) == 5
+    assert progress[-1].startswith("[download] 100%")
+    assert logs[0].startswith("[youtube]")
+    assert errors == ["WARNING: unable to extract uploader\n", "ERROR: unable to write file\n"]
+    assert router.dropped == 196
+
+    router.close()
+    assert writer.flush()
+    with open(writer.path_for("task"), encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == 204
+
+
+def test_task_logs_rotate_and_old_tasks_are_pruned(tmp_path):
+    writer = LogFileWriter(str(tmp_path), max_bytes=1000, max_files=3)
+    for i in range(100):
+        writer.write("big", f"line {i:04d} " + "x" * 40 + "\n")
+    for name in ("a", "b", "c"):
+        writer.write(name, "hello\n")
+        writer.close_task(name)
+    assert writer.flush()
+    files = sorted(os.listdir(tmp_path))
+    assert "big.log.1" not in files and "big.log" not in files
+    assert files == ["a.log", "b.log", "c.log"]
+
+    writer = LogFileWriter(str(tmp_path / "rotating"), max_bytes=1000)
+    for i in range(100):
+        writer.write("big", f"line {i:04d} " + "x" * 40 + "\n")
+    assert writer.flush()
+    assert os.path.getsize(writer.path_for("big")) <= 1100
+    assert os.path.exists(writer.path_for("big") + ".1")
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
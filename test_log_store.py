@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Tests for the bounded log store and the Qt log viewer"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from log_store import LogStore, classify_level
+
+
+def test_levels_from_line_prefixes():
+    assert classify_level("ERROR: [youtube] abc: Video unavailable") == "error"
+    assert classify_level("✗ Download failed: Network") == "error"
+    assert classify_level("WARNING: falling back to generic extractor") == "warning"
+    assert classify_level("[debug] Command-line config") == "debug"
+    assert classify_level("[download]  42.0% of 10.00MiB") == "info"
+
+
+def test_buffers_are_capped_and_task_lines_outlive_global_ones():
+    store = LogStore(max_lines=100, task_lines=10, max_tasks=3)
+    store.append("ERROR: first failure\nline two\n", "a")
+    for i in range(500):
+        store.append(f"[download] {i}%\n", f"t{i % 3}")
+    assert len(store) == 100
+    # Task "a" was the least recently logged, so its buffer was evicted
+    assert store.tasks() == ["t2", "t0", "t1"]
+    assert len(store.lines("t1")) == 10
+
+    store.append("ERROR: late failure\n", "t1")
+    store.append("\n".join(f"noise {i}" for i in range(200)))
+    assert [entry.text for entry in store.lines(min_level="error")] == []
+    assert [entry.text for entry in store.lines("t1", min_level="error")] == ["ERROR: late failure"]
+    assert [entry.text for entry in store.lines(text="NOISE 19", limit=2)] == ["noise 198", "noise 199"]
+
+
+def test_viewer_filters_by_task_level_and_text():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    pytest.importorskip("PySide6")
+    from PySide6.QtWidgets import QApplication
+    from ui_components_qt import LogsFrame
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    frame = LogsFrame()
+    frame.set_task_name("task-1", "clip.mp4")
+    frame.add_entries([
+        ("[download] 10% of clip\nERROR: clip broke\n", "task-1"),
+        ("[download] 50% of song\n", "task-2"),
+        ("Preview ready\n", ""),
+    ])
+    assert frame.log_text.blockCount() == 4
+    assert frame.task_filter.itemText(frame.task_filter.findData("task-1")) == "clip.mp4"
+
+    frame.task_filter.setCurrentIndex(frame.task_filter.findData("task-1"))
+    assert frame.log_text.toPlainText().splitlines() == ["[download] 10% of clip", "ERROR: clip broke"]
+    frame.level_filter.setCurrentIndex(frame.level_filter.findData("error"))
+    assert frame.log_text.toPlainText() == "ERROR: clip broke"
+    # New lines are shown only when they match the active filters
+    frame.add_log_raw("[download] 20% of clip\nERROR: clip broke again\n", "task-1")
+    frame.add_log_raw("ERROR: song broke\n", "task-2")
+    assert frame.log_text.toPlainText().splitlines() == ["ERROR: clip broke", "ERROR: clip broke again"]
+
+    frame.task_filter.setCurrentIndex(0)
+    frame.text_filter.setText("song")
+    assert frame.log_text.toPlainText() == "ERROR: song broke"
+    frame.clear()
+    assert not frame.has_logs() and frame.task_filter.count() == 1
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Tests for the compact yt-dlp info model"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from media_info import compact_info, parse_media_info
+
+FULL_INFO = {
+    "id": "dQw4w9WgXcQ",
+    "title": "Song",
+    "uploader": "Artist",
+    "duration": 212,
+    "upload_date": "20091025",
+    "extractor": "youtube",
+    "extractor_key": "Youtube",
+    "format_id": "137+140",
+    "description": "x" * 5000,
+    "thumbnails": [{"url": "https://i.ytimg.com/small.jpg", "id": "0"}, {"url": "https://i.ytimg.com/big.jpg", "id": "1"}],
+    "automatic_captions": {"en": [{"ext": "vtt", "url": "https://example.com/caption"}] * 10},
+    "formats": [
+        {"format_id": "sb0", "ext": "mhtml", "vcodec": "none", "acodec": "none", "height": 45,
+         "fragments": [{"url": "https://example.com/sb", "duration": 1.0}] * 100},
+        {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a", "filesize": 3_400_000,
+         "url": "https://example.com/audio", "http_headers": {"User-Agent": "x"}},
+        {"format_id": "137", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 1080,
+         "filesize_approx": 60_000_000, "url": "https://example.com/video"},
+        {"format_id": "hls-meta", "ext": "m3u8", "vcodec": "avc1", "acodec": "mp4a"}
+    ],
+    "requested_formats": [{"format_id": "137", "url": "https://example.com/video"}]
+}
+
+EXPECTED = {
+    "id": "dQw4w9WgXcQ",
+    "title": "Song",
+    "uploader": "Artist",
+    "duration": 212,
+    "upload_date": "20091025",
+    "extractor_key": "Youtube",
+    "thumbnail": "https://i.ytimg.com/big.jpg",
+    "formats": [
+        {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a", "filesize": 3_400_000},
+        {"format_id": "137", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 1080,
+         "filesize_approx": 60_000_000}
+    ]
+}
+
+
+def test_compact_info_keeps_only_used_fields():
+    assert compact_info(FULL_INFO) == EXPECTED
+
+
+def test_parse_prunes_while_decoding():
+    assert parse_media_info(json.dumps(FULL_INFO)) == EXPECTED
+
+
+def test_compact_info_is_idempotent():
+    assert compact_info(EXPECTED) == EXPECTED
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the persistent metadata cache"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from metadata_cache import MetadataCache, media_key
+
+INFO = {
+    "id": "dQw4w9WgXcQ",
+    "title": "Song",
+    "uploader": "Artist",
+    "duration": 212,
+    "upload_date": "20091025",
+    "thumbnails": [{"url": "https://i.ytimg.com/small.jpg"}, {"url": "https://i.ytimg.com/big.jpg"}],
+    "description": "x" * 5000,
+    "formats": [
+        {"format_id": "sb0", "ext": "mhtml", "vcodec": "none", "acodec": "none", "fragments": [{}] * 100},
+        {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a", "filesize": 3_400_000,
+         "http_headers": {"User-Agent": "x"}},
+        {"format_id": "137", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 1080,
+         "filesize_approx": 60_000_000}
+    ]
+}
+
+
+def test_media_key_canonicalizes_urls():
+    same = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL1&si=abc",
+        "https://youtu.be/dQw4w9WgXcQ?si=abc",
+        "https://music.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+    ]
+    assert {media_key(url) for url in same} == {"youtube:dQw4w9WgXcQ"}
+    assert media_key("https://www.instagram.com/reel/Cabc123/?igsh=xyz") == "instagram:Cabc123"
+    assert media_key("https://www.tiktok.com/@user/video/7234567890123456789") == "tiktok:7234567890123456789"
+    assert media_key("https://example.com/a/?utm_source=x&b=2&a=1") == "url:example.com/a?a=1&b=2"
+
+
+def test_entries_persist_and_lookups_are_fast(tmp_path):
+    path = str(tmp_path / "meta.db")
+    cache = MetadataCache(path)
+    cache.put("https://youtu.be/dQw4w9WgXcQ", INFO)
+    cache.close()
+
+    cache = MetadataCache(path)
+    url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    assert cache.get(url)["title"] == "Song"
+    started = time.perf_counter()
+    for _ in range(1000):
+        cache.get(url)
+    assert (time.perf_counter() - started) / 1000 < 0.001
+    assert cache.get("https://youtu.be/aaaaaaaaaaa") is None
+
+
+def test_expired_entries_refresh_in_background(tmp_path):
+    refreshed = threading.Event()
+
+    def fetcher(url):
+        refreshed.set()
+        return dict(INFO, title="New title")
+
+    cache = MetadataCache(str(tmp_path / "meta.db"), fetcher=fetcher, ttls={"YouTube": 0.05})
+    url = "https://youtu.be/dQw4w9WgXcQ"
+    cache.put(url, INFO)
+    assert cache.get(url)["title"] == "Song"
+    assert not refreshed.is_set()
+    time.sleep(0.1)
+    # Stale data is served while the refresh runs
+    assert cache.get(url)["title"] == "Song"
+    assert refreshed.wait(2)
+    deadline = time.monotonic() + 2
+    while cache.get(url, allow_stale=False) is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert cache.get(url)["title"] == "New title"
+
+
+def test_lru_cap_evicts_least_recently_used(tmp_path):
+    cache = MetadataCache(str(tmp_path / "meta.db"), max_entries=3, memory_entries=1)
+    urls = [f"https://example.com/v/{i}" for i in range(3)]
+    for url in urls:
+        cache.put(url, {"title": url})
+    time.sleep(0.01)
+    cache.get(urls[0])
+    cache.put("https://example.com/v/3", {"title": "new"})
+    assert len(cache) == 3
+    assert cache.get(urls[0]) is not None
+    assert cache.get(urls[1]) is None
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Tests for coalesced completion summaries and the shared notifier"""
+
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from download_manager import DownloadManager, DownloadTask
+from notifications import CompletionSummary, Notifier
+
+
+def _finish(manager, count, fail_every=0):
+    for i in range(count):
+        task = DownloadTask(url=f"https://example.com/{i}", path=f"/videos/clip{i}.mp4", format_choice="mp4")
+        manager.add_task(task)
+        manager.complete_task(manager.get_next_task(), success=not (fail_every and i % fail_every == 0))
+
+
+def test_burst_of_completions_is_one_summary():
+    manager = DownloadManager(max_downloads=1)
+    _finish(manager, 39, fail_every=20)
+    summary = CompletionSummary(manager.take_finished())
+    assert summary.text() == "37 completed, 2 failed"
+    assert summary.title() == "Downloads Finished"
+    assert len(summary.completed) == 37
+    assert manager.take_finished() == []
+
+    _finish(manager, 1)
+    single = CompletionSummary(manager.take_finished())
+    assert (single.title(), single.message()) == ("Download Complete", "clip0.mp4")
+
+
+def test_notifier_reuses_one_thread_and_keeps_the_latest():
+    release = threading.Event()
+    delivered = []
+
+    def send(title, message, timeout):
+        release.wait(5)
+        delivered.append(message)
+
+    notifier = Notifier(send)
+    before = threading.active_count()
+    for i in range(200):
+        notifier.notify("Download Complete", f"file {i}")
+    assert threading.active_count() - before == 1
+    release.set()
+    assert notifier.flush()
+    # The first was already being delivered; the rest collapse into the newest
+    assert delivered == ["file 0", "file 199"]
+
+
+def test_summary_dialog_appends_batches():
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    pytest.importorskip("PySide6")
+    from PySide6.QtWidgets import QApplication
+    from ui_components_qt import CompletionSummaryDialog
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    manager = DownloadManager(max_downloads=1)
+    dialog = CompletionSummaryDialog()
+    opened = []
+    dialog.open_requested.connect(opened.append)
+
+    _finish(manager, 3, fail_every=2)
+    dialog.add_summary(CompletionSummary(manager.take_finished()))
+    _finish(manager, 1)
+    dialog.add_summary(CompletionSummary(manager.take_finished()))
+    assert dialog.summary_label.text() == "2 completed, 2 failed"
+    assert dialog.list.count() == 4
+
+    dialog.list.setCurrentRow(0)
+    dialog.open_selected()
+    assert opened == [os.path.join("/videos", "clip1.mp4")]
+    dialog.list.setCurrentRow(1)
+    assert not dialog.open_btn.isEnabled()
+
+    dialog.show()
+    dialog.close()
+    assert dialog.list.count() == 0 and len(dialog.summary) == 0
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for clipboard metadata prefetch"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import prefetch
+from metadata_cache import MetadataCache
+from prefetch import Prefetcher, TokenBucket
+
+
+class FakeFetcher:
+    def __init__(self, duration: float = 0.0):
+        self.duration = duration
+        self.calls = []
+        self.started = threading.Event()
+
+    def __call__(self, url, cancel_event):
+        self.calls.append((url, time.monotonic()))
+        self.started.set()
+        if cancel_event.wait(self.duration):
+            return {}
+        return {"title": url.rsplit("/", 1)[-1], "formats": []}
+
+
+def _wait(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_token_bucket_caps_rate():
+    bucket = TokenBucket(rate=20, burst=2)
+    stop = threading.Event()
+    started = time.monotonic()
+    for _ in range(6):
+        assert bucket.take(stop)
+    # Two tokens up front, then 4 more at 20/s
+    assert time.monotonic() - started >= 0.18
+
+
+def test_prefetch_fills_cache_and_skips_cached(tmp_path):
+    cache = MetadataCache(str(tmp_path / "meta.db"))
+    cache.put("https://example.com/v/known", {"title": "known"})
+    fetcher = FakeFetcher()
+    prefetcher = Prefetcher(cache, fetcher=fetcher, per_minute=6000, burst=5)
+    assert not prefetcher.add("https://example.com/v/known")
+    assert prefetcher.add("https://example.com/v/new")
+    assert not prefetcher.add("https://example.com/v/new")
+    assert _wait(lambda: prefetcher.completed == 1)
+    assert cache.get("https://example.com/v/new")["title"] == "new"
+    assert [url for url, _ in fetcher.calls] == ["https://example.com/v/new"]
+
+
+def test_prefetch_waits_for_real_work_and_yields(tmp_path, monkeypatch):
+    monkeypatch.setattr(prefetch, "BUSY_POLL", 0.02)
+    cache = MetadataCache(str(tmp_path / "meta.db"))
+    busy = threading.Event()
+    busy.set()
+    fetcher = FakeFetcher(duration=0.3)
+    prefetcher = Prefetcher(cache, fetcher=fetcher, is_busy=busy.is_set, per_minute=6000, burst=5)
+    prefetcher.add("https://example.com/v/a")
+    time.sleep(0.2)
+    assert fetcher.calls == []
+
+    busy.clear()
+    assert fetcher.started.wait(2)
+    # A preview starts: the in-flight prefetch is abandoned and retried once idle again
+    busy.set()
+    prefetcher.yield_to_work()
+    time.sleep(0.2)
+    assert len(fetcher.calls) == 1 and prefetcher.completed == 0
+    busy.clear()
+    assert _wait(lambda: prefetcher.completed == 1)
+    assert len(fetcher.calls) == 2
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Offscreen tests for the virtualized preview gallery"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+pytest.importorskip("PySide6")
+
+from PySide6.QtWidgets import QApplication
+from ui_components_qt import PreviewGallery
+
+CARDS = 500
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication(sys.argv)
+
+
+def test_only_cards_in_view_request_thumbnails(app):
+    gallery = PreviewGallery(lambda thumb_url: None)
+    requested = []
+    gallery.delegate.thumbnail_needed.connect(requested.append)
+    model = gallery.preview_model
+    for i in range(CARDS):
+        url = f"https://example.com/watch?v={i}"
+        model.add(url)
+        model.set_data(url, f"Video {i}", "Uploader\n3m 20s | 12.0 MB", f"https://img.example.com/{i}.jpg")
+    gallery.resize(900, gallery.sizeHint().height())
+    gallery.show()
+    app.processEvents()
+    # Height stops growing after a few rows; the rest scrolls
+    assert gallery.sizeHint().height() < 3 * 140 < gallery.card_rows() * 130
+
+    gallery.grab()
+    first = set(requested)
+    assert 0 < len(first) <= 12
+    assert "https://img.example.com/0.jpg" in first
+
+    requested.clear()
+    gallery.scrollToBottom()
+    gallery.grab()
+    assert f"https://img.example.com/{CARDS - 1}.jpg" in requested
+    assert not first & set(requested)
+
+    # A failed thumbnail falls back to the placeholder and is not asked for again
+    model.thumbnail_changed(f"https://img.example.com/{CARDS - 1}.jpg", available=False)
+    requested.clear()
+    gallery.grab()
+    assert f"https://img.example.com/{CARDS - 1}.jpg" not in requested
+
+    model.remove("https://example.com/watch?v=0")
+    assert len(model) == CARDS - 1 and "https://example.com/watch?v=1" in model
+    model.clear()
+    assert gallery.card_rows() == 0
+
+
+def test_thumbnails_decode_straight_to_qimage(app, tmp_path):
+    from PySide6.QtGui import QImage, QColor
+    from downloader_qt import _decode_thumbnail_qimage, _pil_to_qimage
+
+    path = str(tmp_path / "thumb.jpg")
+    source = QImage(1280, 720, QImage.Format.Format_RGB32)
+    source.fill(QColor("#1877f2"))
+    assert source.save(path, "JPEG")
+    image = _decode_thumbnail_qimage(path, 80)
+    assert (image.width(), image.height()) == (80, 45)
+
+    Image = pytest.importorskip("PIL.Image")
+    converted = _pil_to_qimage(Image.new("RGB", (4, 2), (255, 0, 0)))
+    assert (converted.width(), converted.height()) == (4, 2)
+    assert converted.pixelColor(3, 1) == QColor(255, 0, 0)
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
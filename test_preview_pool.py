@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Tests for the bounded preview pool"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import downloader_core
+from preview_pool import PreviewPool
+
+
+class Tracker:
+    """Work function that records concurrency per platform"""
+
+    def __init__(self, duration: float = 0.1):
+        self.duration = duration
+        self.lock = threading.Lock()
+        self.running = {}
+        self.peak = {}
+        self.peak_total = 0
+        self.done = []
+
+    def __call__(self, job):
+        with self.lock:
+            self.running[job.platform] = self.running.get(job.platform, 0) + 1
+            self.peak[job.platform] = max(self.peak.get(job.platform, 0), self.running[job.platform])
+            self.peak_total = max(self.peak_total, sum(self.running.values()))
+        job.cancel_event.wait(self.duration)
+        with self.lock:
+            self.running[job.platform] -= 1
+            if not job.cancelled:
+                self.done.append(job.url)
+
+
+def _wait_idle(pool, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while pool.pending() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return pool.pending() == 0
+
+
+def test_runs_in_parallel_up_to_width():
+    pool = PreviewPool(width=4, platform_limits={})
+    work = Tracker(0.2)
+    started = time.monotonic()
+    for i in range(8):
+        pool.submit(f"https://youtube.com/watch?v={i}", work)
+    assert _wait_idle(pool)
+    assert len(work.done) == 8
+    assert work.peak_total == 4
+    assert time.monotonic() - started < 0.8
+
+
+def test_platform_limits():
+    pool = PreviewPool(width=4, platform_limits={"Instagram": 1})
+    work = Tracker(0.05)
+    for i in range(4):
+        pool.submit(f"https://instagram.com/p/{i}", work)
+        pool.submit(f"https://youtube.com/watch?v={i}", work)
+    assert _wait_idle(pool)
+    assert work.peak["Instagram"] == 1
+    assert work.peak["YouTube"] > 1
+    assert len(work.done) == 8
+
+
+def test_cancel_except_drops_stale_jobs():
+    pool = PreviewPool(width=1, platform_limits={})
+    work = Tracker(5.0)
+    jobs = [pool.submit(f"https://youtube.com/watch?v={i}", work) for i in range(3)]
+    assert pool.submit(jobs[0].url, work) is jobs[0]
+    time.sleep(0.05)
+    assert pool.cancel_except([jobs[2].url]) == 2
+    assert jobs[0].cancelled and jobs[1].cancelled and not jobs[2].cancelled
+    pool.cancel_all()
+    assert _wait_idle(pool)
+    assert work.done == []
+
+
+FAKE_YTDLP = r'''#!{python}
+import time
+time.sleep(30)
+'''
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_fetch_media_info_is_cancellable(tmp_path, monkeypatch):
+    """Cancelling kills the running yt-dlp -J instead of waiting for it"""
+    script = tmp_path / "yt-dlp"
+    script.write_text(FAKE_YTDLP.replace("{python}", sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setattr(downloader_core, "YTDLP_PATH", str(script))
+    cancel = threading.Event()
+    threading.Timer(0.3, cancel.set).start()
+    started = time.monotonic()
+    assert downloader_core.fetch_media_info("https://example.com/v", cancel_event=cancel) == {}
+    assert time.monotonic() - started < 2
+
+
+FAKE_BATCH_YTDLP = r'''#!{python}
+import json, sys, time
+for url in sys.argv[sys.argv.index("--") + 1:]:
+    time.sleep(0.05)
+    name = url.rsplit("/", 1)[-1]
+    if name.startswith("missing"):
+        print(f"ERROR: [generic] {name}: HTTP Error 404: Not Found", file=sys.stderr, flush=True)
+        continue
+    print(json.dumps({"id": name, "title": name.upper(), "original_url": url, "extractor": "generic",
+                      "formats": [{"format_id": "0", "ext": "mp4", "height": 720, "url": url}]}), flush=True)
+'''
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_batch_fetch_streams_results_per_url(tmp_path, monkeypatch):
+    script = tmp_path / "yt-dlp"
+    script.write_text(FAKE_BATCH_YTDLP.replace("{python}", sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setattr(downloader_core, "YTDLP_PATH", str(script))
+    urls = [f"https://example.com/{name}" for name in ("a", "missing1", "b", "c", "missing2")]
+    results, logs = [], []
+    succeeded = downloader_core.fetch_media_info_batch(
+        urls, lambda url, info: results.append((url, info.get("title"))), logs.append
+    )
+    assert succeeded == 3
+    assert results == [
+        (urls[0], "A"), (urls[1], None), (urls[2], "B"), (urls[3], "C"), (urls[4], None)
+    ]
+    assert any("missing1" in line and "404" in line for line in logs)
+
+
+# Emits a result no URL asked for and holds every ERROR line until it exits
+FAKE_STRAY_YTDLP = r'''#!{python}
+import json, sys
+errors = []
+print(json.dumps({"id": "zzz", "title": "STRAY", "original_url": "https://elsewhere.test/zzz"}), flush=True)
+for url in sys.argv[sys.argv.index("--") + 1:]:
+    name = url.rsplit("/", 1)[-1]
+    if name.startswith("missing"):
+        errors.append(f"ERROR: [generic] {name}: HTTP Error 404: Not Found")
+        continue
+    print(json.dumps({"id": name, "title": name.upper(), "original_url": url, "extractor": "generic",
+                      "formats": [{"format_id": "0", "ext": "mp4", "height": 720, "url": url}]}), flush=True)
+print("\n".join(errors), file=sys.stderr, flush=True)
+'''
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="fake yt-dlp script needs a shebang")
+def test_batch_fetch_skips_stray_results_and_logs_late_errors(tmp_path, monkeypatch):
+    script = tmp_path / "yt-dlp"
+    script.write_text(FAKE_STRAY_YTDLP.replace("{python}", sys.executable))
+    script.chmod(0o755)
+    monkeypatch.setattr(downloader_core, "YTDLP_PATH", str(script))
+    urls = [f"https://example.com/{name}" for name in ("a", "missing1", "b")]
+    results, logs = [], []
+    succeeded = downloader_core.fetch_media_info_batch(
+        urls, lambda url, info: results.append((url, info.get("title"))), logs.append
+    )
+    assert succeeded == 2
+    assert results == [(urls[0], "A"), (urls[1], None), (urls[2], "B")]
+    assert logs == [f"yt-dlp preview failed for {urls[1]}: HTTP Error 404: Not Found\n"]
+
+
+def test_cancelling_one_url_keeps_the_rest_of_a_batch():
+    pool = PreviewPool(width=1, platform_limits={})
+    release = threading.Event()
+    seen = []
+
+    def work(job):
+        release.wait(2)
+        seen.extend(job.urls)
+
+    job = pool.submit_batch(["https://a/1", "https://a/2", "https://a/3"], work)
+    assert pool.submit_batch(["https://a/2"], work) is None
+    assert pool.cancel("https://a/2")
+    assert not job.cancelled
+    release.set()
+    assert _wait_idle(pool)
+    assert seen == ["https://a/1", "https://a/3"]
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Tests for process-group-aware cancel and pause of downloads (POSIX only)"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import downloader_core
+from download_manager import DownloadManager, DownloadTask, DownloadStatus
+
+pytestmark = pytest.mark.skipif(os.name == 'nt', reason="process groups are POSIX only")
+
+# Stand-in for yt-dlp: starts an ffmpeg-like child, writes partial output,
+# prints a single progress line and then goes quiet.
+FAKE_YTDLP = r'''#!{python}
+import os, signal, subprocess, sys, time
+
+args = sys.argv[1:]
+out = args[args.index("-o") + 1]
+ignore_term = os.environ.get("FAKE_YTDLP_IGNORE_TERM") == "1"
+child_code = "import signal, time\n"
+if ignore_term:
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    child_code += "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+child_code += "time.sleep(60)\n"
+child = subprocess.Popen([sys.executable, "-c", child_code])
+with open(os.environ["FAKE_YTDLP_PIDFILE"], "w") as f:
+    f.write(str(child.pid))
+base = os.path.splitext(out)[0]
+for path in (out, base + ".f137.mp4", base + ".f140.m4a.part"):
+    with open(path, "w") as f:
+        f.write("partial")
+print("[download]   1.0% of 10.00MiB at 1.00MiB/s ETA 00:10", flush=True)
+time.sleep(60)
+'''
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read()
+        return stat[stat.rindex(b")") + 2:].split()[0] != b"Z"
+    except FileNotFoundError:
+        return False
+    except Exception:
+        try:
+            os.kill(pid, 0)
+            return True
+        except ProcessLookupError:
+            return False
+
+
+def _wait_for(predicate, timeout: float) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return predicate()
+
+
+@pytest.fixture
+def fake_ytdlp(tmp_path, monkeypatch):
+    script = tmp_path / "yt-dlp"
+    script.write_text(FAKE_YTDLP.replace("{python}", sys.executable))
+    script.chmod(0o755)
+    pid_file = tmp_path / "child.pid"
+    monkeypatch.setattr(downloader_core, "YTDLP_PATH", str(script))
+    monkeypatch.setenv("FAKE_YTDLP_PIDFILE", str(pid_file))
+    return pid_file
+
+
+def _start(tmp_path):
+    manager = DownloadManager()
+    task = DownloadTask(url="https://example.com/v", path=str(tmp_path / "video.mp4"), format_choice="mp4")
+    manager.add_task(task)
+    manager.get_next_task()
+    settings = {"retry_count": 0, "embed_thumbnail": False, "embed_metadata": False}
+    thread = threading.Thread(target=downloader_core.download_task, args=(task, manager, settings), daemon=True)
+    thread.start()
+    return manager, task, thread
+
+
+def _child_pid(pid_file) -> int:
+    assert _wait_for(lambda: pid_file.exists() and pid_file.read_text(), 10)
+    return int(pid_file.read_text())
+
+
+def test_cancel_kills_group_and_cleans_up(tmp_path, fake_ytdlp):
+    """Cancel returns immediately, kills the forked child and removes partial files"""
+    manager, task, thread = _start(tmp_path)
+    child = _child_pid(fake_ytdlp)
+    assert _wait_for(lambda: task.progress > 0, 10)
+
+    started = time.monotonic()
+    manager.cancel_task(task)
+    downloader_core.stop_task_process(task)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert time.monotonic() - started < 2
+
+    assert _wait_for(lambda: not _pid_alive(child), 5)
+    assert _wait_for(lambda: not any(p.name.startswith("video") for p in tmp_path.iterdir()), 5)
+    assert task.status == DownloadStatus.CANCELLED
+
+
+def test_cancel_escalates_to_sigkill(tmp_path, fake_ytdlp, monkeypatch):
+    """Processes that ignore SIGTERM are killed once the deadline passes"""
+    monkeypatch.setenv("FAKE_YTDLP_IGNORE_TERM", "1")
+    manager, task, thread = _start(tmp_path)
+    child = _child_pid(fake_ytdlp)
+    assert _wait_for(lambda: task.progress > 0, 10)
+
+    manager.cancel_task(task)
+    reaper = downloader_core.stop_task_process(task, timeout=0.5)
+    reaper.join(timeout=5)
+    assert not reaper.is_alive()
+    assert task.process.poll() is not None
+    assert _wait_for(lambda: not _pid_alive(child), 5)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+
+
+def test_pause_keeps_partial_outputs(tmp_path, fake_ytdlp):
+    """Pause stops the process tree but leaves downloaded data in place"""
+    manager, task, thread = _start(tmp_path)
+    child = _child_pid(fake_ytdlp)
+    assert _wait_for(lambda: task.progress > 0, 10)
+
+    manager.pause_task(task)
+    downloader_core.stop_task_process(task).join(timeout=5)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert _wait_for(lambda: not _pid_alive(child), 5)
+    assert (tmp_path / "video.mp4").exists()
+
+
+def test_cleanup_leaves_downloads_sharing_a_title_prefix(tmp_path):
+    task = DownloadTask(url="https://example.com/v", path=str(tmp_path / "Song.mp4"), format_choice="mp4")
+    mine = ["Song.mp4", "Song.mp4.part", "Song.f137.mp4.part", "Song.mp4.ytdl"]
+    others = ["Song (Live).mp4.part", "Song (Live).f140.m4a", "Songbook.mp4.ytdl"]
+    for name in mine + others:
+        (tmp_path / name).write_text("partial")
+    downloader_core.cleanup_partial_outputs(task)
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(others)
+
+
+def test_conversion_cancel_kills_ffmpeg(tmp_path):
+    """Setting the cancel event stops a running ffmpeg conversion"""
+    pid_file = tmp_path / "ffmpeg.pid"
+    ffmpeg = tmp_path / "ffmpeg"
+    ffmpeg.write_text(
+        f"#!{sys.executable}\nimport os, time\n"
+        f"open({str(pid_file)!r}, 'w').write(str(os.getpid()))\ntime.sleep(60)\n"
+    )
+    ffmpeg.chmod(0o755)
+    source = tmp_path / "clip.mp4"
+    source.write_bytes(b"not really a video")
+    cancel = threading.Event()
+    result = []
+    thread = threading.Thread(target=lambda: result.append(downloader_core.convert_file(
+        str(source), "mp3", "192k", "44100", str(ffmpeg), cancel_event=cancel
+    )), daemon=True)
+    thread.start()
+    pid = _child_pid(pid_file)
+
+    cancel.set()
+    thread.join(timeout=5)
+    assert result == [False]
+    assert _wait_for(lambda: not _pid_alive(pid), 5)
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Tests for the shared thumbnail cache"""
+
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from thumbnail_cache import ThumbnailCache, ThumbnailLoader, decode_thumbnail, image_extension
+
+JPEG_HEADER = b"\xff\xd8\xff\xe0"
+
+
+class ImageServer:
+    """Serves /<name> as fake image bytes after a short delay, counting requests"""
+
+    def __init__(self, delay: float = 0.2):
+        server = self
+        self.requests = 0
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                server.requests += 1
+                time.sleep(delay)
+                name = self.path.strip("/").split("-")[0]
+                body = JPEG_HEADER + name.encode() * 1000
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def test_concurrent_requests_share_one_download(tmp_path):
+    cache = ThumbnailCache(str(tmp_path))
+    with ImageServer() as server:
+        url = f"{server.url}/a"
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.fetch(url))) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert server.requests == 1
+        assert len(set(results)) == 1 and os.path.exists(results[0])
+        # Later requests and new instances are served from disk
+        assert ThumbnailCache(str(tmp_path)).fetch(url) == results[0]
+        assert server.requests == 1
+
+
+def test_identical_images_are_stored_once(tmp_path):
+    cache = ThumbnailCache(str(tmp_path))
+    with ImageServer(delay=0) as server:
+        first = cache.fetch(f"{server.url}/b-small")
+        second = cache.fetch(f"{server.url}/b-large")
+    assert first == second
+    assert first.endswith(".jpg")
+    assert cache.total_bytes == os.path.getsize(first)
+
+
+def test_least_recently_used_files_are_evicted(tmp_path):
+    cache = ThumbnailCache(str(tmp_path), max_mb=0.01)
+    paths = [cache.store(f"https://example.com/{i}", JPEG_HEADER + bytes([i]) * 3000) for i in range(3)]
+    time.sleep(0.01)
+    assert cache.lookup("https://example.com/0") == paths[0]
+    cache.store("https://example.com/3", JPEG_HEADER + b"\x03" * 3000)
+    assert cache.total_bytes <= cache.max_bytes
+    assert cache.lookup("https://example.com/0") == paths[0]
+    assert cache.lookup("https://example.com/1") == ""
+    assert not os.path.exists(paths[1])
+
+
+def test_jpeg_is_decoded_at_reduced_size(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    path = tmp_path / "big.jpg"
+    Image.new("RGB", (1600, 1200), "red").save(path)
+    image = decode_thumbnail(str(path), 80)
+    assert max(image.size) == 80
+    assert image_extension(path.read_bytes()) == ".jpg"
+
+
+def test_loader_serves_newest_request_first_and_skips_duplicates():
+    gate = threading.Event()
+    started = threading.Event()
+    done = []
+    finished = threading.Event()
+
+    def load(key):
+        started.set()
+        gate.wait(5)
+        return key.upper()
+
+    def on_done(key, result):
+        done.append(result)
+        if len(done) == 4:
+            finished.set()
+
+    loader = ThumbnailLoader(load, on_done, workers=1)
+    loader.request("a")
+    assert started.wait(5)
+    for key in ["b", "c", "b", "d"]:
+        loader.request(key)
+    gate.set()
+    assert finished.wait(5)
+    # "a" was already loading; the rest come newest first, "b" only once
+    assert done == ["A", "D", "C", "B"]
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Tests for watch-folder ingestion of URL list files"""
+
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import watch_folder
+from watch_folder import FolderWatcher, iter_urls, resolve_preset, preset_overrides
+
+SETTINGS = {
+    "presets": {
+        "Default": {"format_choice": "mp4"},
+        "Music": {"format_choice": "mp3", "audio_bitrate": "320k", "download_folder": "~/Music"}
+    },
+    "active_preset": "Default"
+}
+
+
+def _collector():
+    batches = []
+    files = []
+    done = threading.Event()
+
+    def on_urls(urls, folder):
+        batches.append((list(urls), folder))
+        return len(urls)
+
+    def on_file(path, ok, count):
+        files.append((os.path.basename(path), ok, count))
+        done.set()
+
+    return batches, files, done, on_urls, on_file
+
+
+def test_iter_urls_txt_and_csv(tmp_path):
+    txt = tmp_path / "list.txt"
+    txt.write_text("\ufeffhttps://a\n\n# comment\nnot a url\nhttps://b\n", encoding="utf-8")
+    csv_file = tmp_path / "list.csv"
+    csv_file.write_text("title,url\nOne,https://c\nTwo,\"https://d\"\n", encoding="utf-8")
+    assert list(iter_urls(str(txt))) == ["https://a", "https://b"]
+    assert list(iter_urls(str(csv_file))) == ["https://c", "https://d"]
+
+
+def test_presets():
+    assert resolve_preset(SETTINGS, "Music")["format_choice"] == "mp3"
+    assert resolve_preset(SETTINGS, "Missing") == {"format_choice": "mp4"}
+    assert preset_overrides(resolve_preset(SETTINGS, "Music")) == {"audio_bitrate": "320k"}
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_dropped_file_is_streamed_and_moved(tmp_path, monkeypatch, use_inotify):
+    if use_inotify and not sys.platform.startswith("linux"):
+        pytest.skip("inotify is Linux only")
+    monkeypatch.setattr(watch_folder, "SETTLE_SECONDS", 0.1)
+    batches, files, done, on_urls, on_file = _collector()
+    watcher = FolderWatcher([{"path": str(tmp_path), "preset": "Music"}], SETTINGS, on_urls, on_file,
+                            poll_interval=0.1, use_inotify=use_inotify)
+    watcher.start()
+    try:
+        assert watcher.backend == ("inotify" if use_inotify else "polling")
+        # Write under a temporary name and rename into place, like upstream systems do
+        staging = tmp_path / ".incoming.tmp"
+        staging.write_text("https://example.com/1\nhttps://example.com/2\n")
+        staging.rename(tmp_path / "batch.txt")
+        assert done.wait(5)
+    finally:
+        watcher.stop()
+
+    assert batches[0][0] == ["https://example.com/1", "https://example.com/2"]
+    assert batches[0][1]["preset"]["format_choice"] == "mp3"
+    assert files == [("batch.txt", True, 2)]
+    assert (tmp_path / "done" / "batch.txt").exists()
+    assert not (tmp_path / "batch.txt").exists()
+
+
+def test_file_without_urls_goes_to_failed(tmp_path):
+    batches, files, done, on_urls, on_file = _collector()
+    watcher = FolderWatcher([str(tmp_path)], SETTINGS, on_urls, on_file)
+    path = tmp_path / "empty.txt"
+    path.write_text("nothing here\n")
+    assert not watcher.process_file(str(path), watcher.folders[0])
+    assert (tmp_path / "failed" / "empty.txt").exists()
+    assert batches == []
+
+
+def test_large_list_is_batched(tmp_path):
+    """Multi-MB lists are delivered in bounded batches"""
+    path = tmp_path / "big.txt"
+    with open(path, "w") as f:
+        for i in range(50000):
+            f.write(f"https://example.com/watch?v={i:011d}\n")
+    assert path.stat().st_size > 1024 * 1024
+    sizes = []
+
+    def on_urls(urls, folder):
+        sizes.append(len(urls))
+        return len(urls)
+
+    watcher = FolderWatcher([str(tmp_path)], SETTINGS, on_urls)
+    assert watcher.process_file(str(path), watcher.folders[0])
+    assert sum(sizes) == 50000
+    assert max(sizes) <= watch_folder.BATCH_SIZE
+
+
+def test_full_queue_holds_back_the_rest(tmp_path, monkeypatch):
+    """URLs the queue cannot take yet are offered again instead of dropped"""
+    monkeypatch.setattr(watch_folder, "QUEUE_FULL_WAIT", 0.01)
+    path = tmp_path / "big.txt"
+    path.write_text("".join(f"https://example.com/{i}\n" for i in range(1000)))
+    queued = []
+
+    def on_urls(urls, folder):
+        # Room for 150 URLs per offer, as if downloads kept finishing
+        taken = urls[:150]
+        queued.extend(taken)
+        return len(taken)
+
+    files = []
+    watcher = FolderWatcher([str(tmp_path)], SETTINGS, on_urls, lambda p, ok, count: files.append((ok, count)))
+    assert watcher.process_file(str(path), watcher.folders[0])
+    assert queued == [f"https://example.com/{i}" for i in range(1000)]
+    assert files == [(True, 1000)]
+    assert (tmp_path / "done" / "big.txt").exists()
+
+
+def test_stop_mid_file_resumes_without_duplicates(tmp_path, monkeypatch):
+    monkeypatch.setattr(watch_folder, "QUEUE_FULL_WAIT", 0.01)
+    path = tmp_path / "big.txt"
+    path.write_text("".join(f"https://example.com/{i}\n" for i in range(500)))
+    queued = []
+    watcher = None
+
+    def on_urls(urls, folder):
+        if len(queued) >= 250:
+            # Queue full when the app shuts down
+            watcher._stopped.set()
+            return 0
+        queued.extend(urls[:50])
+        return len(urls[:50])
+
+    watcher = FolderWatcher([str(tmp_path)], SETTINGS, on_urls)
+    assert not watcher.process_file(str(path), watcher.folders[0])
+    assert path.exists() and len(queued) == 250
+
+    watcher = FolderWatcher([str(tmp_path)], SETTINGS, lambda urls, folder: queued.extend(urls) or len(urls))
+    assert watcher.process_file(str(path), watcher.folders[0])
+    assert queued == [f"https://example.com/{i}" for i in range(500)]
+    assert not os.path.exists(watch_folder.offset_path(str(path)))
+
+
+if __name__ == '__main__':
+    sys.exit(pytest.main([__file__, "-q"]))
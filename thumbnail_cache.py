@@ -0,0 +1,310 @@
+"""One on-disk thumbnail cache for every frontend.
+
+Thumbnails are stored once in a per-user cache directory, named by the hash
+of their bytes, so the same image reached through different URLs (or from
+the Qt and Tk apps) is kept once. An index maps URLs to those hashes; the
+least recently used files are deleted when the directory grows past its
+size cap. Concurrent requests for one URL share a single download, and JPEGs
+are decoded at reduced size (Pillow's draft mode) rather than at full size.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from config import user_cache_dir
+from http_client import get_http_client
+
+# Size cap of the cache directory
+DEFAULT_MAX_MB = 200
+
+# Eviction trims the cache to this fraction of the cap, so it does not run on every store
+EVICT_TARGET = 0.9
+
+# Seconds to wait for another caller's download of the same thumbnail
+FETCH_TIMEOUT = 15
+
+# Threads decoding thumbnails for views that load them on demand
+LOADER_WORKERS = 2
+
+INDEX_FILE = "index.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url TEXT PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    accessed REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blobs_accessed ON blobs (accessed);
+"""
+
+
+def default_cache_dir() -> str:
+    """Thumbnail directory inside the per-user cache"""
+    return os.path.join(user_cache_dir(), "thumbnails")
+
+
+def image_extension(data: bytes) -> str:
+    """File extension from an image's magic bytes"""
+    if data.startswith(b"\x89PNG"):
+        return ".png"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return ".webp"
+    if data[:6] in (b"GIF87a", b"GIF89a"):
+        return ".gif"
+    return ".jpg"
+
+
+def decode_thumbnail(path: str, size: int):
+    """Open an image scaled to fit `size` x `size`; JPEGs are decoded at reduced size"""
+    # Imported here so the download core can use the cache paths without loading Pillow
+    from PIL import Image
+    image = Image.open(path)
+    if image.format == "JPEG":
+        # DCT scaling decodes at 1/2, 1/4 or 1/8 size, no smaller than requested
+        image.draft("RGB", (size, size))
+    image.thumbnail((size, size))
+    return image
+
+
+class MemoryTier:
+    """Small thread-safe LRU of decoded images"""
+
+    def __init__(self, max_items: int):
+        self.max_items = max(1, int(max_items))
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+class ThumbnailCache:
+    """Content-addressed thumbnail files with LRU eviction and coalesced downloads"""
+
+    def __init__(self, cache_dir: str = None, max_mb: float = DEFAULT_MAX_MB):
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_bytes = max(1, int(max_mb * 1024 * 1024))
+        self.downloads = 0
+        self._lock = threading.Lock()
+        self._inflight = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._conn = sqlite3.connect(
+            os.path.join(self.cache_dir, INDEX_FILE), timeout=10,
+            check_same_thread=False, isolation_level=None
+        )
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error:
+            pass
+        self._conn.executescript(SCHEMA)
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def lookup(self, url: str) -> str:
+        """Path of a cached thumbnail, or "" if it is not on disk"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT b.digest, b.name FROM urls u JOIN blobs b ON b.digest = u.digest WHERE u.url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return ""
+            path = os.path.join(self.cache_dir, row[1])
+            if not os.path.exists(path):
+                self._forget(row[0])
+                return ""
+            self._conn.execute("UPDATE blobs SET accessed = ? WHERE digest = ?", (time.time(), row[0]))
+            return path
+
+    def fetch(self, url: str) -> str:
+        """Return the path of a thumbnail, downloading it once if needed; "" on failure"""
+        if not url:
+            return ""
+        try:
+            path = self.lookup(url)
+        except sqlite3.Error:
+            path = ""
+        if path:
+            return path
+        with self._lock:
+            waiter = self._inflight.get(url)
+            if waiter is None:
+                self._inflight[url] = threading.Event()
+        if waiter is not None:
+            # Someone is already downloading this URL; use their result
+            waiter.wait(FETCH_TIMEOUT)
+            try:
+                return self.lookup(url)
+            except sqlite3.Error:
+                return ""
+        try:
+            data = get_http_client().get(url).body
+            with self._lock:
+                self.downloads += 1
+            return self.store(url, data) if data else ""
+        except Exception:
+            return ""
+        finally:
+            with self._lock:
+                self._inflight.pop(url).set()
+
+    def store(self, url: str, data: bytes) -> str:
+        """Add image bytes for a URL; identical bytes share one file"""
+        digest = hashlib.sha256(data).hexdigest()
+        name = os.path.join(digest[:2], digest + image_extension(data))
+        path = os.path.join(self.cache_dir, name)
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone()
+            if not exists or not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                temp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(temp, "wb") as f:
+                    f.write(data)
+                os.replace(temp, path)
+            if not exists:
+                self._total += len(data)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO blobs (digest, name, size, accessed) VALUES (?, ?, ?, ?)",
+                (digest, name, len(data), time.time())
+            )
+            self._conn.execute("INSERT OR REPLACE INTO urls (url, digest) VALUES (?, ?)", (url, digest))
+            if self._total > self.max_bytes:
+                self._evict()
+        return path
+
+    def close(self):
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+
+    def _forget(self, digest: str):
+        """Drop a blob and the URLs pointing at it (caller holds the lock)"""
+        row = self._conn.execute("SELECT name, size FROM blobs WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            return
+        try:
+            os.remove(os.path.join(self.cache_dir, row[0]))
+        except OSError:
+            pass
+        self._conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        self._conn.execute("DELETE FROM urls WHERE digest = ?", (digest,))
+        self._total -= row[1]
+
+    def _evict(self):
+        """Delete least recently used files until the cache is under EVICT_TARGET of the cap"""
+        # Re-read the total: other processes share the directory
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+        target = self.max_bytes * EVICT_TARGET
+        if self._total <= self.max_bytes:
+            return
+        for digest, size in self._conn.execute("SELECT digest, size FROM blobs ORDER BY accessed").fetchall():
+            if self._total <= target:
+                break
+            self._forget(digest)
+
+
+class ThumbnailLoader:
+    """Runs `load(key)` for requested thumbnails on a few background threads.
+
+    The newest request is served first, so while a view scrolls the cards
+    now in view load before the ones already scrolled past. `on_done(key,
+    result)` is called from the loader thread, with None if `load` failed.
+    """
+
+    def __init__(self, load, on_done, workers: int = LOADER_WORKERS):
+        self.load = load
+        self.on_done = on_done
+        self.workers = max(1, int(workers))
+        self._pending = []
+        self._queued = set()
+        self._cond = threading.Condition()
+        self._threads = []
+
+    def request(self, key) -> bool:
+        """Queue a key; returns False if it is already queued"""
+        with self._cond:
+            if key in self._queued:
+                return False
+            self._queued.add(key)
+            self._pending.append(key)
+            self._threads = [t for t in self._threads if t.is_alive()]
+            if len(self._threads) < min(self.workers, len(self._pending)):
+                thread = threading.Thread(target=self._worker, daemon=True)
+                self._threads.append(thread)
+                thread.start()
+            self._cond.notify()
+        return True
+
+    def cancel_all(self):
+        with self._cond:
+            self._pending.clear()
+            self._queued.clear()
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                if not self._pending:
+                    # Idle threads exit; request starts new ones when needed
+                    self._threads = [t for t in self._threads if t is not threading.current_thread()]
+                    return
+                key = self._pending.pop()
+            try:
+                result = self.load(key)
+            except Exception:
+                result = None
+            with self._cond:
+                if key not in self._queued:
+                    continue  # cancelled while loading
+                self._queued.discard(key)
+            try:
+                self.on_done(key, result)
+            except Exception as e:
+                print(f"Thumbnail callback failed: {e}")
+
+
+def get_thumbnail_cache(max_mb: float = None) -> ThumbnailCache:
+    """The process-wide thumbnail cache, created on first use"""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = ThumbnailCache(max_mb=max_mb or DEFAULT_MAX_MB)
+        elif max_mb:
+            _shared_cache.max_bytes = max(1, int(max_mb * 1024 * 1024))
+        return _shared_cache
+
+
+_shared_cache = None
+_shared_lock = threading.Lock()
@@ -5,6 +5,7 @@ from tkinter import ttk, filedialog, messagebox
 import re
 from config import BG, FG, BOX, BTN, GREEN, RED, YELLOW, FORMATS, FILE_TYPES, QUALITY_OPTIONS, AUDIO_CODECS, AUDIO_BITRATES
 from downloader_core import get_output_extension
+from notifications import CompletionSummary, entry_path
 
 try:
     from tkinterdnd2 import DND_FILES, TkinterDnD
@@ -575,6 +576,75 @@ class HistoryFrame(tk.Frame):
             self.toggle_btn.config(text="▼ Hide")
             self.is_open = True
 
+class CompletionSummaryWindow(tk.Toplevel):
+    """Summary of downloads finished in the last coalescing window.
+
+    Later batches are appended while the window is open; closing it starts
+    the next summary afresh.
+    """
+
+    def __init__(self, parent, on_open=None, on_open_folder=None, on_close=None):
+        super().__init__(parent, bg=BG)
+        self.title("Downloads Finished")
+        self.geometry("460x320")
+        self.on_open = on_open
+        self.on_open_folder = on_open_folder
+        self.on_close = on_close
+        self.summary = CompletionSummary()
+        self.entries = []
+
+        self.summary_label = tk.Label(self, bg=BG, fg=FG, font=("Segoe UI", 11, "bold"), anchor="w")
+        self.summary_label.pack(fill="x", padx=10, pady=(10, 5))
+
+        list_frame = tk.Frame(self, bg=BG)
+        list_frame.pack(fill="both", expand=True, padx=10)
+        self.listbox = tk.Listbox(list_frame, bg=BOX, fg=FG, selectbackground=BTN, activestyle="none")
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.listbox.yview)
+        self.listbox.configure(yscrollcommand=scrollbar.set)
+        self.listbox.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        self.listbox.bind("<Double-Button-1>", lambda e: self.open_selected())
+
+        buttons = tk.Frame(self, bg=BG)
+        buttons.pack(fill="x", padx=10, pady=10)
+        tk.Button(buttons, text="Open", bg=BTN, fg=FG, bd=0, command=self.open_selected).pack(side="left")
+        tk.Button(buttons, text="Open Folder", bg=BOX, fg=FG, bd=0, command=self.open_selected_folder).pack(side="left", padx=5)
+        tk.Button(buttons, text="Close", bg=BOX, fg=FG, bd=0, command=self.close).pack(side="right")
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+    def add_summary(self, summary: CompletionSummary):
+        # Completed files first; they are the ones worth opening
+        for entry in sorted(summary.entries, key=lambda e: e.get("status") != "Completed"):
+            status = entry.get("status", "")
+            text = f"✓ {entry.get('file') or entry.get('url', '')}" if status == "Completed" else \
+                f"✗ {entry.get('file') or entry.get('url', '')} ({status.lower()})"
+            self.listbox.insert("end", text)
+            if status != "Completed":
+                self.listbox.itemconfig("end", fg=RED)
+            self.entries.append(entry)
+        self.summary.extend(summary.entries)
+        self.summary_label.config(text=self.summary.text())
+
+    def _selected(self):
+        selection = self.listbox.curselection()
+        return self.entries[selection[0]] if selection else None
+
+    def open_selected(self):
+        entry = self._selected()
+        if entry and entry.get("status") == "Completed" and self.on_open:
+            self.on_open(entry_path(entry))
+
+    def open_selected_folder(self):
+        entry = self._selected()
+        if entry and self.on_open_folder:
+            self.on_open_folder(entry.get("location", ""))
+
+    def close(self):
+        if self.on_close:
+            self.on_close()
+        self.destroy()
+
+
 class LogsFrame(tk.Frame):
     """Debug logs display"""
     
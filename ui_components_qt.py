@@ -2,12 +2,16 @@
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton,
-    QComboBox, QTextEdit, QTableWidget, QTableWidgetItem, QHeaderView,
+    QComboBox, QTextEdit, QTableWidget, QTableWidgetItem, QTableView, QHeaderView, QListView,
     QFrame, QCheckBox, QSpinBox, QFileDialog, QScrollArea, QMenu, QLayout,
-    QSizePolicy
+    QSizePolicy, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QApplication, QPlainTextEdit,
+    QDialog, QListWidget, QListWidgetItem
 )
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve, QRect, Property, QPoint, QSize
-from PySide6.QtGui import QFont, QPalette, QColor, QTextCursor, QPixmap
+from PySide6.QtCore import (
+    Qt, Signal, QPropertyAnimation, QEasingCurve, QRect, Property, QPoint, QSize,
+    QAbstractTableModel, QAbstractListModel, QModelIndex, QTimer, QPointF, QRectF
+)
+from PySide6.QtGui import QFont, QPalette, QColor, QTextCursor, QPixmap, QPainter, QPen, QPolygonF
 try:
     from config import FORMATS, QUALITY_OPTIONS, AUDIO_CODECS, AUDIO_BITRATES, MP3_QUALITY_PRESETS, SAMPLE_RATES
 except ImportError:
@@ -22,9 +26,33 @@ except ImportError:
         ("128 kbps (Low Quality)", "128k"),
         ("96 kbps (Minimal)", "96k"),
     ]
+from config import BTN, GREEN, RED, YELLOW, FG, LIGHT_FG
 from downloader_core import get_output_extension
+from log_store import LogStore, LEVELS, MAX_TASKS, level_at_least
+from history_store import HistoryStore, PAGE_SIZE as HISTORY_PAGE_SIZE
+from notifications import CompletionSummary, entry_path
 import os
 
+# Download table model roles painted by DownloadItemDelegate
+PROGRESS_ROLE = Qt.ItemDataRole.UserRole + 1
+SPEED_SAMPLES_ROLE = Qt.ItemDataRole.UserRole + 2
+PREVIEW_STATE_ROLE = Qt.ItemDataRole.UserRole + 3
+PREVIEW_INFO_ROLE = Qt.ItemDataRole.UserRole + 4
+PREVIEW_THUMB_ROLE = Qt.ItemDataRole.UserRole + 5
+
+# Side of the square thumbnail on a preview card
+PREVIEW_THUMB_SIZE = 80
+
+STATUS_COLUMN, SPEED_COLUMN, PROGRESS_COLUMN = 1, 3, 5
+
+STATUS_COLORS = {
+    "Downloading": BTN, "Completed": GREEN, "Failed": RED,
+    "Paused": YELLOW, "Cancelled": "#8a8d91", "Queued": "#8a8d91"
+}
+
+# Share of the remaining distance a progress bar moves per frame
+PROGRESS_EASING = 0.25
+
 
 class URLInputTextEdit(QTextEdit):
     """Custom QTextEdit that handles URL input with Enter to new line"""
@@ -41,182 +69,246 @@ class URLInputTextEdit(QTextEdit):
             super().keyPressEvent(event)
 
 
-class FlowLayout(QLayout):
-    """Layout that arranges widgets in a flow (wraps to next line)"""
-    def __init__(self, parent=None, margin=0, spacing=-1):
-        super().__init__(parent)
-        self.setContentsMargins(margin, margin, margin, margin)
-        self._spacing = spacing
-        self._items = []
-    
-    def addItem(self, item):
-        self._items.append(item)
-    
-    def count(self):
-        return len(self._items)
-    
-    def itemAt(self, index):
-        if 0 <= index < len(self._items):
-            return self._items[index]
-        return None
-    
-    def takeAt(self, index):
-        if 0 <= index < len(self._items):
-            return self._items.pop(index)
-        return None
-    
-    def expandingDirections(self):
-        return Qt.Orientation(0)
-    
-    def hasHeightForWidth(self):
-        return True
-    
-    def heightForWidth(self, width):
-        return self._do_layout(QRect(0, 0, width, 0), True)
-    
-    def setGeometry(self, rect):
-        super().setGeometry(rect)
-        self._do_layout(rect, False)
-    
-    def sizeHint(self):
-        return self.minimumSize()
-    
-    def minimumSize(self):
-        size = QSize()
-        for item in self._items:
-            size = size.expandedTo(item.minimumSize())
-        margins = self.contentsMargins()
-        size += QSize(margins.left() + margins.right(), margins.top() + margins.bottom())
-        return size
-    
-    def _do_layout(self, rect, test_only):
-        x = rect.x()
-        y = rect.y()
-        line_height = 0
-        spacing = self.spacing()
-        
-        for item in self._items:
-            widget = item.widget()
-            if widget:
-                space_x = spacing
-                space_y = spacing
-                
-                next_x = x + item.sizeHint().width() + space_x
-                if next_x - space_x > rect.right() and line_height > 0:
-                    x = rect.x()
-                    y = y + line_height + space_y
-                    next_x = x + item.sizeHint().width() + space_x
-                    line_height = 0
-                
-                if not test_only:
-                    item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
-                
-                x = next_x
-                line_height = max(line_height, item.sizeHint().height())
-        
-        return y + line_height - rect.y()
-    
-    def spacing(self):
-        if self._spacing >= 0:
-            return self._spacing
-        return 10
+def _short_url(url):
+    return url[:30] + "..." if len(url) > 30 else url
 
 
-class PreviewCard(QFrame):
-    """Individual preview card for a URL"""
-    
+class PreviewModel(QAbstractListModel):
+    """Preview cards keyed by URL.
+
+    A card is a row of plain data (state, title, info text, thumbnail URL);
+    the gallery paints rows as they come into view, so there are no widgets
+    per card.
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
-        self.setFixedSize(280, 120)  # Fixed size for grid layout
-        
-        layout = QHBoxLayout(self)
-        layout.setSpacing(10)
-        layout.setContentsMargins(8, 8, 8, 8)
-        
-        # Thumbnail
-        self.thumbnail = QLabel()
-        self.thumbnail.setFixedSize(80, 80)
-        self.thumbnail.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.thumbnail.setText("...")
-        layout.addWidget(self.thumbnail)
-        
-        # Info section
-        info_layout = QVBoxLayout()
-        info_layout.setSpacing(2)
-        
-        self.title_label = QLabel("Loading...")
-        self.title_label.setFont(QFont("Segoe UI", 9, QFont.Weight.Bold))
-        self.title_label.setWordWrap(True)
-        self.title_label.setMaximumHeight(35)
-        info_layout.addWidget(self.title_label)
-        
-        self.info_label = QLabel("")
-        self.info_label.setFont(QFont("Segoe UI", 8))
-        self.info_label.setWordWrap(True)
-        info_layout.addWidget(self.info_label)
-        
-        info_layout.addStretch()
-        layout.addLayout(info_layout, 1)
-
-        # Apply default theme after widgets are created
-        self.apply_theme("dark")
-    
+        # [url, state, title, info text, thumbnail url]
+        self._rows = []
+        self._index = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return row[2]
+        if role in (Qt.ItemDataRole.UserRole, Qt.ItemDataRole.ToolTipRole):
+            return row[0]
+        if role == PREVIEW_STATE_ROLE:
+            return row[1]
+        if role == PREVIEW_INFO_ROLE:
+            return row[3]
+        if role == PREVIEW_THUMB_ROLE:
+            return row[4]
+        return None
+
+    def add(self, url) -> bool:
+        """Add a loading card; returns False if the URL already has one"""
+        if url in self._index:
+            return False
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([url, "loading", "Fetching...", _short_url(url), ""])
+        self._index[url] = row
+        self.endInsertRows()
+        return True
+
     def set_loading(self, url):
-        """Show loading state"""
-        self.title_label.setText(f"Fetching...")
-        self.info_label.setText(url[:30] + "..." if len(url) > 30 else url)
-        self.thumbnail.setText("...")
-    
-    def set_data(self, title, info_text, pixmap=None):
-        """Set preview data"""
-        # Truncate title if too long
+        self._set(url, "loading", "Fetching...", _short_url(url), "")
+
+    def set_data(self, url, title, info_text, thumb_url=None):
+        row = self._index.get(url)
+        if row is None:
+            return
         if len(title) > 40:
             title = title[:37] + "..."
-        self.title_label.setText(title)
-        self.info_label.setText(info_text)
-        if pixmap:
-            self.thumbnail.setPixmap(pixmap.scaled(80, 80, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-        else:
-            self.thumbnail.setText("No\nPreview")
-    
+        self._set(url, "ready", title, info_text, self._rows[row][4] if thumb_url is None else thumb_url)
+
     def set_error(self, url):
-        """Show error state"""
-        self.title_label.setText("Failed")
-        self.info_label.setText(url[:30] + "..." if len(url) > 30 else url)
-        self.thumbnail.setText("✗")
+        self._set(url, "error", "Failed", _short_url(url), "")
+
+    def thumbnail_changed(self, thumb_url, available=True):
+        """Repaint the cards showing a thumbnail; unavailable ones fall back to a placeholder"""
+        for row, values in enumerate(self._rows):
+            if values[4] == thumb_url:
+                if not available:
+                    values[4] = ""
+                index = self.index(row)
+                self.dataChanged.emit(index, index)
+
+    def remove(self, url) -> bool:
+        row = self._index.get(url)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._index[url]
+        for later in range(row, len(self._rows)):
+            self._index[self._rows[later][0]] = later
+        self.endRemoveRows()
+        return True
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._index = {}
+        self.endResetModel()
+
+    def urls(self):
+        return [row[0] for row in self._rows]
+
+    def __contains__(self, url):
+        return url in self._index
+
+    def __len__(self):
+        return len(self._rows)
+
+    def _set(self, url, state, title, info_text, thumb_url):
+        row = self._index.get(url)
+        if row is None:
+            return
+        values = [url, state, title, info_text, thumb_url]
+        if self._rows[row] != values:
+            self._rows[row] = values
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+
 
-    def apply_theme(self, theme: str):
+class PreviewCardDelegate(QStyledItemDelegate):
+    """Paints preview cards; a thumbnail is requested the first time its card is painted"""
+
+    CARD_SIZE = QSize(280, 120)
+
+    # Thumbnail URL of a card painted without its image
+    thumbnail_needed = Signal(str)
+
+    def __init__(self, pixmap_for, parent=None):
+        super().__init__(parent)
+        self.pixmap_for = pixmap_for
+        self.title_font = QFont("Segoe UI", 9, QFont.Weight.Bold)
+        self.info_font = QFont("Segoe UI", 8)
+        self.set_theme("dark")
+
+    def set_theme(self, theme: str):
         if theme == "light":
-            self.setStyleSheet(
-                """
-                PreviewCard {
-                    background-color: #ffffff;
-                    border: 2px solid #1877f2;
-                    border-radius: 8px;
-                    padding: 8px;
-                }
-                """
-            )
-            self.thumbnail.setStyleSheet(
-                "border: 1px solid #cbd5e1; border-radius: 4px; background-color: #f1f5f9;"
+            self.colors = {
+                "card": "#ffffff", "border": "#1877f2", "thumb": "#f1f5f9",
+                "thumb_border": "#cbd5e1", "text": LIGHT_FG, "info": "#4b5563",
+            }
+        else:
+            self.colors = {
+                "card": "#2a2a2a", "border": "#2374e1", "thumb": "#1a1a1a",
+                "thumb_border": "#555555", "text": FG, "info": "#aaaaaa",
+            }
+
+    def sizeHint(self, option, index):
+        return self.CARD_SIZE
+
+    def paint(self, painter, option, index):
+        colors = self.colors
+        rect = option.rect
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(QColor(colors["border"]), 2))
+        painter.setBrush(QColor(colors["card"]))
+        painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 8, 8)
+
+        size = PREVIEW_THUMB_SIZE
+        thumb = QRect(rect.x() + 10, rect.y() + (rect.height() - size) // 2, size, size)
+        painter.setPen(QPen(QColor(colors["thumb_border"]), 1))
+        painter.setBrush(QColor(colors["thumb"]))
+        painter.drawRoundedRect(QRectF(thumb), 4, 4)
+        state = index.data(PREVIEW_STATE_ROLE)
+        thumb_url = index.data(PREVIEW_THUMB_ROLE)
+        pixmap = self.pixmap_for(thumb_url) if thumb_url else None
+        if pixmap is not None:
+            painter.drawPixmap(
+                thumb.x() + (size - pixmap.width()) // 2, thumb.y() + (size - pixmap.height()) // 2, pixmap
             )
-            self.info_label.setStyleSheet("color: #4b5563;")
         else:
+            if thumb_url:
+                self.thumbnail_needed.emit(thumb_url)
+            placeholder = "✗" if state == "error" else "No\nPreview" if state == "ready" and not thumb_url else "..."
+            painter.setPen(QColor(colors["info"]))
+            painter.drawText(thumb, Qt.AlignmentFlag.AlignCenter, placeholder)
+
+        left = thumb.right() + 11
+        text = QRect(left, rect.y() + 10, rect.right() - 10 - left, rect.height() - 20)
+        wrap = Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop | Qt.TextFlag.TextWordWrap
+        painter.setFont(self.title_font)
+        painter.setPen(QColor(colors["text"]))
+        painter.drawText(QRect(text.x(), text.y(), text.width(), 35), wrap, index.data() or "")
+        painter.setFont(self.info_font)
+        painter.setPen(QColor(colors["info"]))
+        painter.drawText(text.adjusted(0, 37, 0, 0), wrap, index.data(PREVIEW_INFO_ROLE) or "")
+        painter.restore()
+
+
+class PreviewGallery(QListView):
+    """Wrapping grid of preview cards.
+
+    Cards all have one size, so the view places them arithmetically and only
+    paints those in the viewport; layout and paint cost do not grow with the
+    number of cards. The gallery grows with its cards up to MAX_VISIBLE_ROWS
+    rows and scrolls after that.
+    """
+
+    MAX_VISIBLE_ROWS = 3
+    SPACING = 5
+
+    def __init__(self, pixmap_for, parent=None):
+        super().__init__(parent)
+        self.preview_model = PreviewModel(self)
+        self.delegate = PreviewCardDelegate(pixmap_for, self)
+        self.setModel(self.preview_model)
+        self.setItemDelegate(self.delegate)
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(True)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Static)
+        self.setUniformItemSizes(True)
+        self.setSpacing(self.SPACING)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setVerticalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        self.preview_model.rowsInserted.connect(self.updateGeometry)
+        self.preview_model.rowsRemoved.connect(self.updateGeometry)
+        self.preview_model.modelReset.connect(self.updateGeometry)
+        self.set_theme("dark")
+
+    def card_rows(self, width=None) -> int:
+        """Rows of cards needed at a viewport width"""
+        cell = PreviewCardDelegate.CARD_SIZE.width() + 2 * self.SPACING
+        per_row = max(1, ((width or self.viewport().width()) - self.SPACING) // cell)
+        return -(-self.preview_model.rowCount() // per_row)
+
+    def sizeHint(self):
+        rows = min(self.card_rows(), self.MAX_VISIBLE_ROWS)
+        cell = PreviewCardDelegate.CARD_SIZE.height() + 2 * self.SPACING
+        return QSize(super().sizeHint().width(), rows * cell + self.SPACING + 2 * self.frameWidth())
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if event.size().width() != event.oldSize().width():
+            self.updateGeometry()
+
+    def set_theme(self, theme: str):
+        self.delegate.set_theme(theme)
+        if theme == "light":
             self.setStyleSheet(
-                """
-                PreviewCard {
-                    background-color: #2a2a2a;
-                    border: 2px solid #2374e1;
-                    border-radius: 8px;
-                    padding: 8px;
-                }
-                """
+                "QListView { border: 1px solid #cbd5e1; border-radius: 4px; background-color: #ffffff; }"
             )
-            self.thumbnail.setStyleSheet(
-                "border: 1px solid #555; border-radius: 4px; background-color: #1a1a1a;"
+        else:
+            self.setStyleSheet(
+                "QListView { border: 1px solid #444; border-radius: 4px; background-color: #1a1a1a; }"
             )
-            self.info_label.setStyleSheet("color: #aaa;")
+        self.viewport().update()
 
 
 class AnimatedButton(QPushButton):
@@ -478,6 +570,220 @@ class URLInputFrame(QWidget):
             self.quality_combo.setCurrentText(current)
 
 
+class DownloadTableModel(QAbstractTableModel):
+    """Download rows keyed by task id.
+
+    Each row holds the display strings of one task plus its progress and speed
+    samples; an id-to-row index makes updates O(1), and an update only signals
+    the cells whose value changed.
+    """
+
+    COLUMNS = ("File", "Status", "Size", "Speed", "ETA", "Progress")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # [task_id, file, status, size, speed, eta, progress text, progress, speed samples]
+        self._rows = []
+        self._index = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()][index.column() + 1]
+        if role == Qt.ItemDataRole.TextAlignmentRole and index.column() > 0:
+            return int(Qt.AlignmentFlag.AlignCenter)
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()][0]
+        if role == PROGRESS_ROLE:
+            return self._rows[index.row()][7]
+        if role == SPEED_SAMPLES_ROLE:
+            return self._rows[index.row()][8]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal:
+            return super().headerData(section, orientation, role)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return int(Qt.AlignmentFlag.AlignCenter)
+        return None
+
+    def add_task(self, task_id, filename):
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append([task_id, filename, "Queued", "Unknown", "0 B/s", "--:--", "0%", 0.0, ()])
+        self._index[task_id] = row
+        self.endInsertRows()
+
+    def update_task(self, task_id, status, size, speed, eta, progress, samples=None) -> bool:
+        """Set a task's cells; returns False if the task has no row"""
+        row = self._index.get(task_id)
+        if row is None:
+            return False
+        changed = self._apply(row, status, size, speed, eta, progress, samples)
+        if changed:
+            self.dataChanged.emit(
+                self.index(row, changed[0]), self.index(row, changed[-1]),
+                [Qt.ItemDataRole.DisplayRole]
+            )
+        return True
+
+    def update_tasks(self, updates):
+        """Apply (task_id, status, size, speed, eta, progress[, samples]) tuples with a single dataChanged"""
+        first = last = None
+        for task_id, *values in updates:
+            row = self._index.get(task_id)
+            if row is None or not self._apply(row, *values):
+                continue
+            first = row if first is None else min(first, row)
+            last = row if last is None else max(last, row)
+        if first is not None:
+            self.dataChanged.emit(
+                self.index(first, 1), self.index(last, len(self.COLUMNS) - 1),
+                [Qt.ItemDataRole.DisplayRole]
+            )
+
+    def _apply(self, row, status, size, speed, eta, progress, samples=None) -> list:
+        """Store a row's values; returns the columns whose value changed"""
+        values = self._rows[row]
+        changed = set()
+        for column, value in enumerate((status, size, speed, eta, f"{progress:.1f}%"), start=2):
+            if values[column] != value:
+                values[column] = value
+                changed.add(column - 1)
+        values[7] = progress
+        if samples is not None:
+            samples = tuple(samples)
+            if values[8] != samples:
+                values[8] = samples
+                changed.add(SPEED_COLUMN)
+        return sorted(changed)
+
+    def remove_task(self, task_id) -> bool:
+        row = self._index.get(task_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        del self._index[task_id]
+        for later in range(row, len(self._rows)):
+            self._index[self._rows[later][0]] = later
+        self.endRemoveRows()
+        return True
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows = []
+        self._index = {}
+        self.endResetModel()
+
+    def task_id(self, row):
+        return self._rows[row][0] if 0 <= row < len(self._rows) else None
+
+    def row_of(self, task_id) -> int:
+        return self._index.get(task_id, -1)
+
+
+class DownloadItemDelegate(QStyledItemDelegate):
+    """Paints status dots, speed sparklines and progress bars from model data.
+
+    Progress bars ease toward the model value; `shown` holds what is drawn for
+    each task that has been painted, so rows never scrolled into view cost nothing.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.shown = {}
+
+    def paint(self, painter, option, index):
+        column = index.column()
+        if column not in (STATUS_COLUMN, SPEED_COLUMN, PROGRESS_COLUMN):
+            super().paint(painter, option, index)
+            return
+        # Background, selection and focus from the style, text drawn below
+        item = QStyleOptionViewItem(option)
+        self.initStyleOption(item, index)
+        item.text = ""
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_ItemViewItem, item, painter, option.widget)
+
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        text_color = option.palette.color(
+            QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        )
+        rect = QRectF(option.rect).adjusted(4, 3, -4, -3)
+        status = index.siblingAtColumn(STATUS_COLUMN).data()
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if column == STATUS_COLUMN:
+            self._paint_status(painter, rect, status, text_color)
+        elif column == SPEED_COLUMN:
+            self._paint_speed(painter, rect, index, text_color)
+        else:
+            self._paint_progress(painter, rect, index, status, text_color)
+        painter.restore()
+
+    def _paint_status(self, painter, rect, status, text_color):
+        size = min(8.0, rect.height())
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(STATUS_COLORS.get(status, BTN)))
+        painter.drawEllipse(QRectF(rect.left() + 2, rect.center().y() - size / 2, size, size))
+        painter.setPen(text_color)
+        painter.drawText(rect.adjusted(size + 8, 0, 0, 0), Qt.AlignmentFlag.AlignVCenter, status or "")
+
+    def _paint_speed(self, painter, rect, index, text_color):
+        samples = index.data(SPEED_SAMPLES_ROLE) or ()
+        if len(samples) > 1 and max(samples) > 0:
+            peak = max(samples)
+            step = rect.width() / (len(samples) - 1)
+            line = QPolygonF([
+                QPointF(rect.left() + i * step, rect.bottom() - rect.height() * value / peak)
+                for i, value in enumerate(samples)
+            ])
+            color = QColor(BTN)
+            color.setAlpha(150)
+            painter.setPen(QPen(color, 1.5))
+            painter.drawPolyline(line)
+        painter.setPen(text_color)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, index.data() or "")
+
+    def _paint_progress(self, painter, rect, index, status, text_color):
+        target = index.data(PROGRESS_ROLE) or 0.0
+        task_id = index.data(Qt.ItemDataRole.UserRole)
+        # First paint (e.g. scrolled into view) shows the current value without animating
+        value = self.shown.setdefault(task_id, target)
+        value = max(0.0, min(100.0, value))
+        track = QColor(text_color)
+        track.setAlpha(40)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(track)
+        painter.drawRoundedRect(rect, 3, 3)
+        if value > 0:
+            painter.setBrush(QColor(STATUS_COLORS.get(status, BTN)))
+            painter.drawRoundedRect(QRectF(rect.left(), rect.top(), rect.width() * value / 100, rect.height()), 3, 3)
+        painter.setPen(text_color)
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, f"{target:.1f}%")
+
+    def advance(self, task_id, target) -> bool:
+        """Move a painted bar one frame toward `target`; returns True while it is still moving"""
+        value = self.shown.get(task_id)
+        if value is None:
+            return False
+        if abs(target - value) < 0.1:
+            self.shown[task_id] = target
+            return value != target
+        self.shown[task_id] = value + (target - value) * PROGRESS_EASING
+        return True
+
+
 class DownloadTableFrame(QWidget):
     """Download progress table"""
     
@@ -490,157 +796,383 @@ class DownloadTableFrame(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            "File", "Status", "Size", "Speed", "ETA", "Progress"
-        ])
+        self.model = DownloadTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
         
-        # Center align all headers
         header = self.table.horizontalHeader()
-        for i in range(6):
-            item = self.table.horizontalHeaderItem(i)
-            if item:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        
         header.setStretchLastSection(True)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)  # File column stretches
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.table.setAlternatingRowColors(True)
         self.table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.delegate = DownloadItemDelegate(self.table)
+        self.table.setItemDelegate(self.delegate)
         layout.addWidget(self.table)
+
+        # Animates visible progress bars at the display rate; stops when nothing moves
+        self._frame_timer = QTimer(self)
+        self._frame_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._frame_timer.timeout.connect(self._advance_frame)
+        self.model.dataChanged.connect(self._start_frames)
     
     def add_download(self, task_id, filename):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(filename))
-        self.table.setItem(row, 1, QTableWidgetItem("Queued"))
-        self.table.setItem(row, 2, QTableWidgetItem("Unknown"))
-        self.table.setItem(row, 3, QTableWidgetItem("0 B/s"))
-        self.table.setItem(row, 4, QTableWidgetItem("--:--"))
-        self.table.setItem(row, 5, QTableWidgetItem("0%"))
-        # Store task_id in first column
-        self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, task_id)
+        self.model.add_task(task_id, filename)
     
-    def update_download(self, task_id, status, size, speed, eta, progress):
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.data(Qt.ItemDataRole.UserRole) == task_id:
-                # Reuse existing items instead of creating new ones
-                status_item = self.table.item(row, 1)
-                if not status_item:
-                    status_item = QTableWidgetItem()
-                    status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(row, 1, status_item)
-                status_item.setText(status)
-                
-                size_item = self.table.item(row, 2)
-                if not size_item:
-                    size_item = QTableWidgetItem()
-                    size_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(row, 2, size_item)
-                size_item.setText(size)
-                
-                speed_item = self.table.item(row, 3)
-                if not speed_item:
-                    speed_item = QTableWidgetItem()
-                    speed_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(row, 3, speed_item)
-                speed_item.setText(speed)
-                
-                eta_item = self.table.item(row, 4)
-                if not eta_item:
-                    eta_item = QTableWidgetItem()
-                    eta_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(row, 4, eta_item)
-                eta_item.setText(eta)
-                
-                progress_item = self.table.item(row, 5)
-                if not progress_item:
-                    progress_item = QTableWidgetItem()
-                    progress_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    self.table.setItem(row, 5, progress_item)
-                progress_item.setText(f"{progress:.1f}%")
-                break
+    def update_download(self, task_id, status, size, speed, eta, progress, samples=None):
+        self.model.update_task(task_id, status, size, speed, eta, progress, samples)
+
+    def update_downloads(self, updates):
+        """Update many rows as one model change"""
+        self.model.update_tasks(updates)
     
     def remove_download(self, task_id):
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.data(Qt.ItemDataRole.UserRole) == task_id:
-                self.table.removeRow(row)
-                break
+        self.model.remove_task(task_id)
+        self.delegate.shown.pop(task_id, None)
     
     def clear_all(self):
-        self.table.setRowCount(0)
+        self.model.clear()
+        self.delegate.shown.clear()
+
+    def frame_interval_ms(self) -> int:
+        """Milliseconds per frame of the screen showing the table"""
+        screen = self.screen() or QApplication.primaryScreen()
+        rate = screen.refreshRate() if screen else 60.0
+        return max(4, round(1000 / (rate if rate > 0 else 60.0)))
+
+    def visible_rows(self) -> range:
+        """Rows currently inside the viewport"""
+        count = self.model.rowCount()
+        if not count or not self.table.isVisible():
+            return range(0)
+        first = self.table.rowAt(0)
+        last = self.table.rowAt(self.table.viewport().height() - 1)
+        return range(max(first, 0), (count - 1 if last < 0 else last) + 1)
+
+    def _start_frames(self, *args):
+        if not self._frame_timer.isActive():
+            self._frame_timer.start(self.frame_interval_ms())
+
+    def _advance_frame(self):
+        """Step visible progress bars toward their values and repaint only those cells"""
+        moving = False
+        viewport = self.table.viewport()
+        for row in self.visible_rows():
+            index = self.model.index(row, PROGRESS_COLUMN)
+            if self.delegate.advance(index.data(Qt.ItemDataRole.UserRole), index.data(PROGRESS_ROLE)):
+                moving = True
+                viewport.update(self.table.visualRect(index))
+        if not moving:
+            self._frame_timer.stop()
+
+    def row_count(self) -> int:
+        return self.model.rowCount()
+
+    def selected_task_id(self):
+        rows = self.table.selectionModel().selectedRows()
+        return self.model.task_id(rows[0].row()) if rows else None
+
+    def select_task(self, task_id):
+        row = self.model.row_of(task_id)
+        if row >= 0:
+            self.table.selectRow(row)
+
+
+class HistoryModel(QAbstractTableModel):
+    """History rows read from a HistoryStore one page at a time.
+
+    The view asks for more rows (canFetchMore/fetchMore) as it scrolls, so
+    only the pages scrolled past are ever in memory; new entries are inserted
+    at the top without reloading the rows already shown.
+    """
+
+    COLUMNS = ("File", "Location", "Format", "Status", "URL")
+    KEYS = ("file", "location", "format", "status", "url")
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.query = ""
+        self.status = ""
+        self._rows = []
+        self._exhausted = True
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._rows[index.row()].get(self.KEYS[index.column()], "")
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == 0:
+            return self._rows[index.row()].get("title") or None
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[index.row()]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal:
+            return super().headerData(section, orientation, role)
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.COLUMNS[section]
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return int(Qt.AlignmentFlag.AlignCenter)
+        return None
+
+    def set_filter(self, query="", status=""):
+        """Show the first page of entries matching a search and status"""
+        self.beginResetModel()
+        self.query = query.strip()
+        self.status = status
+        self._rows = self._page()
+        self._exhausted = len(self._rows) < HISTORY_PAGE_SIZE
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or self._exhausted or not self._rows:
+            return
+        rows = self._page(before_id=self._rows[-1]["id"])
+        self._exhausted = len(rows) < HISTORY_PAGE_SIZE
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+    def insert_new(self) -> int:
+        """Insert matching entries added since the newest row shown; returns how many"""
+        if not self._rows:
+            self.set_filter(self.query, self.status)
+            return len(self._rows)
+        rows = self._page(after_id=self._rows[0]["id"])
+        if len(rows) >= HISTORY_PAGE_SIZE:
+            # Too far behind to splice in; start over from the newest page
+            self.set_filter(self.query, self.status)
+            return len(self._rows)
+        if rows:
+            self.beginInsertRows(QModelIndex(), 0, len(rows) - 1)
+            self._rows[:0] = rows
+            self.endInsertRows()
+        return len(rows)
+
+    def entry(self, row):
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def _page(self, **keyset):
+        try:
+            return self.store.page(self.query, self.status, limit=HISTORY_PAGE_SIZE, **keyset)
+        except Exception as e:
+            print(f"History query failed: {e}")
+            return []
 
 
 class HistoryFrame(QWidget):
-    """Download history view"""
+    """Download history view with search and a status filter"""
+
+    # Emitted when rows are added or the filter changes
+    rows_changed = Signal()
+
+    SEARCH_DELAY_MS = 150
     
-    def __init__(self, parent=None):
+    def __init__(self, store=None, parent=None):
         super().__init__(parent)
+        self.store = store if store is not None else HistoryStore(":memory:")
+        self.model = HistoryModel(self.store, self)
         self.setup_ui()
+        self.model.set_filter()
     
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
+
+        filter_layout = QHBoxLayout()
+        self.search = QLineEdit()
+        self.search.setPlaceholderText("Search title, URL, uploader or file...")
+        self.status_filter = QComboBox()
+        self.status_filter.addItem("All statuses", "")
+        for status in ("Completed", "Failed", "Cancelled"):
+            self.status_filter.addItem(status, status)
+        filter_layout.addWidget(self.search, 1)
+        filter_layout.addWidget(self.status_filter)
+        layout.addLayout(filter_layout)
+
+        # Typing restarts the timer, so a query runs once the user pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self.apply_filter)
+        self.search.textChanged.connect(self._search_timer.start)
+        self.status_filter.currentIndexChanged.connect(self.apply_filter)
         
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels([
-            "File", "Location", "Format", "Status", "URL"
-        ])
-        
-        # Center align all headers
-        header = self.table.horizontalHeader()
-        for i in range(5):
-            item = self.table.horizontalHeaderItem(i)
-            if item:
-                item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        header.setStretchLastSection(True)
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTableView.SelectionMode.SingleSelection)
         self.table.setAlternatingRowColors(True)
         layout.addWidget(self.table)
+
+    def apply_filter(self):
+        self._search_timer.stop()
+        self.model.set_filter(self.search.text(), self.status_filter.currentData() or "")
+        self.rows_changed.emit()
+
+    def refresh_new(self):
+        """Show entries added to the store since the last refresh"""
+        if self.model.insert_new():
+            self.rows_changed.emit()
     
     def add_history_item(self, file, location, format, status, url):
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        self.table.setItem(row, 0, QTableWidgetItem(file))
-        self.table.setItem(row, 1, QTableWidgetItem(location))
-        self.table.setItem(row, 2, QTableWidgetItem(format))
-        self.table.setItem(row, 3, QTableWidgetItem(status))
-        self.table.setItem(row, 4, QTableWidgetItem(url))
-        # Store data
-        self.table.item(row, 0).setData(Qt.ItemDataRole.UserRole, {
-            "file": file, "location": location, "format": format,
-            "status": status, "url": url
-        })
-    
-    def clear_all(self):
-        self.table.setRowCount(0)
+        self.store.add({"file": file, "location": location, "format": format, "status": status, "url": url})
+        self.refresh_new()
+
+    def has_rows(self) -> bool:
+        return self.model.rowCount() > 0
     
     def get_selected(self):
-        rows = self.table.selectedItems()
+        rows = self.table.selectionModel().selectedRows()
         if rows:
-            return self.table.item(rows[0].row(), 0).data(Qt.ItemDataRole.UserRole)
+            return self.model.entry(rows[0].row())
         return None
 
 
+class CompletionSummaryDialog(QDialog):
+    """Non-modal summary of downloads finished in the last coalescing window.
+
+    Batches arriving while the dialog is open are appended to it, so a long
+    run of completions keeps one dialog with running totals.
+    """
+
+    open_requested = Signal(str)  # file path
+    open_folder_requested = Signal(str)  # folder path
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Downloads Finished")
+        self.setModal(False)
+        self.summary = CompletionSummary()
+        self.setup_ui()
+        self.resize(460, 320)
+        # Closing in any way (button, Esc, title bar) starts the next batch afresh
+        self.finished.connect(lambda *args: self.reset())
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        self.summary_label = QLabel()
+        font = QFont()
+        font.setBold(True)
+        self.summary_label.setFont(font)
+        layout.addWidget(self.summary_label)
+
+        self.list = QListWidget()
+        self.list.itemDoubleClicked.connect(lambda item: self.open_selected())
+        self.list.currentItemChanged.connect(lambda *args: self._update_buttons())
+        layout.addWidget(self.list, 1)
+
+        buttons = QHBoxLayout()
+        self.open_btn = QPushButton("Open")
+        self.open_btn.clicked.connect(self.open_selected)
+        self.folder_btn = QPushButton("Open Folder")
+        self.folder_btn.clicked.connect(self.open_selected_folder)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        buttons.addWidget(self.open_btn)
+        buttons.addWidget(self.folder_btn)
+        buttons.addStretch()
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def add_summary(self, summary: CompletionSummary):
+        # Completed files first; they are the ones worth opening
+        entries = sorted(summary.entries, key=lambda e: e.get("status") != "Completed")
+        for entry in entries:
+            status = entry.get("status", "")
+            mark = "✓" if status == "Completed" else "✗"
+            text = f"{mark} {entry.get('file') or entry.get('url', '')}"
+            if status != "Completed":
+                text += f" ({status.lower()})"
+            item = QListWidgetItem(text)
+            item.setData(Qt.ItemDataRole.UserRole, entry_path(entry))
+            item.setData(Qt.ItemDataRole.UserRole + 1, status)
+            if status != "Completed":
+                item.setForeground(QColor(RED))
+            self.list.addItem(item)
+        self.summary.extend(summary.entries)
+        self.summary_label.setText(self.summary.text())
+        if self.list.currentRow() < 0 and self.list.count():
+            self.list.setCurrentRow(0)
+        self._update_buttons()
+
+    def open_selected(self):
+        item = self.list.currentItem()
+        if item and item.data(Qt.ItemDataRole.UserRole + 1) == "Completed":
+            self.open_requested.emit(item.data(Qt.ItemDataRole.UserRole))
+
+    def open_selected_folder(self):
+        item = self.list.currentItem()
+        if item:
+            self.open_folder_requested.emit(os.path.dirname(item.data(Qt.ItemDataRole.UserRole)))
+
+    def reset(self):
+        self.list.clear()
+        self.summary = CompletionSummary()
+
+    def _update_buttons(self):
+        item = self.list.currentItem()
+        self.open_btn.setEnabled(bool(item) and item.data(Qt.ItemDataRole.UserRole + 1) == "Completed")
+        self.folder_btn.setEnabled(bool(item))
+
+
 class LogsFrame(QWidget):
-    """Logs display"""
+    """Logs display with task, level and text filters.
+
+    Lines live in a LogStore; the view is a plain-text editor capped at
+    VIEW_LINES blocks, so Qt drops the oldest lines itself and a filter change
+    only re-renders the newest matching lines.
+    """
+
+    VIEW_LINES = 5000
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.store = LogStore()
+        self._task_names = {}
         self.setup_ui()
     
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        
-        self.log_text = QTextEdit()
+
+        filter_layout = QHBoxLayout()
+        self.task_filter = QComboBox()
+        self.task_filter.addItem("All tasks", "")
+        self.task_filter.setMinimumWidth(180)
+        self.level_filter = QComboBox()
+        for level in LEVELS:
+            self.level_filter.addItem(level.capitalize() if level != "debug" else "All levels", level)
+        self.text_filter = QLineEdit()
+        self.text_filter.setPlaceholderText("Filter logs...")
+        self.task_filter.currentIndexChanged.connect(self.refresh)
+        self.level_filter.currentIndexChanged.connect(self.refresh)
+        self.text_filter.textChanged.connect(self.refresh)
+        filter_layout.addWidget(self.task_filter)
+        filter_layout.addWidget(self.level_filter)
+        filter_layout.addWidget(self.text_filter, 1)
+        layout.addLayout(filter_layout)
+        
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        self.log_text.setMaximumBlockCount(self.VIEW_LINES)
         self.log_text.setMaximumHeight(150)
         layout.addWidget(self.log_text)
         
@@ -651,27 +1183,75 @@ class LogsFrame(QWidget):
         self.clear_btn.hide()  # Hide initially
     
     def add_log(self, message):
-        self.log_text.append(message.strip())
-        self.log_text.moveCursor(QTextCursor.MoveOperation.End)
+        self.add_log_raw(message.strip() + "\n")
 
-    def add_log_raw(self, message):
-        # Optimize: use single cursor operation
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.insertText(message)
-        
-        # Limit log size to prevent memory bloat (keep last 10000 lines)
-        doc = self.log_text.document()
-        if doc.lineCount() > 10000:
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            cursor.movePosition(QTextCursor.MoveOperation.Down, QTextCursor.MoveMode.KeepAnchor, doc.lineCount() - 10000)
-            cursor.removeSelectedText()
-        
-        # Scroll to end
+    def add_log_raw(self, message, task_id=""):
+        self.add_entries([(message, task_id)])
+
+    def add_entries(self, chunks):
+        """Store (text, task_id) chunks and show the lines matching the current filter"""
+        shown = []
+        for text, task_id in chunks:
+            entries = self.store.append(text, task_id)
+            if task_id and self.task_filter.findData(task_id) < 0:
+                self.task_filter.addItem(self._task_names.get(task_id, task_id[:8]), task_id)
+            shown.extend(entry.text for entry in entries if self._matches(entry))
+        if self.task_filter.count() > 2 * MAX_TASKS:
+            self._prune_tasks()
+        if not shown:
+            return
+        scrollbar = self.log_text.verticalScrollBar()
+        at_end = scrollbar.value() >= scrollbar.maximum() - 2
+        self.log_text.appendPlainText("\n".join(shown[-self.VIEW_LINES:]))
+        if at_end:
+            scrollbar.setValue(scrollbar.maximum())
+
+    def set_task_name(self, task_id, name):
+        """Label used for a task in the filter list"""
+        self._task_names[task_id] = name
+        index = self.task_filter.findData(task_id)
+        if index >= 0:
+            self.task_filter.setItemText(index, name)
+
+    def has_logs(self) -> bool:
+        return len(self.store) > 0
+
+    def refresh(self):
+        """Re-render the newest lines that match the filters"""
+        entries = self.store.lines(
+            self.task_filter.currentData() or None, self.level_filter.currentData() or "debug",
+            self.text_filter.text(), limit=self.VIEW_LINES
+        )
+        self.log_text.setPlainText("\n".join(entry.text for entry in entries))
         self.log_text.moveCursor(QTextCursor.MoveOperation.End)
     
     def clear(self):
+        self.store.clear()
         self.log_text.clear()
+        self.task_filter.blockSignals(True)
+        while self.task_filter.count() > 1:
+            self.task_filter.removeItem(1)
+        self.task_filter.setCurrentIndex(0)
+        self.task_filter.blockSignals(False)
+
+    def _matches(self, entry) -> bool:
+        task_id = self.task_filter.currentData()
+        if task_id and entry.task_id != task_id:
+            return False
+        if not level_at_least(entry.level, self.level_filter.currentData() or "debug"):
+            return False
+        needle = self.text_filter.text().lower()
+        return not needle or needle in entry.text.lower()
+
+    def _prune_tasks(self):
+        """Drop filter entries (and names) of tasks whose buffers the store evicted"""
+        kept = set(self.store.tasks())
+        current = self.task_filter.currentData()
+        for index in range(self.task_filter.count() - 1, 0, -1):
+            task_id = self.task_filter.itemData(index)
+            if task_id not in kept and task_id != current:
+                self.task_filter.removeItem(index)
+                self._task_names.pop(task_id, None)
 
 
 class FileConverterDialog(QWidget):
@@ -0,0 +1,351 @@
+"""Watch folders for dropped URL list files and feed them into the queue.
+
+Each watched folder is an entry in the "watch_folders" setting:
+
+    {"path": "~/incoming/music", "preset": "Music"}
+
+New .txt or .csv files are read line by line and their URLs are passed, in
+batches, to a callback together with the folder's preset from "presets".
+The callback says how many URLs it took; while the download queue is full
+the watcher waits and offers the rest again. Processed files are moved to
+done/ or failed/ inside the watched folder. A file interrupted by stop()
+stays in place with a hidden .offset file, and the next start resumes after
+the URLs already queued.
+On Linux, inotify tells us about new files; elsewhere, or if inotify is
+unavailable, the folders are polled.
+"""
+
+import csv
+import ctypes
+import ctypes.util
+import os
+import select
+import shutil
+import struct
+import sys
+import threading
+import time
+
+WATCH_EXTENSIONS = (".txt", ".csv")
+
+DONE_DIR = "done"
+FAILED_DIR = "failed"
+
+# URLs handed to the callback at once; keeps memory flat for multi-MB lists
+BATCH_SIZE = 200
+
+# Seconds to wait before offering URLs again when the queue had no room
+QUEUE_FULL_WAIT = 1.0
+
+# Seconds between scans when polling, and between safety rescans with inotify
+POLL_INTERVAL = 2.0
+RESCAN_INTERVAL = 30.0
+
+# Polled files must be unchanged for this long before they are read
+SETTLE_SECONDS = 1.0
+
+# Preset keys that change how a download runs rather than where it goes
+PRESET_DOWNLOAD_KEYS = (
+    "quality_choice", "audio_codec", "audio_bitrate", "embed_thumbnail",
+    "embed_metadata", "subtitles", "auto_subtitles", "subtitle_langs"
+)
+
+# inotify constants from <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def preset_overrides(preset: dict) -> dict:
+    """Pick the per-download settings out of a preset"""
+    return {key: preset[key] for key in PRESET_DOWNLOAD_KEYS if key in (preset or {})}
+
+
+def resolve_preset(settings: dict, name: str) -> dict:
+    """Look up a preset by name, falling back to the active preset"""
+    presets = settings.get("presets", {}) or {}
+    if name and name in presets:
+        return dict(presets[name])
+    return dict(presets.get(settings.get("active_preset", ""), {}))
+
+
+def is_list_file(name: str) -> bool:
+    return not name.startswith(".") and name.lower().endswith(WATCH_EXTENSIONS)
+
+
+def iter_urls(path: str):
+    """Yield URLs from a .txt (one per line) or .csv (first http cell per row) file, streaming"""
+    with open(path, "r", encoding="utf-8-sig", errors="replace", newline="") as f:
+        if path.lower().endswith(".csv"):
+            for row in csv.reader(f):
+                for cell in row:
+                    cell = cell.strip()
+                    if cell.startswith("http"):
+                        yield cell
+                        break
+        else:
+            for line in f:
+                line = line.strip()
+                if line.startswith("http"):
+                    yield line
+
+
+def offset_path(path: str) -> str:
+    """Hidden file next to a list file recording how many of its URLs were queued"""
+    return os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.offset")
+
+
+def _read_offset(path: str) -> int:
+    try:
+        with open(offset_path(path), "r", encoding="utf-8") as f:
+            return max(0, int(f.read().strip() or 0))
+    except (OSError, ValueError):
+        return 0
+
+
+def _write_offset(path: str, offset: int):
+    try:
+        with open(offset_path(path), "w", encoding="utf-8") as f:
+            f.write(str(offset))
+    except OSError as e:
+        print(f"Could not record progress for {path}: {e}")
+
+
+def _clear_offset(path: str):
+    try:
+        os.remove(offset_path(path))
+    except OSError:
+        pass
+
+
+def _move_into(path: str, subdir: str) -> str:
+    """Move a processed file into a subfolder next to it, never overwriting"""
+    folder = os.path.join(os.path.dirname(path), subdir)
+    os.makedirs(folder, exist_ok=True)
+    target = os.path.join(folder, os.path.basename(path))
+    if os.path.exists(target):
+        base, ext = os.path.splitext(os.path.basename(path))
+        target = os.path.join(folder, f"{base}-{time.strftime('%Y%m%d-%H%M%S')}{ext}")
+    shutil.move(path, target)
+    return target
+
+
+class _Inotify:
+    """Minimal ctypes binding for inotify"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._libc = libc
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err), path)
+        return wd
+
+    def read(self, timeout: float) -> list:
+        """Wait up to `timeout` seconds and return (wd, mask, name) tuples"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            events.append((wd, mask, name))
+        return events
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class FolderWatcher:
+    """Watches folders in a background thread and streams dropped URL lists.
+
+    `on_urls(urls, folder)` receives batches of at most BATCH_SIZE URLs and the
+    folder entry (with its resolved "preset" dict), and returns how many URLs
+    from the front of the batch it ingested (queued, or skipped as already
+    known); fewer than all means the queue is full. `on_file(path, ok, count)`
+    is called after each file is moved to done/ or failed/.
+    """
+
+    def __init__(self, folders: list, settings: dict, on_urls, on_file=None,
+                 poll_interval: float = POLL_INTERVAL, use_inotify: bool = True):
+        self.folders = []
+        for entry in folders or []:
+            if isinstance(entry, str):
+                entry = {"path": entry}
+            path = os.path.abspath(os.path.expanduser(entry.get("path", "")))
+            if not entry.get("path"):
+                continue
+            self.folders.append({**entry, "path": path, "preset": resolve_preset(settings, entry.get("preset", ""))})
+        self.on_urls = on_urls
+        self.on_file = on_file
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify and sys.platform.startswith("linux")
+        self.backend = "polling"
+        self._inotify = None
+        self._watches = {}
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        for folder in self.folders:
+            os.makedirs(folder["path"], exist_ok=True)
+        if self.use_inotify:
+            try:
+                self._inotify = _Inotify()
+                self._watches = {
+                    self._inotify.add_watch(f["path"], IN_CLOSE_WRITE | IN_MOVED_TO): f
+                    for f in self.folders
+                }
+                self.backend = "inotify"
+            except (OSError, AttributeError):
+                if self._inotify:
+                    self._inotify.close()
+                self._inotify = None
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        """Ask the watcher thread to stop and wait up to `timeout` seconds for it"""
+        self._stopped.set()
+        return self.join(timeout)
+
+    def join(self, timeout: float = None) -> bool:
+        """Wait for the watcher thread; returns whether it has exited"""
+        if self._thread:
+            self._thread.join(timeout)
+            return not self._thread.is_alive()
+        return True
+
+    def _run(self):
+        inotify = self._inotify
+        try:
+            # Pick up anything dropped while we were not running
+            self.scan()
+            if inotify:
+                self._run_inotify(inotify, self._watches)
+            else:
+                while not self._stopped.wait(self.poll_interval):
+                    self.scan()
+        finally:
+            if inotify:
+                inotify.close()
+                self._inotify = None
+
+    def _run_inotify(self, inotify: _Inotify, watches: dict):
+        last_scan = time.monotonic()
+        while not self._stopped.is_set():
+            events = inotify.read(min(self.poll_interval, 1.0))
+            for wd, mask, name in events:
+                if mask & IN_Q_OVERFLOW:
+                    self.scan(settle=False)
+                    continue
+                folder = watches.get(wd)
+                if folder and is_list_file(name):
+                    path = os.path.join(folder["path"], name)
+                    if os.path.isfile(path):
+                        self.process_file(path, folder)
+            if time.monotonic() - last_scan >= RESCAN_INTERVAL:
+                last_scan = time.monotonic()
+                self.scan()
+
+    def scan(self, settle: bool = True):
+        """Process list files in every folder; with `settle`, only ones that stopped changing.
+
+        A file counts as complete once it has not been modified for
+        SETTLE_SECONDS, so writers that do not rename into place are not read
+        half-way.
+        """
+        now = time.time()
+        for folder in self.folders:
+            try:
+                entries = list(os.scandir(folder["path"]))
+            except OSError:
+                continue
+            for entry in entries:
+                if self._stopped.is_set():
+                    return
+                if not entry.is_file() or not is_list_file(entry.name):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                if settle and now - stat.st_mtime < SETTLE_SECONDS:
+                    continue
+                self.process_file(entry.path, folder)
+
+    def process_file(self, path: str, folder: dict) -> bool:
+        """Stream one list file into the callback and move it to done/ or failed/.
+
+        Returns False without moving the file if the watcher is stopped first;
+        the offset file lets the next start skip the URLs already queued.
+        """
+        offset = _read_offset(path)
+        count = offset
+        ok = True
+        batch = []
+        try:
+            for index, url in enumerate(iter_urls(path)):
+                if index < offset:
+                    continue
+                batch.append(url)
+                if len(batch) >= BATCH_SIZE:
+                    count += self._deliver(batch, folder)
+                    batch = []
+                if self._stopped.is_set():
+                    break
+            if batch and not self._stopped.is_set():
+                count += self._deliver(batch, folder)
+            if self._stopped.is_set():
+                # Leave the file in place; the next start resumes after `count`
+                if count > offset:
+                    _write_offset(path, count)
+                return False
+            ok = count > 0
+        except Exception as e:
+            print(f"Watch folder error in {path}: {e}")
+            ok = False
+        try:
+            _move_into(path, DONE_DIR if ok else FAILED_DIR)
+            _clear_offset(path)
+        except OSError as e:
+            print(f"Could not move {path}: {e}")
+        if self.on_file:
+            try:
+                self.on_file(path, ok, count)
+            except Exception:
+                pass
+        return ok
+
+    def _deliver(self, urls: list, folder: dict) -> int:
+        """Offer `urls` until all are ingested or the watcher stops; returns how many were"""
+        delivered = 0
+        while delivered < len(urls):
+            accepted = self.on_urls(urls[delivered:], folder)
+            delivered += max(0, min(int(accepted), len(urls) - delivered))
+            if delivered < len(urls) and self._stopped.wait(QUEUE_FULL_WAIT):
+                break
+        return delivered